@@ -0,0 +1,279 @@
+"""
+Response caches for provider calls.
+Stores LLM responses in SQLite so repeated requests skip the network: an
+exact-match cache keyed by request hash, and an optional semantic cache that
+matches paraphrased prompts by embedding similarity.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from promptheus.constants import DEFAULT_SEMANTIC_CACHE_THRESHOLD, RESPONSE_CACHE_TTL
+from promptheus.history import get_default_history_dir
+from promptheus.utils import sanitize_error_message
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_FILENAME = "response_cache.sqlite3"
+SEMANTIC_CACHE_FILENAME = "semantic_cache.sqlite3"
+SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a cache database shared across threads (callers hold a lock)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Providers are shared across threads by the web and MCP servers, so
+    # the connection is guarded by a lock instead of bound to one thread.
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+def make_cache_key(
+    provider_name: str,
+    model_name: str,
+    system_instruction: str,
+    prompt: str,
+    json_mode: bool,
+    max_tokens: Optional[int],
+) -> str:
+    """Build a deterministic cache key for a provider request."""
+    signature = json.dumps(
+        [provider_name, model_name, system_instruction, prompt, json_mode, max_tokens],
+        sort_keys=True,
+    )
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed exact-match cache of provider responses with a TTL."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = RESPONSE_CACHE_TTL) -> None:
+        self.path = path or (get_default_history_dir() / RESPONSE_CACHE_FILENAME)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value BLOB, created REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if time.time() - created > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response under key, replacing any previous entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, value.encode("utf-8"), time.time()),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _normalize(vector: Sequence[float]) -> array:
+    """Return vector scaled to unit length as a float32 array."""
+    norm = math.sqrt(math.fsum(x * x for x in vector)) or 1.0
+    return array("f", (x / norm for x in vector))
+
+
+class SemanticCache:
+    """
+    SQLite-backed cache matching prompts by embedding cosine similarity.
+
+    Entries are partitioned by namespace (provider, model, call kind) and
+    searched linearly; interactive sessions produce at most a few thousand
+    entries, which keeps a full scan cheap without an ANN index.
+    """
+
+    def __init__(
+        self,
+        embed: Embedder,
+        path: Optional[Path] = None,
+        threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = RESPONSE_CACHE_TTL,
+    ) -> None:
+        self.embed = embed
+        self.path = path or (get_default_history_dir() / SEMANTIC_CACHE_FILENAME)
+        self.threshold = threshold
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(namespace TEXT, embedding BLOB, value BLOB, created REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_namespace ON entries (namespace)"
+        )
+        self._conn.commit()
+
+    def lookup(
+        self, namespace: str, text: str, threshold: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Return the closest cached response above the threshold, if any.
+
+        threshold overrides the cache's default for this lookup only, so
+        callers with different similarity settings can share one cache.
+        """
+        query = _normalize(self.embed(text))
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT embedding, value FROM entries WHERE namespace = ? AND created >= ?",
+                (namespace, cutoff),
+            ).fetchall()
+
+        best_score = self.threshold if threshold is None else threshold
+        best_value: Optional[bytes] = None
+        for blob, value in rows:
+            candidate = array("f")
+            candidate.frombytes(blob)
+            if len(candidate) != len(query):
+                continue
+            score = math.fsum(a * b for a, b in zip(query, candidate))
+            if score >= best_score:
+                best_score = score
+                best_value = value
+        if best_value is None:
+            return None
+        return best_value.decode("utf-8") if isinstance(best_value, bytes) else best_value
+
+    def insert(self, namespace: str, text: str, value: str) -> None:
+        """Store a response for text under namespace."""
+        embedding = _normalize(self.embed(text)).tobytes()
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM entries WHERE created < ?", (now - self.ttl,)
+            )
+            self._conn.execute(
+                "INSERT INTO entries (namespace, embedding, value, created) VALUES (?, ?, ?, ?)",
+                (namespace, embedding, value.encode("utf-8"), now),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _load_default_embedder() -> Optional[Embedder]:
+    """Load the local sentence-transformers model, or None if not installed."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+
+    model = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+
+    def embed(text: str) -> Sequence[float]:
+        return model.encode(text).tolist()
+
+    return embed
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_unavailable = False
+_response_cache_lock = threading.Lock()
+_semantic_cache: Optional[SemanticCache] = None
+_semantic_cache_unavailable = False
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the shared response cache, or None if it cannot be opened."""
+    global _response_cache, _response_cache_unavailable
+    if _response_cache is None and not _response_cache_unavailable:
+        with _response_cache_lock:
+            if _response_cache is None and not _response_cache_unavailable:
+                try:
+                    _response_cache = ResponseCache()
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning(
+                        "Response cache unavailable: %s", sanitize_error_message(str(exc))
+                    )
+                    _response_cache_unavailable = True
+                    return None
+    return _response_cache
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Return the shared semantic cache, or None if sentence-transformers is missing.
+
+    Callers pass their own similarity threshold to SemanticCache.lookup().
+    """
+    global _semantic_cache, _semantic_cache_unavailable
+    if _semantic_cache is None and not _semantic_cache_unavailable:
+        with _response_cache_lock:
+            if _semantic_cache is None and not _semantic_cache_unavailable:
+                try:
+                    embed = _load_default_embedder()
+                    if embed is None:
+                        logger.warning(
+                            "Semantic cache requires sentence-transformers; "
+                            "install it to enable paraphrase matching"
+                        )
+                        _semantic_cache_unavailable = True
+                        return None
+                    _semantic_cache = SemanticCache(embed)
+                except Exception as exc:
+                    logger.warning(
+                        "Semantic cache unavailable: %s", sanitize_error_message(str(exc))
+                    )
+                    _semantic_cache_unavailable = True
+                    return None
+    return _semantic_cache
+
+
+__all__ = [
+    "ResponseCache",
+    "SemanticCache",
+    "get_response_cache",
+    "get_semantic_cache",
+    "make_cache_key",
+]
@@ -79,6 +79,12 @@ Interactive Mode Commands (available when running without arguments):
         action="store_true",
         help="Force clarifying questions even for analysis tasks",
     )
+    behavior_group.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Reuse cached provider responses for identical requests (default: off)",
+    )
 
     # Output handling arguments
     output_group = parser.add_argument_group("Output Handling")
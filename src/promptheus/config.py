@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 
+from promptheus.constants import DEFAULT_SEMANTIC_CACHE_THRESHOLD
 from promptheus.utils import sanitize_error_message
 
 logger = logging.getLogger(__name__)
@@ -82,6 +83,7 @@ class Config:
         self._status_messages: List[str] = []
         self._error_messages: List[str] = []
         self._provider_config: Optional[Dict[str, Any]] = None
+        self._response_cache_override: Optional[bool] = None
 
     def load_provider_config(self) -> Dict[str, Any]:
         """Load the provider configuration from the JSON file."""
@@ -110,6 +112,7 @@ class Config:
         self._status_messages.clear()
         self._error_messages.clear()
         self._provider_config = None
+        self._response_cache_override = None
 
     # ------------------------------------------------------------------ #
     # Message helpers
@@ -431,6 +434,71 @@ class Config:
         is_interactive = sys.stdin.isatty()
         return is_interactive
 
+    # ------------------------------------------------------------------ #
+    # Response cache configuration
+    # ------------------------------------------------------------------ #
+    def set_response_cache(self, enabled: bool) -> None:
+        """Explicitly enable or disable the provider response cache (--cache/--no-cache)."""
+        self._response_cache_override = enabled
+
+    @property
+    def response_cache_enabled(self) -> bool:
+        """
+        Determine if provider responses should be served from the local cache.
+
+        An explicit --cache/--no-cache flag takes precedence, then the
+        PROMPTHEUS_RESPONSE_CACHE environment variable. Disabled by default so
+        repeated refinements still reach the model unless the user opts in.
+        """
+        if self._response_cache_override is not None:
+            return self._response_cache_override
+
+        explicit_setting = os.getenv("PROMPTHEUS_RESPONSE_CACHE")
+        if explicit_setting is not None:
+            return explicit_setting.lower() in ("1", "true", "yes", "on")
+        return False
+
+    @property
+    def semantic_cache_enabled(self) -> bool:
+        """
+        Determine if paraphrased prompts may be answered from the semantic cache.
+
+        Opt-in via PROMPTHEUS_SEMANTIC_CACHE; requires sentence-transformers.
+        """
+        explicit_setting = os.getenv("PROMPTHEUS_SEMANTIC_CACHE")
+        if explicit_setting is None:
+            return False
+        return explicit_setting.lower() in ("1", "true", "yes", "on")
+
+    @property
+    def semantic_cache_threshold(self) -> float:
+        """Cosine similarity required for a semantic cache hit."""
+        raw_value = os.getenv("PROMPTHEUS_SEMANTIC_CACHE_THRESHOLD")
+        if raw_value:
+            try:
+                value = float(raw_value)
+            except ValueError:
+                logger.warning("Ignoring invalid PROMPTHEUS_SEMANTIC_CACHE_THRESHOLD: %s", raw_value)
+            else:
+                if 0.0 < value <= 1.0:
+                    return value
+                logger.warning("PROMPTHEUS_SEMANTIC_CACHE_THRESHOLD must be in (0, 1]; using default")
+        return DEFAULT_SEMANTIC_CACHE_THRESHOLD
+
+    @property
+    def question_prefetch_enabled(self) -> bool:
+        """
+        Determine if the REPL may request clarifying questions for a draft
+        while the user pauses typing.
+
+        Opt-in via PROMPTHEUS_PREFETCH_QUESTIONS, since drafts that are never
+        submitted still spend provider tokens.
+        """
+        explicit_setting = os.getenv("PROMPTHEUS_PREFETCH_QUESTIONS")
+        if explicit_setting is None:
+            return False
+        return explicit_setting.lower() in ("1", "true", "yes", "on")
+
 
 # Global config instance
 config = Config()
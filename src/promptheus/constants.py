@@ -14,4 +14,7 @@ DEFAULT_TWEAK_MAX_TOKENS = 2000
 
 MIN_REFINEMENT_OUTPUT_TOKENS = 4096  # models below this cannot produce refinement output
 
+RESPONSE_CACHE_TTL = 7 * 86400  # seconds -- cached provider responses expire after a week
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.92  # cosine similarity needed for a paraphrase cache hit
+
 PROMPTHEUS_DEBUG_ENV = "PROMPTHEUS_DEBUG"
@@ -7,6 +7,7 @@ import json
 import logging
 import os
 import sys
+import threading
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -86,6 +87,14 @@ class PromptHistory:
         self.prompt_history_file = self.history_dir / "prompt_history.txt"
         self.config = config
 
+        # Entries parsed so far, with the byte offset they end at and the bytes
+        # just before it, so later loads only parse lines appended since
+        self._loaded: List[HistoryEntry] = []
+        self._loaded_offset = 0
+        self._loaded_tail = b""
+        self._loaded_lines = 0
+        self._load_lock = threading.Lock()
+
         # Create directory if it doesn't exist
         self._ensure_directory()
 
@@ -161,25 +170,50 @@ class PromptHistory:
         except Exception as exc:
             logger.error("Failed to save history entry: %s", sanitize_error_message(str(exc)))
 
+    def _reset_loaded(self) -> None:
+        """Forget parsed entries so the next load re-reads the whole file."""
+        self._loaded = []
+        self._loaded_offset = 0
+        self._loaded_tail = b""
+        self._loaded_lines = 0
+
+    def _parse_lines(self, data: bytes, first_line_num: int) -> List[HistoryEntry]:
+        entries = []
+        for line_num, line in enumerate(data.splitlines(), first_line_num):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry_data = json.loads(line)
+                entries.append(HistoryEntry.from_dict(entry_data))
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                logger.warning(f"Failed to parse history line {line_num}: {exc}")
+                continue
+        return entries
+
     def _load_history(self) -> List[HistoryEntry]:
-        """Load history from JSONL file."""
-        if not self.history_file.exists():
-            return []
+        """
+        Load history from JSONL file.
+
+        The file is append-only in normal use, so only lines added since the
+        previous load are parsed. If the bytes before the remembered offset
+        changed (the file was rewritten or replaced), everything is re-read.
+        """
+        with self._load_lock:
+            return self._load_new_lines()
 
+    def _load_new_lines(self) -> List[HistoryEntry]:
         try:
-            history = []
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry_data = json.loads(line)
-                        history.append(HistoryEntry.from_dict(entry_data))
-                    except json.JSONDecodeError as exc:
-                        logger.warning(f"Failed to parse history line {line_num}: {exc}")
-                        continue
-            return history
+            with open(self.history_file, 'rb') as f:
+                if self._loaded_offset:
+                    f.seek(self._loaded_offset - len(self._loaded_tail))
+                    if f.read(len(self._loaded_tail)) != self._loaded_tail:
+                        self._reset_loaded()
+                f.seek(self._loaded_offset)
+                data = f.read()
+        except FileNotFoundError:
+            self._reset_loaded()
+            return []
         except OSError as exc:
             logger.error(
                 "Failed to read history file (%s): %s",
@@ -188,6 +222,18 @@ class PromptHistory:
             )
             return []
 
+        # Only complete lines are kept; a final line without a newline is
+        # parsed for this call but read again next time
+        end = data.rfind(b"\n") + 1
+        if end:
+            complete = data[:end]
+            self._loaded.extend(self._parse_lines(complete, self._loaded_lines + 1))
+            self._loaded_lines += complete.count(b"\n")
+            self._loaded_offset += end
+            self._loaded_tail = (self._loaded_tail + complete)[-64:]
+        trailing = self._parse_lines(data[end:], self._loaded_lines + 1) if end < len(data) else []
+        return self._loaded + trailing
+
     def _append_to_prompt_history(self, prompt: str) -> None:
         """Append a prompt to the prompt history file for arrow key navigation."""
         # Check if history is enabled
@@ -221,6 +267,23 @@ class PromptHistory:
         history = self._load_history()
         return list(reversed(history[-limit:]))
 
+    def get_recent_previews(self, limit: int = 20, width: int = 50) -> List[Tuple[str, str]]:
+        """
+        Get (index, preview) pairs for recent entries, e.g. for /load completion.
+
+        Args:
+            limit: Maximum number of entries to return
+            width: Characters of the original prompt kept before "..."
+
+        Returns:
+            List of (1-based index string, truncated original prompt), most recent first
+        """
+        previews = []
+        for idx, entry in enumerate(self.get_recent(limit), 1):
+            prompt = entry.original_prompt
+            previews.append((str(idx), prompt[:width] + "..." if len(prompt) > width else prompt))
+        return previews
+
     def get_all(self) -> List[HistoryEntry]:
         """Get all history entries, most recent first."""
         history = self._load_history()
@@ -252,11 +315,6 @@ class PromptHistory:
         paginated_entries = all_entries[offset:offset+limit]
         return paginated_entries, total_count
 
-    def get_all(self) -> List[HistoryEntry]:
-        """Get all history entries, most recent first."""
-        history = self._load_history()
-        return list(reversed(history))
-
     def get_by_index(self, index: int) -> Optional[HistoryEntry]:
         """
         Get a history entry by index (1-based, from most recent).
@@ -323,6 +381,8 @@ class PromptHistory:
                 return False  # Entry not found
 
             # Rewrite the file without the deleted entry
+            with self._load_lock:
+                self._reset_loaded()
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 for entry in filtered_entries:
                     json.dump(entry.to_dict(), f)
@@ -340,6 +400,8 @@ class PromptHistory:
 
     def clear(self) -> None:
         """Clear all history."""
+        with self._load_lock:
+            self._reset_loaded()
         try:
             if self.history_file.exists():
                 self.history_file.unlink()
@@ -365,6 +427,10 @@ def get_history(config=None) -> PromptHistory:
     """
     Get the global history instance.
 
+    The instance is kept while the history directory stays the same, so
+    callers that pass a fresh config on every request (web routers, the
+    REPL) share its parsed entries instead of reloading the file.
+
     Args:
         config: Optional configuration object to check history settings
 
@@ -372,6 +438,12 @@ def get_history(config=None) -> PromptHistory:
         PromptHistory instance with config applied if provided
     """
     global _history_instance
-    if _history_instance is None or config is not None:
-        _history_instance = PromptHistory(config=config)
+    if _history_instance is not None and config is None:
+        return _history_instance
+
+    history_dir = get_default_history_dir()
+    if _history_instance is None or _history_instance.history_dir != history_dir:
+        _history_instance = PromptHistory(history_dir=history_dir, config=config)
+    else:
+        _history_instance.config = config
     return _history_instance
@@ -6,6 +6,7 @@ Unified version with multi-provider support.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import sys
@@ -13,11 +14,12 @@ import time
 import uuid
 from argparse import Namespace
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import questionary
 import pyperclip
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
@@ -27,6 +29,7 @@ from promptheus.history import get_history
 from promptheus.io_context import IOContext
 from promptheus.question_prompter import create_prompter
 from promptheus.telemetry import (
+    is_enabled as telemetry_enabled,
     record_prompt_run_event,
     record_clarifying_questions_summary,
     record_provider_error,
@@ -37,7 +40,7 @@ from promptheus.prompts import (
     GENERATION_SYSTEM_INSTRUCTION,
     TWEAK_SYSTEM_INSTRUCTION,
 )
-from promptheus.providers import LLMProvider, get_provider
+from promptheus.providers import LLMProvider, TokenUsage, call_with_token_usage, get_provider
 from promptheus.utils import configure_logging, sanitize_error_message
 from promptheus.cli import parse_arguments
 from promptheus.repl import display_history, interactive_mode
@@ -59,6 +62,15 @@ def measure_time():
 MessageSink = Callable[[str], None]
 
 
+@dataclass
+class PrefetchedRefinement:
+    """Light refinement produced in parallel with question analysis."""
+    text: str
+    token_usage: TokenUsage
+    started_at: float
+    finished_at: float
+
+
 @dataclass
 class QuestionPlan:
     skip_questions: bool
@@ -66,6 +78,7 @@ class QuestionPlan:
     questions: List[Dict[str, Any]]
     mapping: Dict[str, str]
     use_light_refinement: bool = False
+    prefetched_refinement: Optional[PrefetchedRefinement] = None
 
 
 def convert_json_to_question_definitions(
@@ -125,6 +138,30 @@ def display_output(
     io.console_err.print()
 
 
+def _should_stream(provider: LLMProvider, io: IOContext) -> bool:
+    """Stream refinements live only when the provider can and stderr is a terminal."""
+    return (
+        getattr(provider, "supports_streaming", False) is True
+        and not io.quiet_output
+        and io.console_err.is_terminal is True
+    )
+
+
+def render_stream(chunks: Iterable[str], io: IOContext) -> str:
+    """
+    Render streamed text in a live panel on stderr and return the full text.
+
+    The live view is transient; display_output prints the final panel.
+    """
+    text = Text()
+    panel = Panel(text, title="[bold green]Refined Prompt[/bold green]", border_style="green", padding=(1, 2))
+    with Live(panel, console=io.console_err, refresh_per_second=20, transient=True) as live:
+        for chunk in chunks:
+            text.append(chunk)
+            live.refresh()
+    return text.plain
+
+
 def copy_to_clipboard(text: str, notify: Optional[MessageSink] = None) -> None:
     """Copy text to clipboard."""
     if notify is None:
@@ -236,6 +273,55 @@ def iterative_refinement(
             logger.exception("Prompt tweak failed")
 
 
+def _should_speculate_light_refinement(args: Namespace, io: IOContext) -> bool:
+    """
+    Speculative light refinement pays off only when questions are unlikely to be
+    asked: without an interactive stdin nearly every plan ends in light refinement.
+    """
+    return io.is_non_interactive and not getattr(args, "refine", False)
+
+
+def _prefetch_light_refinement(provider: LLMProvider, initial_prompt: str) -> PrefetchedRefinement:
+    """Run a light refinement, keeping its own timing and token usage."""
+    started_at = measure_time()
+    text, token_usage = call_with_token_usage(
+        provider.light_refine, initial_prompt, ANALYSIS_REFINEMENT_SYSTEM_INSTRUCTION
+    )
+    return PrefetchedRefinement(text, token_usage, started_at, measure_time())
+
+
+def _fetch_question_analysis(
+    provider: LLMProvider,
+    initial_prompt: str,
+    speculate: bool,
+) -> Tuple[Optional[Dict[str, Any]], Optional[PrefetchedRefinement]]:
+    """
+    Generate clarifying questions, optionally running a light refinement in parallel.
+
+    Returns the question payload and the speculative refinement (None when not
+    requested or when it failed; the light refinement path then retries it).
+    """
+    if not speculate:
+        return provider.generate_questions(initial_prompt, CLARIFICATION_SYSTEM_INSTRUCTION), None
+
+    async def _gather() -> List[Any]:
+        return await asyncio.gather(
+            provider.agenerate_questions(initial_prompt, CLARIFICATION_SYSTEM_INSTRUCTION),
+            # Both calls share the provider's last_*_tokens attributes, so the
+            # refinement captures its usage on its own worker thread instead
+            asyncio.to_thread(_prefetch_light_refinement, provider, initial_prompt),
+            return_exceptions=True,
+        )
+
+    questions_result, refine_result = asyncio.run(_gather())
+    if isinstance(questions_result, BaseException):
+        raise questions_result
+    if isinstance(refine_result, BaseException):
+        logger.debug("Speculative light refinement failed: %s", sanitize_error_message(str(refine_result)))
+        refine_result = None
+    return questions_result, refine_result
+
+
 def determine_question_plan(
     provider: LLMProvider,
     initial_prompt: str,
@@ -251,12 +337,13 @@ def determine_question_plan(
         io.notify("\n[bold blue]✓[/bold blue] Skip questions mode - improving prompt directly\n")
         return QuestionPlan(skip_questions=True, task_type="analysis", questions=[], mapping={})
 
+    speculate = _should_speculate_light_refinement(args, io)
     try:
         if not io.quiet_output:
             with io.console_err.status("[bold magenta]🔍 Analyzing your prompt and crafting questions...", spinner="arc"):
-                result = provider.generate_questions(initial_prompt, CLARIFICATION_SYSTEM_INSTRUCTION)
+                result, prefetched = _fetch_question_analysis(provider, initial_prompt, speculate)
         else:
-            result = provider.generate_questions(initial_prompt, CLARIFICATION_SYSTEM_INSTRUCTION)
+            result, prefetched = _fetch_question_analysis(provider, initial_prompt, speculate)
     except ProviderAPIError as exc:
         current_provider = app_config.provider or ""
         provider_display = current_provider.title() if current_provider else "Provider"
@@ -305,11 +392,19 @@ def determine_question_plan(
     if task_type == "analysis" and not args.refine:
         io.notify("\n[bold blue]✓[/bold blue] Analysis task detected - performing light refinement")
         io.notify("[dim]  (Use --skip-questions to skip, or --refine to force questions)[/dim]\n")
-        return QuestionPlan(True, task_type, [], {})
+        return QuestionPlan(True, task_type, [], {}, prefetched_refinement=prefetched)
 
     if not questions_json:
         io.notify("\n[bold blue]✓[/bold blue] No clarifying questions needed\n")
-        return QuestionPlan(True, task_type, [], {})
+        # A speculative light refinement is already paid for; use it rather than discard it
+        return QuestionPlan(
+            True,
+            task_type,
+            [],
+            {},
+            use_light_refinement=prefetched is not None,
+            prefetched_refinement=prefetched,
+        )
 
     if task_type == "generation" and not args.refine:
         io.notify(
@@ -323,13 +418,19 @@ def determine_question_plan(
             )
         except EOFError:
             io.notify("[yellow]stdin not interactive - skipping questions, using light refinement[/yellow]")
-            return QuestionPlan(True, task_type, [], {}, use_light_refinement=True)
+            return QuestionPlan(
+                True, task_type, [], {}, use_light_refinement=True, prefetched_refinement=prefetched
+            )
         except KeyboardInterrupt:
             io.notify("[yellow]Skipping questions - performing light refinement[/yellow]")
-            return QuestionPlan(True, task_type, [], {}, use_light_refinement=True)
+            return QuestionPlan(
+                True, task_type, [], {}, use_light_refinement=True, prefetched_refinement=prefetched
+            )
         if not confirm:
             io.notify("\n[bold]Skipping questions - performing light refinement\n")
-            return QuestionPlan(True, task_type, [], {}, use_light_refinement=True)
+            return QuestionPlan(
+                True, task_type, [], {}, use_light_refinement=True, prefetched_refinement=prefetched
+            )
 
     questions, mapping = convert_json_to_question_definitions(questions_json)
     if args.refine:
@@ -418,7 +519,14 @@ def generate_final_prompt(
         return initial_prompt, False
 
     try:
-        if not io.quiet_output:
+        if _should_stream(provider, io):
+            final_prompt = render_stream(
+                provider.stream_refine_from_answers(
+                    initial_prompt, answers, mapping, GENERATION_SYSTEM_INSTRUCTION
+                ),
+                io,
+            )
+        elif not io.quiet_output:
             with io.console_err.status("[bold green]🎨 Crafting your refined prompt...", spinner="moon"):
                 final_prompt = provider.refine_from_answers(
                     initial_prompt, answers, mapping, GENERATION_SYSTEM_INSTRUCTION
@@ -460,6 +568,7 @@ def process_single_prompt(
     llm_start_time = None
     llm_end_time = None
     clarifying_questions_count = 0
+    token_usage: Optional[TokenUsage] = None
     success = False
     
     # Safely extract quiet_mode value
@@ -485,7 +594,23 @@ def process_single_prompt(
 
         if is_light_refinement:
             try:
-                if not io.quiet_output:
+                if plan.prefetched_refinement is not None:
+                    # Already produced in parallel with the question analysis
+                    prefetched = plan.prefetched_refinement
+                    final_prompt = prefetched.text
+                    token_usage = prefetched.token_usage
+                    llm_start_time = prefetched.started_at
+                    llm_end_time = prefetched.finished_at
+                elif _should_stream(provider, io):
+                    llm_start_time = measure_time()
+                    final_prompt = render_stream(
+                        provider.stream_light_refine(
+                            initial_prompt, ANALYSIS_REFINEMENT_SYSTEM_INSTRUCTION
+                        ),
+                        io,
+                    )
+                    llm_end_time = measure_time()
+                elif not io.quiet_output:
                     with io.console_err.status("[bold blue]⚡ Performing light refinement...", spinner="simpleDots"):
                         llm_start_time = measure_time()
                         final_prompt = provider.light_refine(
@@ -579,54 +704,59 @@ def process_single_prompt(
     total_run_latency_sec = end_time - start_time
     llm_latency_sec = (llm_end_time - llm_start_time) if llm_start_time and llm_end_time else None
     
-    # Record successful prompt run telemetry
-    try:
-        provider_name = provider.name if hasattr(provider, 'name') else getattr(app_config, 'provider', 'unknown')
-        model_name = app_config.get_model() if hasattr(app_config, 'get_model') else getattr(app_config, 'model', 'unknown')
-        task_type_value = getattr(plan, 'task_type', 'unknown')
-    except (AttributeError, TypeError):
-        provider_name = 'unknown'
-        model_name = 'unknown'
-        task_type_value = 'unknown'
+    # Record successful prompt run telemetry (skip the field lookups when it is off)
+    if telemetry_enabled():
+        try:
+            provider_name = provider.name if hasattr(provider, 'name') else getattr(app_config, 'provider', 'unknown')
+            model_name = app_config.get_model() if hasattr(app_config, 'get_model') else getattr(app_config, 'model', 'unknown')
+            task_type_value = getattr(plan, 'task_type', 'unknown')
+        except (AttributeError, TypeError):
+            provider_name = 'unknown'
+            model_name = 'unknown'
+            task_type_value = 'unknown'
     
-    # Best-effort token usage from the last provider call
-    input_tokens = getattr(provider, "last_input_tokens", None)
-    output_tokens = getattr(provider, "last_output_tokens", None)
-    total_tokens = getattr(provider, "last_total_tokens", None)
-
-    record_prompt_run_event(
-        source="cli",
-        provider=provider_name,
-        model=model_name,
-        task_type=task_type_value,
-        processing_latency_sec=total_run_latency_sec,
-        clarifying_questions_count=clarifying_questions_count,
-        skip_questions=getattr(args, "skip_questions", False),
-        refine_mode=not is_light_refinement,  # True for full refinement, False for light refinement
-        success=True,
-        session_id=SESSION_ID,
-        run_id=run_id,
-        input_chars=len(initial_prompt),
-        output_chars=len(final_prompt),
-        llm_latency_sec=llm_latency_sec,
-        total_run_latency_sec=total_run_latency_sec,
-        quiet_mode=quiet_mode,
-        history_enabled=history_enabled,
-        python_version=sys.version.split()[0],
-        platform=sys.platform,
-        interface="cli",
-        input_tokens=input_tokens,
-        output_tokens=output_tokens,
-        total_tokens=total_tokens,
-    )
+        # Best-effort token usage from the refinement call
+        if token_usage is None:
+            token_usage = (
+                getattr(provider, "last_input_tokens", None),
+                getattr(provider, "last_output_tokens", None),
+                getattr(provider, "last_total_tokens", None),
+            )
+        input_tokens, output_tokens, total_tokens = token_usage
+
+        record_prompt_run_event(
+            source="cli",
+            provider=provider_name,
+            model=model_name,
+            task_type=task_type_value,
+            processing_latency_sec=total_run_latency_sec,
+            clarifying_questions_count=clarifying_questions_count,
+            skip_questions=getattr(args, "skip_questions", False),
+            refine_mode=not is_light_refinement,  # True for full refinement, False for light refinement
+            success=True,
+            session_id=SESSION_ID,
+            run_id=run_id,
+            input_chars=len(initial_prompt),
+            output_chars=len(final_prompt),
+            llm_latency_sec=llm_latency_sec,
+            total_run_latency_sec=total_run_latency_sec,
+            quiet_mode=quiet_mode,
+            history_enabled=history_enabled,
+            python_version=sys.version.split()[0],
+            platform=sys.platform,
+            interface="cli",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=total_tokens,
+        )
     
-    # Record clarifying questions summary (privacy guard handles history_enabled=False)
-    record_clarifying_questions_summary(
-        session_id=SESSION_ID,
-        run_id=run_id,
-        total_questions=clarifying_questions_count,
-        history_enabled=history_enabled,
-    )
+        # Record clarifying questions summary (privacy guard handles history_enabled=False)
+        record_clarifying_questions_summary(
+            session_id=SESSION_ID,
+            run_id=run_id,
+            total_questions=clarifying_questions_count,
+            history_enabled=history_enabled,
+        )
 
     display_output(final_prompt, io, is_refined=is_refined)
 
@@ -793,6 +923,8 @@ def main() -> None:
         app_config.set_provider(args.provider)
     if args.model:
         app_config.set_model(args.model)
+    if getattr(args, "cache", None) is not None:
+        app_config.set_response_cache(args.cache)
 
     for message in app_config.consume_status_messages():
         io.notify(f"[cyan]●[/cyan] {message}")
@@ -25,11 +25,16 @@ Response Format:
 - Error:
     {"type": "error", "error_type": "...", "message": "..."}
 """
+import hashlib
 import logging
 import sys
+import threading
 import time
 import uuid
-from typing import Optional, Dict, Any, List, Union, Tuple
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Union, Tuple
 
 # FastMCP import with graceful fallback
 try:
@@ -133,6 +138,23 @@ def set_ask_user_question(fn: Optional[Any]) -> None:
 
 # Configuration
 MAX_PROMPT_LENGTH = 50000  # characters
+# Ask questions in parallel; only enable for clients that can render
+# overlapping AskUserQuestion prompts (for example, a form-based UI).
+ASK_USER_CONCURRENT = False
+ASK_USER_MAX_WORKERS = 8
+CLARIFICATION_CACHE_SIZE = 256  # remembered question mappings
+CLARIFICATION_CACHE_TTL = 15 * 60  # seconds
+REFINEMENT_CACHE_SIZE = 512  # remembered light refinements
+
+# Question mappings from clarification_needed responses, keyed by prompt hash,
+# so the follow-up call with answers can recover the original question text.
+_clarification_cache: "OrderedDict[str, Tuple[float, QuestionMapping]]" = OrderedDict()
+_clarification_cache_lock = threading.Lock()
+
+# Light refinements for prompts that needed no clarification, keyed by
+# (provider class, model, prompt hash), so repeated identical calls skip the LLM.
+_refinement_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_refinement_cache_lock = threading.Lock()
 
 
 def _ensure_mcp_available():
@@ -168,6 +190,21 @@ def _build_refined_response(refined_prompt: str) -> RefinedResponse:
     }
 
 
+def _build_error_response(error_type: str, message: str) -> ErrorResponse:
+    """
+    Build a standard error response payload.
+
+    Args:
+        error_type: Exception class name or error category
+        message: Sanitized, user-facing error message
+    """
+    return {
+        "type": "error",
+        "error_type": error_type,
+        "message": message,
+    }
+
+
 def _validate_prompt(prompt: str) -> Optional[ErrorResponse]:
     """
     Validate prompt input.
@@ -176,18 +213,13 @@ def _validate_prompt(prompt: str) -> Optional[ErrorResponse]:
         ErrorResponse if invalid, None if valid
     """
     if not prompt or not prompt.strip():
-        return {
-            "type": "error",
-            "error_type": "ValidationError",
-            "message": "Prompt cannot be empty",
-        }
+        return _build_error_response("ValidationError", "Prompt cannot be empty")
 
     if len(prompt) > MAX_PROMPT_LENGTH:
-        return {
-            "type": "error",
-            "error_type": "ValidationError",
-            "message": f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH} characters",
-        }
+        return _build_error_response(
+            "ValidationError",
+            f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH} characters",
+        )
 
     return None
 
@@ -213,30 +245,23 @@ def _initialize_provider(
         if not config.validate():
             error_msgs = "\n".join(config.consume_error_messages())
             # Note: Config already sanitizes error messages
-            return None, {
-                "type": "error",
-                "error_type": "ConfigurationError",
-                "message": f"Configuration error: {error_msgs}",
-            }
+            return None, _build_error_response(
+                "ConfigurationError", f"Configuration error: {error_msgs}"
+            )
 
         provider_name = config.provider
         if not provider_name:
-            return None, {
-                "type": "error",
-                "error_type": "ConfigurationError",
-                "message": "No provider configured. Please set API keys in environment.",
-            }
+            return None, _build_error_response(
+                "ConfigurationError",
+                "No provider configured. Please set API keys in environment.",
+            )
 
         llm_provider = get_provider(provider_name, config, config.get_model())
         return llm_provider, None
 
     except Exception as e:
         logger.exception("Failed to initialize provider")
-        return None, {
-            "type": "error",
-            "error_type": type(e).__name__,
-            "message": sanitize_error_message(str(e)),
-        }
+        return None, _build_error_response(type(e).__name__, sanitize_error_message(str(e)))
 
 
 def _build_question_mapping(questions: List[Dict[str, Any]]) -> QuestionMapping:
@@ -252,6 +277,119 @@ def _build_question_mapping(questions: List[Dict[str, Any]]) -> QuestionMapping:
     return {f"q{i}": q.get("question", f"Question {i}") for i, q in enumerate(questions)}
 
 
+def _prompt_cache_key(prompt: str) -> str:
+    """Return a compact, stable cache key for a prompt."""
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _remember_question_mapping(prompt: str, mapping: QuestionMapping) -> None:
+    """Store the question mapping issued for a prompt's clarification round."""
+    key = _prompt_cache_key(prompt)
+    with _clarification_cache_lock:
+        _clarification_cache[key] = (time.monotonic(), mapping)
+        _clarification_cache.move_to_end(key)
+        while len(_clarification_cache) > CLARIFICATION_CACHE_SIZE:
+            _clarification_cache.popitem(last=False)
+
+
+def _recall_question_mapping(prompt: str) -> Optional[QuestionMapping]:
+    """
+    Look up the question mapping previously issued for a prompt.
+
+    Returns:
+        The cached mapping, or None when missing or older than
+        CLARIFICATION_CACHE_TTL.
+    """
+    key = _prompt_cache_key(prompt)
+    now = time.monotonic()
+    with _clarification_cache_lock:
+        # Entries are kept in insertion order, so expired ones sit at the front.
+        while _clarification_cache:
+            oldest_key = next(iter(_clarification_cache))
+            if now - _clarification_cache[oldest_key][0] <= CLARIFICATION_CACHE_TTL:
+                break
+            del _clarification_cache[oldest_key]
+
+        entry = _clarification_cache.get(key)
+        if entry is None:
+            return None
+        return entry[1]
+
+
+def _get_cached_refinement(key: Tuple[str, str, str]) -> Optional[str]:
+    """Return a previously stored light refinement, marking it recently used."""
+    with _refinement_cache_lock:
+        refined = _refinement_cache.get(key)
+        if refined is not None:
+            _refinement_cache.move_to_end(key)
+        return refined
+
+
+def _store_refinement(key: Tuple[str, str, str], refined: str) -> None:
+    """Store a light refinement, evicting the least recently used entries."""
+    with _refinement_cache_lock:
+        _refinement_cache[key] = refined
+        _refinement_cache.move_to_end(key)
+        while len(_refinement_cache) > REFINEMENT_CACHE_SIZE:
+            _refinement_cache.popitem(last=False)
+
+
+class _SyntheticMapping(Mapping):
+    """
+    Read-only question mapping that labels answer keys generically.
+
+    Used when the caller supplies answers without the original question text.
+    Labels are produced on access rather than materialized up front.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self._keys = tuple(keys)
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self._keys:
+            raise KeyError(key)
+        return f"Question: {key}"
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# Placeholder for a concurrent AskUserQuestion call that raised
+_ASK_FAILED = object()
+
+
+def _ask_questions_concurrently(
+    prepared: List[Dict[str, Any]]
+) -> List[Any]:
+    """
+    Ask each prepared question through AskUserQuestion in parallel.
+
+    Returns:
+        Raw AskUserQuestion results in question order. Calls that raised are
+        marked with _ASK_FAILED so only those questions are asked again.
+    """
+    results: List[Any] = [_ASK_FAILED] * len(prepared)
+    max_workers = min(ASK_USER_MAX_WORKERS, len(prepared))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_ask_user_question_fn, [question_data]): i
+            for i, question_data in enumerate(prepared)
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as exc:
+                logger.warning(
+                    "Concurrent AskUserQuestion failed, asking again sequentially: %s", exc
+                )
+    return results
+
+
 def _try_interactive_questions(
     questions: List[Dict[str, Any]]
 ) -> Optional[Dict[str, str]]:
@@ -281,30 +419,41 @@ def _try_interactive_questions(
     try:
         logger.info("Using interactive AskUserQuestion mode")
         answers: Dict[str, str] = {}
+        prepared: List[Dict[str, Any]] = []
 
         for i, q in enumerate(questions):
-            q_id = f"q{i}"
-            q_text = q.get("question", f"Question {i}")
             q_type = q.get("type", "text")
             options = q.get("options", [])
-            required = bool(q.get("required", True))
 
             # Format question for AskUserQuestion.
             question_data = {
-                "id": q_id,
-                "question": q_text,
+                "id": f"q{i}",
+                "question": q.get("question", f"Question {i}"),
                 "header": f"Q{i+1}",
                 "multiSelect": q_type == "checkbox",
-                "required": required,
+                "required": bool(q.get("required", True)),
             }
 
             if q_type in ("radio", "checkbox") and options:
                 question_data["options"] = [
                     {"label": opt, "description": opt} for opt in options
                 ]
+            prepared.append(question_data)
+
+        concurrent_results: Optional[List[Any]] = None
+        if ASK_USER_CONCURRENT and len(prepared) > 1:
+            concurrent_results = _ask_questions_concurrently(prepared)
+
+        for i, question_data in enumerate(prepared):
+            q_id = question_data["id"]
+            q_text = question_data["question"]
+            required = question_data["required"]
 
-            # Call injected AskUserQuestion function for this single question.
-            result = _ask_user_question_fn([question_data])
+            if concurrent_results is not None and concurrent_results[i] is not _ASK_FAILED:
+                result = concurrent_results[i]
+            else:
+                # Call injected AskUserQuestion function for this single question.
+                result = _ask_user_question_fn([question_data])
 
             # Normalize into a flat mapping.
             answer_value: Any = None
@@ -327,17 +476,20 @@ def _try_interactive_questions(
                 isinstance(answer_value, str) and not answer_value.strip()
             ):
                 if not required:
-                    logger.debug(f"Skipping optional question {q_id}")
+                    logger.debug("Skipping optional question %s", q_id)
                     continue
-                logger.warning(f"No valid answer for required question {q_id}")
+                logger.warning("No valid answer for required question %s", q_id)
                 return None
 
             # Normalize lists for multiselect; everything stored as comma-separated text.
             if isinstance(answer_value, list):
                 if not answer_value and required:
-                    logger.warning(f"No valid answer for required question {q_id}")
+                    logger.warning("No valid answer for required question %s", q_id)
                     return None
-                answers[q_id] = ", ".join(str(a) for a in answer_value)
+                if len(answer_value) == 1:
+                    answers[q_id] = str(answer_value[0])
+                else:
+                    answers[q_id] = ", ".join([str(a) for a in answer_value])
             else:
                 answers[q_id] = str(answer_value)
 
@@ -348,7 +500,7 @@ def _try_interactive_questions(
         return answers
 
     except Exception as exc:
-        logger.warning(f"AskUserQuestion failed: {exc}", exc_info=True)
+        logger.warning("AskUserQuestion failed: %s", exc, exc_info=True)
         return None
 
 
@@ -474,8 +626,11 @@ if mcp:
         success = False
         
         logger.info(
-            f"refine_prompt called: prompt_len={len(prompt)}, "
-            f"has_answers={bool(answers)}, provider={provider}, model={model}"
+            "refine_prompt called: prompt_len=%d, has_answers=%s, provider=%s, model=%s",
+            len(prompt),
+            bool(answers),
+            provider,
+            model,
         )
 
         # Validate input
@@ -561,16 +716,19 @@ if mcp:
             
             # Case 1: Answers provided -> Generate final refined prompt
             if answers:
-                logger.info(f"Refining with {len(answers)} answers")
+                logger.info("Refining with %d answers", len(answers))
                 clarifying_questions_count = 0  # No new questions asked
                 llm_start_time = time.time()
 
                 # Prefer caller-provided mapping so the provider can see the original
-                # question text; fall back to generic labels for backward compatibility.
-                if answer_mapping:
-                    mapping = answer_mapping
-                else:
-                    mapping = {key: f"Question: {key}" for key in answers.keys()}
+                # question text, then the mapping issued with this prompt's
+                # clarification response; fall back to generic labels for
+                # backward compatibility.
+                mapping = (
+                    answer_mapping
+                    or _recall_question_mapping(prompt)
+                    or _SyntheticMapping(answers.keys())
+                )
 
                 refined = llm_provider.refine_from_answers(
                     prompt, answers, mapping, GENERATION_SYSTEM_INSTRUCTION
@@ -615,7 +773,45 @@ if mcp:
 
                 return _build_refined_response(refined)
 
-            # Case 2: No answers -> Determine if questions are needed
+            # Case 2: No answers -> Reuse an earlier light refinement of the
+            # same prompt with the same provider/model if we have one.
+            # Key on the provider instance actually serving the call: providers
+            # have no name attribute and the overrides may be empty, in which
+            # case Config picks the provider and model.
+            model_name = getattr(llm_provider, "model_name", None) or model or "unknown"
+            refinement_key = (type(llm_provider).__name__, model_name, _prompt_cache_key(prompt))
+            cached_refined = _get_cached_refinement(refinement_key)
+            if cached_refined is not None:
+                logger.info("Returning cached light refinement")
+                total_run_latency_sec = time.time() - start_time
+                record_prompt_run_event(
+                    source="mcp",
+                    provider=provider or type(llm_provider).__name__,
+                    model=model_name,
+                    task_type="analysis",
+                    processing_latency_sec=total_run_latency_sec,
+                    clarifying_questions_count=0,
+                    skip_questions=False,
+                    refine_mode=False,  # Light refinement
+                    success=True,
+                    session_id=SESSION_ID,
+                    run_id=run_id,
+                    input_chars=len(prompt),
+                    output_chars=len(cached_refined),
+                    llm_latency_sec=None,  # No LLM call made
+                    total_run_latency_sec=total_run_latency_sec,
+                    quiet_mode=False,
+                    history_enabled=history_enabled,
+                    python_version=sys.version.split()[0],
+                    platform=sys.platform,
+                    interface="mcp",
+                    input_tokens=None,
+                    output_tokens=None,
+                    total_tokens=None,
+                )
+                return _build_refined_response(cached_refined)
+
+            # Determine if questions are needed
             logger.info("Analyzing prompt for clarification needs")
             llm_start_time = time.time()
             analysis = llm_provider.generate_questions(
@@ -676,7 +872,7 @@ if mcp:
             questions = analysis.get("questions", [])
             clarifying_questions_count = len(questions)
 
-            logger.info(f"Task type: {task_type}, questions: {len(questions)}")
+            logger.info("Task type: %s, questions: %d", task_type, len(questions))
 
             # If questions generated, attempt to ask them
             if questions:
@@ -746,6 +942,7 @@ if mcp:
 
                 # Interactive mode unavailable or failed, return structured response
                 logger.info("Returning structured clarification response")
+                _remember_question_mapping(prompt, mapping)
                 return _format_clarification_response(questions, task_type, mapping)
 
             # No questions needed, do light refinement
@@ -755,6 +952,7 @@ if mcp:
                 prompt, ANALYSIS_REFINEMENT_SYSTEM_INSTRUCTION
             )
             llm_end_time = time.time()
+            _store_refinement(refinement_key, refined)
             
             # Calculate timing metrics
             end_time = time.time()
@@ -840,11 +1038,7 @@ if mcp:
                 total_tokens=None,
             )
             
-            return {
-                "type": "error",
-                "error_type": type(e).__name__,
-                "message": sanitize_error_message(str(e)),
-            }
+            return _build_error_response(type(e).__name__, sanitize_error_message(str(e)))
 
 
     @mcp.tool()
@@ -876,7 +1070,7 @@ if mcp:
                 modification="make it more beginner-friendly"
             )
         """
-        logger.info(f"tweak_prompt called: modification='{modification[:50]}...'")
+        logger.info("tweak_prompt called: modification='%.50s...'", modification)
 
         # Validate inputs
         validation_error = _validate_prompt(prompt)
@@ -884,11 +1078,9 @@ if mcp:
             return validation_error
 
         if not modification or not modification.strip():
-            return {
-                "type": "error",
-                "error_type": "ValidationError",
-                "message": "Modification description cannot be empty",
-            }
+            return _build_error_response(
+                "ValidationError", "Modification description cannot be empty"
+            )
 
         # Initialize provider
         llm_provider, provider_error = _initialize_provider(provider, model)
@@ -907,11 +1099,7 @@ if mcp:
 
         except Exception as e:
             logger.exception("Error during prompt tweaking")
-            return {
-                "type": "error",
-                "error_type": type(e).__name__,
-                "message": sanitize_error_message(str(e)),
-            }
+            return _build_error_response(type(e).__name__, sanitize_error_message(str(e)))
 
     @mcp.tool()
     def list_models(
@@ -951,8 +1139,10 @@ if mcp:
             list_models(include_nontext=True)  # Include vision/embedding models
         """
         logger.info(
-            f"list_models called: providers={providers}, limit={limit}, "
-            f"include_nontext={include_nontext}"
+            "list_models called: providers=%s, limit=%s, include_nontext=%s",
+            providers,
+            limit,
+            include_nontext,
         )
 
         try:
@@ -972,11 +1162,7 @@ if mcp:
 
         except Exception as e:
             logger.exception("Error listing models")
-            return {
-                "type": "error",
-                "error_type": type(e).__name__,
-                "message": sanitize_error_message(str(e)),
-            }
+            return _build_error_response(type(e).__name__, sanitize_error_message(str(e)))
 
     @mcp.tool()
     def list_providers() -> Dict[str, Any]:
@@ -1038,11 +1224,7 @@ if mcp:
 
         except Exception as e:
             logger.exception("Error listing providers")
-            return {
-                "type": "error",
-                "error_type": type(e).__name__,
-                "message": sanitize_error_message(str(e)),
-            }
+            return _build_error_response(type(e).__name__, sanitize_error_message(str(e)))
 
     @mcp.tool()
     def validate_environment(
@@ -1078,8 +1260,9 @@ if mcp:
             validate_environment(providers=["openai"], test_connection=True)
         """
         logger.info(
-            f"validate_environment called: providers={providers}, "
-            f"test_connection={test_connection}"
+            "validate_environment called: providers=%s, test_connection=%s",
+            providers,
+            test_connection,
         )
 
         try:
@@ -1099,11 +1282,7 @@ if mcp:
 
         except Exception as e:
             logger.exception("Error validating environment")
-            return {
-                "type": "error",
-                "error_type": type(e).__name__,
-                "message": sanitize_error_message(str(e)),
-            }
+            return _build_error_response(type(e).__name__, sanitize_error_message(str(e)))
 
 
 def run_mcp_server():
@@ -6,14 +6,29 @@ from models.dev API and exposing provider-specific model lists.
 """
 
 import asyncio
-import json
+import hashlib
+import logging
 import os
+import re
+import threading
 import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 import aiohttp
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+from promptheus.constants import MIN_REFINEMENT_OUTPUT_TOKENS
+from promptheus.utils import json_dumps_bytes, json_loads
+
+logger = logging.getLogger(__name__)
+
 # Mapping from canonical provider IDs to models.dev API IDs
 PROVIDER_ID_MAPPING = {
     "google": "google",
@@ -30,6 +45,10 @@ MODELS_DEV_IDS = set(PROVIDER_ID_MAPPING.keys())
 # Cache duration in seconds (24 hours)
 CACHE_DURATION = 86400
 
+# Expired caches younger than this are served immediately while a background
+# refresh runs; older ones block on the refresh (7 days)
+CACHE_STALE_OK_DURATION = 7 * 86400
+
 # Platform-specific cache directory
 if os.name == "nt":
     CACHE_DIR = Path(os.environ.get("APPDATA", "")) / "promptheus"
@@ -38,15 +57,172 @@ else:
 
 CACHE_FILE = CACHE_DIR / "models_cache.json"
 
+# Schema version stored in the msgpack cache; bump when the layout changes so
+# older files are ignored instead of misread.
+CACHE_FORMAT_VERSION = 1
+
+# Substrings marking non-text-generation models (embeddings, speech, video...).
+# "image"/"vision" are matched separately because vision models that also take
+# text input remain valid text generators.
+_EXCLUDED_MODEL_PATTERNS = (
+    "embed", "embedding",               # Embedding models
+    "tts", "speech", "voice", "audio",  # Text-to-speech models
+    "draw", "paint",                    # Image generation
+    "video", "multimodal",              # Video generation
+)
+_VISION_MODEL_PATTERNS = ("image", "vision")
+
+# Patterns in model IDs that indicate specialized/non-general-purpose variants.
+# These get pushed down in the refinement dropdown.
+_DEPRIORITIZED_PATTERNS = ("codex", "nano", "research", "preview", "realtime")
+
+# Each pattern group compiled into one alternation so a model ID is scanned once
+_EXCLUDED_MODEL_RE = re.compile("|".join(map(re.escape, _EXCLUDED_MODEL_PATTERNS)))
+_VISION_MODEL_RE = re.compile("|".join(map(re.escape, _VISION_MODEL_PATTERNS)))
+_DEPRIORITIZED_RE = re.compile("|".join(map(re.escape, _DEPRIORITIZED_PATTERNS)))
+
+# Shared read-only fallbacks for missing metadata fields
+_EMPTY_DICT: Dict[str, Any] = {}
+_EMPTY_TUPLE: tuple = ()
+
+# Shared HTTP settings for the long-lived models.dev client session
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=15)
+HTTP_CONNECTION_LIMIT = 10
+DNS_CACHE_TTL = 300  # seconds
+
+
+def _msgpack_cache_file() -> Path:
+    """Path of the msgpack cache, stored next to the legacy JSON cache."""
+    return CACHE_FILE.with_suffix(".mp")
+
+
+def _write_cache_file(cache_data: Dict[str, Any]) -> None:
+    """Persist cache data to disk (blocking; run off the event loop).
+
+    Uses msgpack when it is installed and falls back to JSON in CACHE_FILE.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if msgpack is not None:
+        target = _msgpack_cache_file()
+        payload = msgpack.packb({**cache_data, "v": CACHE_FORMAT_VERSION})
+    else:
+        target = CACHE_FILE
+        payload = json_dumps_bytes(cache_data)
+    # Write to a sibling temp file and swap it in atomically so an
+    # interrupted write never leaves a truncated cache behind.
+    tmp_file = target.with_suffix(target.suffix + ".tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, target)
+
+
+def _read_cache_file() -> Optional[Dict[str, Any]]:
+    """Read cache data from disk (blocking; run off the event loop).
+
+    Prefers the msgpack cache and falls back to the legacy JSON file when
+    msgpack is unavailable or the msgpack file is missing or outdated.
+    """
+    if msgpack is not None:
+        mp_file = _msgpack_cache_file()
+        if mp_file.exists():
+            try:
+                cache_data = msgpack.unpackb(mp_file.read_bytes())
+            except Exception:
+                cache_data = None
+            if isinstance(cache_data, dict) and cache_data.get("v") == CACHE_FORMAT_VERSION:
+                return cache_data
+    if not CACHE_FILE.exists():
+        return None
+    return json_loads(CACHE_FILE.read_bytes())
+
+
+def _release_number(release_date: str) -> int:
+    """Convert a models.dev release date (normally YYYY-MM-DD) to YYYYMMDD."""
+    if len(release_date) == 10 and release_date[4] == "-" and release_date[7] == "-":
+        # Common case: slice the digits out directly instead of replace()
+        digits = release_date[:4] + release_date[5:7] + release_date[8:]
+    else:
+        digits = release_date.replace("-", "")
+    return int(digits) if digits.isdigit() else 0
+
+
+def _model_sort_key(model_info: Dict[str, Any]) -> tuple:
+    """Sort key ranking refinement models by practical usefulness.
+
+    Order of importance:
+    1. Must produce text and accept text (penalize otherwise)
+    2. General-purpose before specialized variants
+    3. Higher output limit (guards against tiny-output models)
+    4. Larger context window
+    5. Newer release date
+    6. Reasoning/structured-output/tool-call support (tie-breakers)
+    Models with missing metadata sort last.
+    """
+    # Called once per model on every sort, so bind lookups to locals.
+    get = model_info.get
+    model_id = (get("id") or "").lower()
+    is_specialized = _DEPRIORITIZED_RE.search(model_id) is not None
+
+    modalities = get("modalities") or _EMPTY_DICT
+    output_modalities = modalities.get("output") or _EMPTY_TUPLE
+    input_modalities = modalities.get("input") or _EMPTY_TUPLE
+
+    limits = get("limit") or _EMPTY_DICT
+    context = limits.get("context") or 0
+    output = limits.get("output") or 0
+    release_num = _release_number(get("release_date") or "")
+
+    # Non-text outputs and non-text inputs are pushed down so the most
+    # immediately usable text models appear first even when include_nontext=True.
+    text_output_penalty = 0 if "text" in output_modalities else 1
+    text_input_penalty = 0 if (not input_modalities or "text" in input_modalities) else 1
+
+    return (
+        text_output_penalty,
+        text_input_penalty,
+        is_specialized,
+        -output,
+        -context,
+        -release_num,
+        -bool(get("reasoning")),
+        -bool(get("structured_output")),
+        -bool(get("tool_call")),
+        model_id,
+    )
+
 
 class ModelsDevService:
     """Async service for fetching and caching models from models.dev API."""
 
     MODELS_DEV_URL = "https://models.dev/api.json"
 
+    __slots__ = (
+        "_cache",
+        "_cache_timestamp",
+        "_cache_hash",
+        "_cache_valid_until",
+        "_session",
+        "_session_loop",
+        "_refresh_task",
+        "_models_by_provider",
+        "_split_cache",
+    )
+
     def __init__(self):
         self._cache: Optional[Dict] = None
         self._cache_timestamp: Optional[float] = None
+        # Digest of the last fetched payload, used to detect unchanged refreshes
+        self._cache_hash: Optional[bytes] = None
+        # Monotonic deadline until which the loaded cache is known to be fresh
+        self._cache_valid_until: float = 0.0
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Per-provider model dicts derived from the loaded cache (built lazily)
+        self._models_by_provider: Optional[Mapping[str, Dict[str, Any]]] = None
+        # Sorted/filtered model lists keyed by (provider_id, cache timestamp)
+        self._split_cache: Dict[
+            Tuple[str, Optional[float]], Tuple[List[str], List[str], List[str]]
+        ] = {}
         # Try loading disk cache eagerly if an event loop is already running
         try:
             loop = asyncio.get_running_loop()
@@ -56,12 +232,34 @@ class ModelsDevService:
 
     async def _ensure_cache_loaded(self) -> None:
         """Ensure cache is loaded and fresh."""
+        # Fast path for a warm process: skip the expiry arithmetic entirely
+        if time.monotonic() < self._cache_valid_until:
+            return
+
         if self._cache is None and self._cache_timestamp is None:
             await self._load_cache_from_disk()
 
-        if self._cache is None or self._is_cache_expired():
+        if self._cache is None:
+            await self._refresh_cache()
+        elif self._is_cache_expired():
+            if time.time() - self._cache_timestamp <= CACHE_STALE_OK_DURATION:
+                # Stale-while-revalidate: answer from the stale cache now
+                self._start_background_refresh()
+                return
             await self._refresh_cache()
 
+        if self._cache is not None and not self._is_cache_expired():
+            # The persisted timestamp is wall-clock; convert the remaining
+            # lifetime to a monotonic deadline so clock jumps can't extend it.
+            remaining = CACHE_DURATION - (time.time() - self._cache_timestamp)
+            self._cache_valid_until = time.monotonic() + remaining
+
+    def _start_background_refresh(self) -> asyncio.Task:
+        """Return the in-flight cache refresh task, starting one if none is running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._fetch_cache())
+        return self._refresh_task
+
     def _is_cache_expired(self) -> bool:
         """Check if cache is expired."""
         if self._cache_timestamp is None:
@@ -72,19 +270,83 @@ class ModelsDevService:
         """Public method to refresh cache from models.dev API."""
         await self._refresh_cache()
 
-    async def _refresh_cache(self) -> None:
-        """Refresh cache from models.dev API."""
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the service's HTTP session, creating it on first use.
+
+        The session (and its connection pool) is reused across refreshes so
+        keep-alive connections and DNS lookups are shared. A new session is
+        created if the previous one was closed or belongs to another loop;
+        in the latter case the old one is released first.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            await self._discard_session()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_CONNECTION_LIMIT, ttl_dns_cache=DNS_CACHE_TTL
+                ),
+                timeout=HTTP_TIMEOUT,
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def _discard_session(self) -> None:
+        """Close a session created on another event loop and forget it."""
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            # Its loop is still serving another thread (which may be blocked
+            # waiting on us), so schedule the close there without awaiting it
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.MODELS_DEV_URL) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+            # The owning loop has stopped (e.g. a finished asyncio.run); close
+            # the session from the loop now asking for a new one
+            await session.close()
+        except Exception as exc:
+            # Transports pooled on a closed loop can refuse to close; drop the
+            # reference rather than failing the request that replaced it
+            logger.debug("Dropping models.dev HTTP session that failed to close: %s", exc)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session, letting an in-flight refresh finish first."""
+        refresh_task = self._refresh_task
+        if refresh_task is not None and not refresh_task.done():
+            try:
+                await refresh_task
+            except Exception:
+                pass
+        session = self._session
+        self._session = None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
 
-                    self._cache = data
-                    self._cache_timestamp = time.time()
+    async def _refresh_cache(self) -> None:
+        """
+        Refresh cache from models.dev API.
 
-                    # Save to disk
-                    await self._save_cache_to_disk()
+        Concurrent callers share a single in-flight fetch instead of each
+        issuing their own request and disk write.
+        """
+        # Shield the shared task so one cancelled waiter doesn't abort it for all
+        await asyncio.shield(self._start_background_refresh())
+
+    async def _fetch_cache(self) -> None:
+        """Fetch the models.dev catalog and store it in memory and on disk."""
+        try:
+            session = await self._get_session()
+            async with session.get(self.MODELS_DEV_URL) as response:
+                response.raise_for_status()
+                self._apply_payload(await response.read())
+
+                # Save to disk
+                await self._save_cache_to_disk()
 
         except Exception as exc:
             # If we have cached data, use it even if expired
@@ -93,30 +355,53 @@ class ModelsDevService:
             # Otherwise raise the error
             raise RuntimeError(f"Failed to fetch models from models.dev: {exc}") from exc
 
+    def _apply_payload(self, raw: bytes) -> None:
+        """
+        Install a freshly fetched models.dev payload as the cache.
+
+        When the payload is byte-identical to the one already loaded, the
+        parsed cache and memoized model splits are kept and only the
+        timestamp moves forward.
+        """
+        content_hash = hashlib.blake2b(raw, digest_size=16).digest()
+        refreshed_at = time.time()
+
+        if self._cache is not None and content_hash == self._cache_hash:
+            self._split_cache = {
+                (provider_id, refreshed_at): split
+                for (provider_id, _), split in self._split_cache.items()
+            }
+        else:
+            self._cache = json_loads(raw)
+            self._cache_hash = content_hash
+            self._split_cache.clear()
+            self._models_by_provider = None
+
+        self._cache_timestamp = refreshed_at
+
     async def _save_cache_to_disk(self) -> None:
-        """Save cache to disk."""
+        """Save cache to disk without blocking the event loop."""
+        cache_data = {
+            "cache": self._cache,
+            "timestamp": self._cache_timestamp
+        }
         try:
-            CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            cache_data = {
-                "cache": self._cache,
-                "timestamp": self._cache_timestamp
-            }
-            with open(CACHE_FILE, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            await asyncio.to_thread(_write_cache_file, cache_data)
         except Exception:
             # Ignore cache save errors - it's a nice-to-have
             pass
 
     async def _load_cache_from_disk(self) -> None:
-        """Load cache from disk if available."""
-        if not CACHE_FILE.exists():
-            return
-
+        """Load cache from disk if available, without blocking the event loop."""
         try:
-            with open(CACHE_FILE, "r") as f:
-                cache_data = json.load(f)
-                self._cache = cache_data.get("cache")
-                self._cache_timestamp = cache_data.get("timestamp", 0)
+            cache_data = await asyncio.to_thread(_read_cache_file)
+            if cache_data is None:
+                return
+            self._cache = cache_data.get("cache")
+            self._cache_timestamp = cache_data.get("timestamp", 0)
+            self._cache_hash = None
+            self._split_cache.clear()
+            self._models_by_provider = None
         except Exception:
             # Ignore cache load errors - we'll fetch fresh data
             pass
@@ -141,30 +426,63 @@ class ModelsDevService:
         if not self._cache:
             raise RuntimeError("Unable to load models from models.dev API")
 
-        models_dev_id = PROVIDER_ID_MAPPING[provider_id]
-        provider_data = self._cache.get(models_dev_id, {})
-        models_data = provider_data.get("models", {})
+        split_key = (provider_id, self._cache_timestamp)
+        cached_split = self._split_cache.get(split_key)
+        if cached_split is None:
+            cached_split = self._split_models(provider_id)
+            self._split_cache[split_key] = cached_split
+
+        # Hand out copies so callers cannot mutate the memoized lists
+        all_models, text_models, refinement_models = cached_split
+        return list(all_models), list(text_models), list(refinement_models)
+
+    def _split_models(self, provider_id: str) -> Tuple[List[str], List[str], List[str]]:
+        """Sort and partition the cached models for a provider."""
+        models_data = self._get_models_by_provider()[PROVIDER_ID_MAPPING[provider_id]]
 
         # Apply a consistent sort across all model lists so the dropdown/CLI
         # surfaces the most useful options first instead of depending on
         # dictionary ordering from the models.dev payload.
-        sorted_pairs = sorted(
-            models_data.items(),
-            key=lambda pair: self._model_sort_key(pair[1]),
+        # Evaluate the sort key and both filters once per model, then sort on
+        # the precomputed key (stable, so ties keep payload order).
+        decorated = []
+        for model_id, model_info in models_data.items():
+            is_text = self._is_text_generation_model(model_info)
+            is_refinement = is_text and self._is_suitable_for_refinement(model_info)
+            decorated.append(
+                (_model_sort_key(model_info), model_id, is_text, is_refinement)
+            )
+        decorated.sort(key=itemgetter(0))
+
+        all_models: List[str] = []
+        text_models: List[str] = []
+        refinement_models: List[str] = []
+        add_all, add_text, add_refinement = (
+            all_models.append, text_models.append, refinement_models.append
         )
-
-        all_models = [model_id for model_id, _ in sorted_pairs]
-        text_models = [
-            model_id for model_id, model_info in sorted_pairs
-            if self._is_text_generation_model(model_info)
-        ]
-        refinement_models = [
-            model_id for model_id, model_info in sorted_pairs
-            if self._is_text_generation_model(model_info)
-            and self._is_suitable_for_refinement(model_info)
-        ]
+        for _, model_id, is_text, is_refinement in decorated:
+            add_all(model_id)
+            if is_text:
+                add_text(model_id)
+                if is_refinement:
+                    add_refinement(model_id)
         return all_models, text_models, refinement_models
 
+    def _get_models_by_provider(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Return a read-only view of models keyed by models.dev provider ID.
+
+        Built once per loaded cache, so lookups skip the nested .get() chain
+        and empty-dict fallbacks on every query.
+        """
+        if self._models_by_provider is None:
+            cache = self._cache or _EMPTY_DICT
+            self._models_by_provider = MappingProxyType({
+                models_dev_id: (cache.get(models_dev_id) or _EMPTY_DICT).get("models") or _EMPTY_DICT
+                for models_dev_id in PROVIDER_ID_MAPPING.values()
+            })
+        return self._models_by_provider
+
     def get_cache_timestamp(self) -> Optional[float]:
         """Return the epoch timestamp of the last successful cache refresh (if any)."""
         return self._cache_timestamp
@@ -179,8 +497,8 @@ class ModelsDevService:
         Returns:
             True if model is suitable for text generation
         """
-        modalities = model_info.get("modalities", {})
-        output_modalities = modalities.get("output", [])
+        modalities = model_info.get("modalities") or _EMPTY_DICT
+        output_modalities = modalities.get("output") or _EMPTY_TUPLE
 
         # Must output text
         if "text" not in output_modalities:
@@ -190,77 +508,17 @@ class ModelsDevService:
         model_id = model_info.get("id", "").lower()
         family = (model_info.get("family") or "").lower()
 
-        # Common patterns for non-text-generation models
-        exclude_patterns = [
-            "embed", "embedding",           # Embedding models
-            "tts", "speech", "voice", "audio", # Text-to-speech models
-            "image", "vision", "draw", "paint", # Image generation (unless also text)
-            "video", "multimodal",           # Video generation
-        ]
-
-        # Check if model ID contains excluded patterns
-        for pattern in exclude_patterns:
-            if pattern in model_id or pattern in family:
-                # Allow vision models if they also support text input/output
-                if pattern in ["image", "vision"] and "text" in modalities.get("input", []):
-                    continue
-                return False
+        # Check if model ID or family contains excluded patterns
+        if _EXCLUDED_MODEL_RE.search(model_id) or _EXCLUDED_MODEL_RE.search(family):
+            return False
+
+        # Allow vision models only if they also support text input/output
+        if _VISION_MODEL_RE.search(model_id) or _VISION_MODEL_RE.search(family):
+            return "text" in (modalities.get("input") or _EMPTY_TUPLE)
 
         return True
 
-    # Patterns in model IDs that indicate specialized/non-general-purpose variants.
-    # These get pushed down in the refinement dropdown.
-    _DEPRIORITIZED_PATTERNS = ("codex", "nano", "research", "preview", "realtime")
-
-    @staticmethod
-    def _model_sort_key(model_info: Dict[str, Any]) -> tuple:
-        """Sort key ranking refinement models by practical usefulness.
-
-        Order of importance:
-        1. Must produce text and accept text (penalize otherwise)
-        2. General-purpose before specialized variants
-        3. Higher output limit (guards against tiny-output models)
-        4. Larger context window
-        5. Newer release date
-        6. Reasoning/structured-output/tool-call support (tie-breakers)
-        Models with missing metadata sort last.
-        """
-        model_id = (model_info.get("id") or "").lower()
-        is_specialized = any(p in model_id for p in ModelsDevService._DEPRIORITIZED_PATTERNS)
-
-        modalities = model_info.get("modalities", {}) if isinstance(model_info, dict) else {}
-        output_modalities = modalities.get("output", []) if isinstance(modalities, dict) else []
-        input_modalities = modalities.get("input", []) if isinstance(modalities, dict) else []
-
-        has_text_output = "text" in output_modalities
-        has_text_input = (not input_modalities) or ("text" in input_modalities)
-
-        limits = model_info.get("limit", {})
-        context = limits.get("context") or 0
-        output = limits.get("output") or 0
-        raw_release = (model_info.get("release_date") or "").replace("-", "")
-        release_num = int(raw_release) if raw_release.isdigit() else 0
-        reasoning = bool(model_info.get("reasoning"))
-        structured = bool(model_info.get("structured_output"))
-        tools = bool(model_info.get("tool_call"))
-
-        # Non-text outputs and non-text inputs are pushed down so the most
-        # immediately usable text models appear first even when include_nontext=True.
-        text_output_penalty = 0 if has_text_output else 1
-        text_input_penalty = 0 if has_text_input else 1
-
-        return (
-            text_output_penalty,
-            text_input_penalty,
-            is_specialized,
-            -output,
-            -context,
-            -release_num,
-            -int(reasoning),
-            -int(structured),
-            -int(tools),
-            model_id,
-        )
+    _model_sort_key = staticmethod(_model_sort_key)
 
     def _is_suitable_for_refinement(self, model_info: Dict[str, Any]) -> bool:
         """
@@ -270,15 +528,13 @@ class ModelsDevService:
         (output token limit, input modalities) instead of hardcoded model names.
         Models with missing metadata pass by default to avoid false exclusions.
         """
-        from promptheus.constants import MIN_REFINEMENT_OUTPUT_TOKENS
-
-        limits = model_info.get("limit", {})
+        limits = model_info.get("limit") or _EMPTY_DICT
         output_limit = limits.get("output")
         if isinstance(output_limit, (int, float)) and output_limit < MIN_REFINEMENT_OUTPUT_TOKENS:
             return False
 
-        modalities = model_info.get("modalities", {})
-        input_modalities = modalities.get("input", [])
+        modalities = model_info.get("modalities") or _EMPTY_DICT
+        input_modalities = modalities.get("input") or _EMPTY_TUPLE
         if input_modalities and "text" not in input_modalities:
             return False
 
@@ -303,14 +559,8 @@ class ModelsDevService:
         if not self._cache:
             return None
 
-        # Map canonical provider ID to models.dev API ID
         models_dev_id = PROVIDER_ID_MAPPING[provider_id]
-
-        # Extract models for the provider from cache
-        provider_data = self._cache.get(models_dev_id, {})
-        models_data = provider_data.get("models", {})
-
-        return models_data.get(model_id)
+        return self._get_models_by_provider()[models_dev_id].get(model_id)
 
     def get_supported_provider_ids(self) -> Set[str]:
         """Get set of supported provider IDs."""
@@ -328,25 +578,67 @@ class ModelsDevService:
         if not self._cache:
             raise RuntimeError("Unable to load models from models.dev API")
 
-        result = {}
-        for provider_id in MODELS_DEV_IDS:
-            result[provider_id] = await self.get_models_for_provider(provider_id)
-
-        return result
+        provider_ids = list(MODELS_DEV_IDS)
+        results = await asyncio.gather(
+            *(self.get_models_for_provider(provider_id) for provider_id in provider_ids)
+        )
+        return dict(zip(provider_ids, results))
 
     def clear_cache(self) -> None:
         """Clear in-memory cache."""
         self._cache = None
         self._cache_timestamp = None
+        self._cache_valid_until = 0.0
+        self._cache_hash = None
+        self._split_cache.clear()
+        self._models_by_provider = None
 
     @classmethod
     def clear_disk_cache(cls) -> None:
-        """Clear disk cache file."""
-        if CACHE_FILE.exists():
-            try:
-                CACHE_FILE.unlink()
-            except Exception:
-                pass
+        """Clear disk cache files."""
+        for cache_file in (CACHE_FILE, _msgpack_cache_file()):
+            if cache_file.exists():
+                try:
+                    cache_file.unlink()
+                except Exception:
+                    pass
+
+
+# Background event loop used to serve sync callers that are already running
+# inside an event loop (where asyncio.run() is not allowed). Created lazily and
+# reused, along with its service, so warm calls avoid thread/loop spin-up and
+# hit the in-memory cache.
+_bridge_loop: Optional[asyncio.AbstractEventLoop] = None
+_bridge_service: Optional[ModelsDevService] = None
+_bridge_lock = threading.Lock()
+
+
+def _get_bridge_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting its daemon thread if needed."""
+    global _bridge_loop
+    with _bridge_lock:
+        if _bridge_loop is None or _bridge_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="promptheus-models-dev", daemon=True
+            )
+            thread.start()
+            _bridge_loop = loop
+        return _bridge_loop
+
+
+async def _bridge_get_models(provider_id: str, filter_text_only: bool) -> List[str]:
+    """
+    Fetch models using the bridge loop's long-lived service.
+
+    The bridge loop lives as long as the process, so the service keeps its
+    HTTP session open between calls and a stale-while-revalidate refresh is
+    left to finish in the background rather than awaited here.
+    """
+    global _bridge_service
+    if _bridge_service is None:
+        _bridge_service = ModelsDevService()
+    return await _bridge_service.get_models_for_provider(provider_id, filter_text_only)
 
 
 # Sync helper for CLI usage
@@ -363,22 +655,25 @@ def get_sync_models_for_provider(provider_id: str, filter_text_only: bool = True
     """
     async def _get_models():
         service = ModelsDevService()
-        # Try to load from disk first for CLI speed
-        await service._load_cache_from_disk()
-        return await service.get_models_for_provider(provider_id, filter_text_only)
+        try:
+            # Try to load from disk first for CLI speed
+            await service._load_cache_from_disk()
+            return await service.get_models_for_provider(provider_id, filter_text_only)
+        finally:
+            await service.aclose()
 
     try:
-        # Check if we're already in an event loop
         try:
-            loop = asyncio.get_running_loop()
-            # We're in an event loop, create a task and run it
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, _get_models())
-                return future.result()
+            asyncio.get_running_loop()
         except RuntimeError:
             # No event loop running, use asyncio.run()
             return asyncio.run(_get_models())
+
+        # We're inside an event loop; run on the shared background loop instead
+        future = asyncio.run_coroutine_threadsafe(
+            _bridge_get_models(provider_id, filter_text_only), _get_bridge_loop()
+        )
+        return future.result()
     except Exception as exc:
         raise RuntimeError(f"Failed to get models for provider {provider_id}: {exc}") from exc
 
@@ -393,3 +688,9 @@ def get_service() -> ModelsDevService:
     if _service_instance is None:
         _service_instance = ModelsDevService()
     return _service_instance
+
+
+async def close_service() -> None:
+    """Close the global service's HTTP session (call on application shutdown)."""
+    if _service_instance is not None:
+        await _service_instance.aclose()
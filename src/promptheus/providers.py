@@ -5,14 +5,20 @@ Supports Gemini, Anthropic/Claude, OpenAI, Groq, Qwen, GLM, and OpenRouter.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import importlib
+import io
 import json
 import logging
 import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, cast
 
 from promptheus.constants import (
     DEFAULT_CLARIFICATION_MAX_TOKENS,
@@ -22,23 +28,77 @@ from promptheus.constants import (
     RESPONSES_API_TIMEOUT,
 )
 from promptheus.config import SUPPORTED_PROVIDER_IDS
-from promptheus.utils import sanitize_error_message
+from promptheus.utils import json_loads, sanitize_error_message
 from promptheus.exceptions import ProviderAPIError
 
 logger = logging.getLogger(__name__)
 
+# Requests currently being sent, keyed like the response cache, so identical
+# concurrent calls (from threads or asyncio.to_thread workers) share one result
+_inflight: Dict[str, Future[str]] = {}
+_inflight_lock = threading.Lock()
+
+# (input, output, total) tokens reported by the latest provider call on each thread
+TokenUsage = Tuple[Optional[int], Optional[int], Optional[int]]
+NO_TOKEN_USAGE: TokenUsage = (None, None, None)
+_thread_usage = threading.local()
+
+
+def call_with_token_usage(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, TokenUsage]:
+    """
+    Call fn and return its result with the token usage its provider call reported.
+
+    Usage is tracked per thread, so calls running concurrently on one provider
+    instance (for example via asyncio.to_thread) each see their own counts.
+    """
+    _thread_usage.tokens = NO_TOKEN_USAGE
+    result = fn(*args, **kwargs)
+    return result, getattr(_thread_usage, "tokens", NO_TOKEN_USAGE)
+
+
+# One-shot results of speculative calls made through prefetch_call(), handed
+# to the first identical request and bounded so unused drafts age out
+PREFETCH_RESULTS_SIZE = 8
+_prefetched: "OrderedDict[str, Tuple[str, TokenUsage]]" = OrderedDict()
+_thread_prefetch = threading.local()
+
+
+def prefetch_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Call fn speculatively, keeping its provider responses for a later request.
+
+    The first identical generate_text request reuses the stored response (or
+    joins it while still in flight) instead of calling the provider again.
+    """
+    _thread_prefetch.active = True
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _thread_prefetch.active = False
+
+
 def _print_user_error(message: str) -> None:
     """Print error message directly to stderr for user visibility."""
     print(f"  [!] {message}", file=sys.stderr)
 
 
 if TYPE_CHECKING:  # pragma: no cover - typing support only
+    from promptheus.cache import ResponseCache, SemanticCache
     from promptheus.config import Config
 
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Optional response caches, attached by get_provider() when enabled
+    response_cache: Optional[ResponseCache] = None
+    semantic_cache: Optional[SemanticCache] = None
+    # Similarity threshold for semantic_cache lookups; None uses the cache default
+    semantic_cache_threshold: Optional[float] = None
+
+    # True when _stream_text yields incremental chunks from the provider API
+    supports_streaming: bool = False
+
     @abstractmethod
     def generate_questions(self, initial_prompt: str, system_instruction: str) -> Optional[Dict[str, Any]]:
         """
@@ -70,6 +130,154 @@ class LLMProvider(ABC):
         if all attempts fail.
         """
 
+    def generate_text(
+        self,
+        prompt: str,
+        system_instruction: str,
+        *,
+        json_mode: bool = False,
+        max_tokens: Optional[int] = None,
+        cache_kind: Optional[str] = None,
+    ) -> str:
+        """
+        Return the provider output for a request, consulting response caches first.
+
+        The exact-match cache covers every call; the semantic cache is only
+        consulted for calls that name a cache_kind, so paraphrase matches never
+        leak between different kinds of request. Only question generation
+        names one: refinement payloads that differ just in the user's answers
+        embed almost identically, so they must match exactly. Identical requests issued
+        while one is already in flight share its result.
+        """
+        from promptheus.cache import make_cache_key
+
+        key = make_cache_key(
+            type(self).__name__,
+            getattr(self, "model_name", ""),
+            system_instruction,
+            prompt,
+            json_mode,
+            max_tokens,
+        )
+        cache = self.response_cache
+        semantic_cache = self.semantic_cache if cache_kind else None
+        namespace = ""
+        if semantic_cache is not None:
+            # Semantic entries are scoped to the provider, model, call kind and
+            # system instruction; only the prompt itself is matched by similarity.
+            namespace = make_cache_key(
+                type(self).__name__,
+                getattr(self, "model_name", ""),
+                system_instruction,
+                cache_kind or "",
+                json_mode,
+                max_tokens,
+            )
+
+        cached = cache.get(key) if cache is not None else None
+        if cached is None and semantic_cache is not None:
+            cached = semantic_cache.lookup(namespace, prompt, self.semantic_cache_threshold)
+        if cached is not None:
+            logger.debug("Response cache hit for %s", type(self).__name__)
+            # No tokens were spent on a cached response
+            self._set_token_usage(None, None, None)
+            return cached
+
+        def _call() -> str:
+            text = self._generate_text(
+                prompt, system_instruction, json_mode=json_mode, max_tokens=max_tokens
+            )
+            if cache is not None:
+                cache.put(key, text)
+            if semantic_cache is not None:
+                semantic_cache.insert(namespace, prompt, text)
+            if getattr(_thread_prefetch, "active", False):
+                # Stored before the single-flight entry resolves so a caller
+                # joining this request can also claim its token usage
+                self._store_prefetched(key, text)
+            return text
+
+        prefetched = self._take_prefetched(key)
+        if prefetched is not None:
+            logger.debug("Using prefetched response for %s", type(self).__name__)
+            return prefetched
+
+        text, shared = self._single_flight(key, _call)
+        if shared:
+            logger.debug("Joined in-flight request for %s", type(self).__name__)
+            self._take_prefetched(key)
+        return text
+
+    def _store_prefetched(self, key: str, text: str) -> None:
+        """Keep a speculative response for the first identical request."""
+        usage: TokenUsage = (
+            getattr(self, "last_input_tokens", None),
+            getattr(self, "last_output_tokens", None),
+            getattr(self, "last_total_tokens", None),
+        )
+        with _inflight_lock:
+            _prefetched[key] = (text, usage)
+            _prefetched.move_to_end(key)
+            while len(_prefetched) > PREFETCH_RESULTS_SIZE:
+                _prefetched.popitem(last=False)
+
+    def _take_prefetched(self, key: str) -> Optional[str]:
+        """Claim a stored speculative response, attributing its token usage to this call."""
+        with _inflight_lock:
+            entry = _prefetched.pop(key, None)
+        if entry is None:
+            return None
+        text, usage = entry
+        self._set_token_usage(*usage)
+        return text
+
+    def _single_flight(self, key: str, call: Callable[[], str]) -> Tuple[str, bool]:
+        """
+        Run call once per key at a time, sharing its outcome with concurrent callers.
+
+        Callers that arrive while an identical request is in flight wait for it
+        instead of issuing their own; the entry is dropped once the owner has
+        finished (and stored the result in any cache). Returns the text and
+        whether it was shared from another caller's request. Joined calls leave
+        token usage alone: the owner may be running on this same instance and
+        its counts must survive for its telemetry.
+        """
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                _inflight[key] = future
+
+        if not is_owner:
+            return future.result(), True
+
+        try:
+            text = call()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(text)
+            return text, False
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def _set_token_usage(
+        self,
+        input_tokens: Optional[int],
+        output_tokens: Optional[int],
+        total_tokens: Optional[int],
+    ) -> None:
+        """Record token usage for the latest call on this instance and thread."""
+        self.last_input_tokens = input_tokens  # type: ignore[attr-defined]
+        self.last_output_tokens = output_tokens  # type: ignore[attr-defined]
+        self.last_total_tokens = total_tokens  # type: ignore[attr-defined]
+        # The instance attributes are shared by every thread using this
+        # provider; the thread-local copy is what call_with_token_usage reads.
+        _thread_usage.tokens = (input_tokens, output_tokens, total_tokens)
+
     def refine_from_answers(
         self,
         initial_prompt: str,
@@ -78,7 +286,7 @@ class LLMProvider(ABC):
         system_instruction: str,
     ) -> str:
         payload = self._format_refinement_payload(initial_prompt, answers, question_mapping)
-        return self._generate_text(
+        return self.generate_text(
             payload,
             system_instruction,
             json_mode=False,
@@ -105,7 +313,7 @@ class LLMProvider(ABC):
         system_instruction: str,
     ) -> str:
         payload = self._format_tweak_payload(current_prompt, tweak_instruction)
-        return self._generate_text(
+        return self.generate_text(
             payload,
             system_instruction,
             json_mode=False,
@@ -118,13 +326,132 @@ class LLMProvider(ABC):
         This is a default implementation that can be overridden by providers
         if a more specific implementation is needed.
         """
-        return self._generate_text(
+        return self.generate_text(
             prompt,
             system_instruction,
             json_mode=False,
             max_tokens=DEFAULT_REFINEMENT_MAX_TOKENS,
         )
 
+    # ------------------------------------------------------------------ #
+    # Streaming API
+    #
+    # Free-form refinements can be rendered as they arrive. Question
+    # generation stays on the buffered path because it needs the full JSON.
+    # ------------------------------------------------------------------ #
+    def _stream_text(
+        self,
+        prompt: str,
+        system_instruction: str,
+        *,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the provider output in chunks.
+
+        The default yields the buffered response as a single chunk; providers
+        whose SDKs support streaming override this and set supports_streaming.
+        """
+        yield self._generate_text(prompt, system_instruction, max_tokens=max_tokens)
+
+    def stream_text(
+        self,
+        prompt: str,
+        system_instruction: str,
+        *,
+        max_tokens: Optional[int] = None,
+        cache_kind: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield the provider output in chunks, honouring the response caches."""
+        if self.response_cache is not None or (cache_kind and self.semantic_cache is not None):
+            # Cache hits and stores work on whole responses
+            yield self.generate_text(
+                prompt,
+                system_instruction,
+                json_mode=False,
+                max_tokens=max_tokens,
+                cache_kind=cache_kind,
+            )
+            return
+        yield from self._stream_text(prompt, system_instruction, max_tokens=max_tokens)
+
+    def stream_refine_from_answers(
+        self,
+        initial_prompt: str,
+        answers: Dict[str, Any],
+        question_mapping: Dict[str, str],
+        system_instruction: str,
+    ) -> Iterator[str]:
+        payload = self._format_refinement_payload(initial_prompt, answers, question_mapping)
+        return self.stream_text(
+            payload,
+            system_instruction,
+            max_tokens=DEFAULT_REFINEMENT_MAX_TOKENS,
+        )
+
+    def stream_light_refine(self, prompt: str, system_instruction: str) -> Iterator[str]:
+        return self.stream_text(
+            prompt,
+            system_instruction,
+            max_tokens=DEFAULT_REFINEMENT_MAX_TOKENS,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Async API
+    #
+    # Provider SDK clients are synchronous, so these run the blocking calls in
+    # worker threads. Callers can await several requests concurrently (for
+    # example with asyncio.gather) without blocking the event loop.
+    # ------------------------------------------------------------------ #
+    async def agenerate_text(
+        self,
+        prompt: str,
+        system_instruction: str,
+        *,
+        json_mode: bool = False,
+        max_tokens: Optional[int] = None,
+        cache_kind: Optional[str] = None,
+    ) -> str:
+        return await asyncio.to_thread(
+            functools.partial(
+                self.generate_text,
+                prompt,
+                system_instruction,
+                json_mode=json_mode,
+                max_tokens=max_tokens,
+                cache_kind=cache_kind,
+            )
+        )
+
+    async def agenerate_questions(
+        self, initial_prompt: str, system_instruction: str
+    ) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.generate_questions, initial_prompt, system_instruction)
+
+    async def arefine_from_answers(
+        self,
+        initial_prompt: str,
+        answers: Dict[str, Any],
+        question_mapping: Dict[str, str],
+        system_instruction: str,
+    ) -> str:
+        return await asyncio.to_thread(
+            self.refine_from_answers, initial_prompt, answers, question_mapping, system_instruction
+        )
+
+    async def atweak_prompt(
+        self,
+        current_prompt: str,
+        tweak_instruction: str,
+        system_instruction: str,
+    ) -> str:
+        return await asyncio.to_thread(
+            self.tweak_prompt, current_prompt, tweak_instruction, system_instruction
+        )
+
+    async def alight_refine(self, prompt: str, system_instruction: str) -> str:
+        return await asyncio.to_thread(self.light_refine, prompt, system_instruction)
+
     # ------------------------------------------------------------------ #
     # Formatting helpers shared across providers
     # ------------------------------------------------------------------ #
@@ -134,26 +461,22 @@ class LLMProvider(ABC):
         answers: Dict[str, Any],
         question_mapping: Dict[str, str],
     ) -> str:
-        lines: List[str] = [
-            f"Initial Prompt: {initial_prompt}",
-            "",
-            "User's Answers to Clarifying Questions:",
-        ]
+        # Written in a single pass; the initial prompt may be several KB, so
+        # avoid building an intermediate list of lines and joining it.
+        buffer = io.StringIO()
+        write = buffer.write
+        question_text_for = question_mapping.get
+        write("Initial Prompt: ")
+        write(initial_prompt)
+        write("\n\nUser's Answers to Clarifying Questions:\n")
         for key, value in answers.items():
             if isinstance(value, list):
                 value_str = ", ".join(value) if value else "None selected"
             else:
                 value_str = value or "None provided"
-            question_text = question_mapping.get(key, key)
-            lines.append(f"- {question_text}: {value_str}")
-
-        lines.extend(
-            [
-                "",
-                "Please generate a refined, optimized prompt based on this information.",
-            ]
-        )
-        return "\n".join(lines)
+            write(f"- {question_text_for(key, key)}: {value_str}\n")
+        write("\nPlease generate a refined, optimized prompt based on this information.")
+        return buffer.getvalue()
 
     def _format_tweak_payload(self, current_prompt: str, tweak_instruction: str) -> str:
         return "\n".join(
@@ -221,7 +544,7 @@ def _append_json_instruction(prompt: str) -> str:
 
 def _parse_question_payload(provider_label: str, raw_text: str) -> Optional[Dict[str, Any]]:
     try:
-        result = json.loads(raw_text)
+        result = json_loads(raw_text)
     except json.JSONDecodeError as exc:
         logger.warning("%s returned invalid JSON: %s", provider_label, sanitize_error_message(str(exc)))
         return None
@@ -240,21 +563,38 @@ def _parse_question_payload(provider_label: str, raw_text: str) -> Optional[Dict
 class AnthropicProvider(LLMProvider):
     """Anthropic/Claude provider (also supports Z.ai)."""
 
+    supports_streaming = True
+
     def __init__(
         self,
         api_key: str,
         model_name: str = "claude-3-5-sonnet-20240620",
         base_url: Optional[str] = None,
     ) -> None:
-        import anthropic
-
         client_args = {"api_key": api_key, "timeout": DEFAULT_PROVIDER_TIMEOUT}
         if base_url:
             client_args["base_url"] = base_url
 
-        self.client = anthropic.Anthropic(**client_args)
+        # The SDK is imported and the client built on first use, keeping
+        # its import cost out of startup for sessions that never call it.
+        self._client_args = client_args
+        self._client: Any = None
 
         self.model_name = model_name
+
+    @property
+    def client(self) -> Any:
+        """Anthropic client, created on first access."""
+        if self._client is None:
+            import anthropic
+
+            self._client = anthropic.Anthropic(**self._client_args)
+        return self._client
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
+
     def _generate_text(
         self,
         prompt: str,
@@ -264,9 +604,7 @@ class AnthropicProvider(LLMProvider):
         max_tokens: Optional[int] = None,
     ) -> str:
         # Reset token usage for this call
-        self.last_input_tokens = None  # type: ignore[attr-defined]
-        self.last_output_tokens = None  # type: ignore[attr-defined]
-        self.last_total_tokens = None  # type: ignore[attr-defined]
+        self._set_token_usage(None, None, None)
         try:
             response = self.client.messages.create(
                 model=self.model_name,
@@ -279,23 +617,7 @@ class AnthropicProvider(LLMProvider):
             logger.warning("Anthropic API call failed: %s", sanitized)
             raise ProviderAPIError(f"API call failed: {sanitized}") from exc
 
-        # Capture token usage when available
-        try:
-            usage = getattr(response, "usage", None)
-            if usage is not None:
-                input_tokens = getattr(usage, "input_tokens", None)
-                output_tokens = getattr(usage, "output_tokens", None)
-                total_tokens = getattr(usage, "total_tokens", None)
-                if total_tokens is None and isinstance(input_tokens, int) and isinstance(output_tokens, int):
-                    total_tokens = input_tokens + output_tokens
-                self.last_input_tokens = input_tokens  # type: ignore[attr-defined]
-                self.last_output_tokens = output_tokens  # type: ignore[attr-defined]
-                self.last_total_tokens = total_tokens  # type: ignore[attr-defined]
-        except Exception:
-            # Token accounting is best-effort only
-            self.last_input_tokens = None  # type: ignore[attr-defined]
-            self.last_output_tokens = None  # type: ignore[attr-defined]
-            self.last_total_tokens = None  # type: ignore[attr-defined]
+        self._record_usage(response)
 
         if not response.content:
             raise RuntimeError("Anthropic API returned no content")
@@ -308,29 +630,69 @@ class AnthropicProvider(LLMProvider):
             text = str(first_block)
         return str(text)
 
+    def _record_usage(self, response: Any) -> None:
+        """Capture token usage from a response or final stream message when available."""
+        try:
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                input_tokens = getattr(usage, "input_tokens", None)
+                output_tokens = getattr(usage, "output_tokens", None)
+                total_tokens = getattr(usage, "total_tokens", None)
+                if total_tokens is None and isinstance(input_tokens, int) and isinstance(output_tokens, int):
+                    total_tokens = input_tokens + output_tokens
+                self._set_token_usage(input_tokens, output_tokens, total_tokens)
+        except Exception:
+            # Token accounting is best-effort only
+            self._set_token_usage(None, None, None)
+
+    def _stream_text(
+        self,
+        prompt: str,
+        system_instruction: str,
+        *,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream text deltas from the Messages API."""
+        self._set_token_usage(None, None, None)
+        try:
+            with self.client.messages.stream(
+                model=self.model_name,
+                max_tokens=max_tokens or DEFAULT_REFINEMENT_MAX_TOKENS,
+                system=system_instruction,
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                for text in stream.text_stream:
+                    if text:
+                        yield text
+                self._record_usage(stream.get_final_message())
+        except Exception as exc:  # pragma: no cover - network failures
+            sanitized = sanitize_error_message(str(exc))
+            logger.warning("Anthropic streaming call failed: %s", sanitized)
+            raise ProviderAPIError(f"API call failed: {sanitized}") from exc
+
     @staticmethod
     def _extract_json_block(text: str) -> str:
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            return text[start:end].strip()
-        if "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            return text[start:end].strip()
-        return text
+        # Common case: Claude returned bare JSON, so skip the fence scans entirely
+        if "```" not in text:
+            return text
+        _, sep, rest = text.partition("```json")
+        if not sep:
+            _, _, rest = text.partition("```")
+        body, _, _ = rest.partition("```")
+        return body.strip()
 
     def generate_questions(self, initial_prompt: str, system_instruction: str) -> Optional[Dict[str, Any]]:
         """Generate clarifying questions using Claude."""
-        response_text = self._generate_text(
+        response_text = self.generate_text(
             initial_prompt,
             system_instruction,
             max_tokens=DEFAULT_CLARIFICATION_MAX_TOKENS,
+            cache_kind="questions",
         )
 
         cleaned = self._extract_json_block(response_text)
         try:
-            result = json.loads(cleaned)
+            result = json_loads(cleaned)
         except json.JSONDecodeError as exc:
             logger.warning("Anthropic returned invalid JSON: %s", sanitize_error_message(str(exc)))
             return None
@@ -369,22 +731,117 @@ class GeminiProvider(LLMProvider):
     Supports both Gemini Developer API (AIza... keys) and Vertex AI (AQ... keys).
     Automatically detects API key type and routes to appropriate endpoint."""
 
+    # Distinct (system instruction, json_mode, max_tokens) combinations are few
+    # (one per prompt template), so a small bound is plenty.
+    CONFIG_CACHE_SIZE = 32
+
+    supports_streaming = True
+
     def __init__(
         self,
         api_key: str,
         model_name: str = "gemini-1.5-flash",
     ) -> None:
-        from google import genai
-
         # Detect API key type and use appropriate endpoint
         # AQ.* keys are Vertex AI, AIza.* keys are Gemini Developer API
         is_vertex_ai_key = api_key.startswith('AQ.')
 
-        self.client = genai.Client(
-            api_key=api_key,
-            vertexai=is_vertex_ai_key,  # Use Vertex AI for AQ.* keys, Gemini API for AIza.* keys
-        )
+        # google-genai pulls in a large dependency tree, so the SDK is
+        # imported and the client built on first use rather than here.
+        self._client_args = {
+            "api_key": api_key,
+            "vertexai": is_vertex_ai_key,  # Use Vertex AI for AQ.* keys, Gemini API for AIza.* keys
+        }
+        self._client: Any = None
         self.model_name = model_name
+        self._config_cache: Dict[Tuple[str, bool, Optional[int]], Any] = {}
+
+    @property
+    def client(self) -> Any:
+        """google-genai client, created on first access."""
+        if self._client is None:
+            from google import genai
+
+            self._client = genai.Client(**self._client_args)
+        return self._client
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
+
+    def _get_generation_config(
+        self,
+        system_instruction: str,
+        json_mode: bool,
+        max_tokens: Optional[int],
+    ) -> Any:
+        """Return a GenerateContentConfig, reusing one built for the same settings."""
+        cache_key = (system_instruction, json_mode, max_tokens)
+        config = self._config_cache.get(cache_key)
+        if config is not None:
+            return config
+
+        from google.genai import types
+
+        config_params: Dict[str, Any] = {
+            "system_instruction": system_instruction,
+        }
+        if max_tokens is not None:
+            config_params["max_output_tokens"] = max_tokens
+        if json_mode:
+            config_params["response_mime_type"] = "application/json"
+
+        config = types.GenerateContentConfig(**config_params)
+        if len(self._config_cache) >= self.CONFIG_CACHE_SIZE:
+            self._config_cache.clear()
+        self._config_cache[cache_key] = config
+        return config
+
+    def _record_usage(self, response: Any) -> None:
+        """Capture token usage when available (field names vary by SDK version)."""
+        try:
+            usage = getattr(response, "usage_metadata", None)
+            if usage is None and isinstance(response, dict):
+                usage = response.get("usage_metadata")
+            if usage is not None:
+                def _get(name_candidates):
+                    if isinstance(usage, dict):
+                        for name in name_candidates:
+                            value = usage.get(name)
+                            if isinstance(value, (int, float)):
+                                return int(value)
+                    else:
+                        for name in name_candidates:
+                            value = getattr(usage, name, None)
+                            if isinstance(value, (int, float)):
+                                return int(value)
+                    return None
+
+                input_tokens = _get(["input_tokens", "prompt_tokens", "prompt_token_count"])
+                output_tokens = _get(["output_tokens", "candidates_token_count", "completion_tokens"])
+                total_tokens = _get(["total_tokens", "total_token_count"])
+                if total_tokens is None and input_tokens is not None and output_tokens is not None:
+                    total_tokens = input_tokens + output_tokens
+
+                self._set_token_usage(input_tokens, output_tokens, total_tokens)
+        except Exception:
+            self._set_token_usage(None, None, None)
+
+    def _api_error(self, exc: Exception) -> ProviderAPIError:
+        """Log a failed call, print hints for common errors, and wrap it."""
+        error_msg = str(exc)
+        sanitized = sanitize_error_message(error_msg)
+        logger.warning("Gemini model %s failed: %s", self.model_name, sanitized)
+
+        # Provide helpful context for common errors
+        if "401" in error_msg or "403" in error_msg or "Unauthorized" in error_msg or "UNAUTHENTICATED" in error_msg:
+            _print_user_error("Authentication failed: Please check your API key")
+            _print_user_error("Ensure your GOOGLE_API_KEY or GEMINI_API_KEY is valid and active")
+            _print_user_error("Get your API key at: https://makersuite.google.com/app/apikey")
+        elif "404" in error_msg:
+            _print_user_error(f"Model not found: The model '{self.model_name}' may not exist or be available")
+
+        return ProviderAPIError(f"API call failed: {sanitized}")
 
     def _generate_text(
         self,
@@ -395,92 +852,65 @@ class GeminiProvider(LLMProvider):
         max_tokens: Optional[int] = None,
     ) -> str:
         """Generate text using the new google-genai SDK."""
-        from google.genai import types
-
         try:
             # Reset token usage for this call
-            self.last_input_tokens = None  # type: ignore[attr-defined]
-            self.last_output_tokens = None  # type: ignore[attr-defined]
-            self.last_total_tokens = None  # type: ignore[attr-defined]
-
-            config_params: Dict[str, Any] = {
-                "system_instruction": system_instruction,
-            }
-            if max_tokens is not None:
-                config_params["max_output_tokens"] = max_tokens
-            if json_mode:
-                config_params["response_mime_type"] = "application/json"
+            self._set_token_usage(None, None, None)
 
-            config = types.GenerateContentConfig(**config_params)
+            config = self._get_generation_config(system_instruction, json_mode, max_tokens)
 
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=prompt,
                 config=config,
             )
-
-            # Capture token usage when available (field names vary by SDK version)
-            try:
-                usage = getattr(response, "usage_metadata", None)
-                if usage is None and isinstance(response, dict):
-                    usage = response.get("usage_metadata")
-                if usage is not None:
-                    def _get(name_candidates):
-                        if isinstance(usage, dict):
-                            for name in name_candidates:
-                                value = usage.get(name)
-                                if isinstance(value, (int, float)):
-                                    return int(value)
-                        else:
-                            for name in name_candidates:
-                                value = getattr(usage, name, None)
-                                if isinstance(value, (int, float)):
-                                    return int(value)
-                        return None
-
-                    input_tokens = _get(["input_tokens", "prompt_tokens", "prompt_token_count"])
-                    output_tokens = _get(["output_tokens", "candidates_token_count", "completion_tokens"])
-                    total_tokens = _get(["total_tokens", "total_token_count"])
-                    if total_tokens is None and input_tokens is not None and output_tokens is not None:
-                        total_tokens = input_tokens + output_tokens
-
-                    self.last_input_tokens = input_tokens  # type: ignore[attr-defined]
-                    self.last_output_tokens = output_tokens  # type: ignore[attr-defined]
-                    self.last_total_tokens = total_tokens  # type: ignore[attr-defined]
-            except Exception:
-                self.last_input_tokens = None  # type: ignore[attr-defined]
-                self.last_output_tokens = None  # type: ignore[attr-defined]
-                self.last_total_tokens = None  # type: ignore[attr-defined]
+            self._record_usage(response)
 
             if hasattr(response, "text") and response.text:
                 return str(response.text)
             raise RuntimeError("Gemini response did not include text content")
 
         except Exception as exc:
-            error_msg = str(exc)
-            sanitized = sanitize_error_message(error_msg)
-            logger.warning("Gemini model %s failed: %s", self.model_name, sanitized)
-
-            # Provide helpful context for common errors
-            if "401" in error_msg or "403" in error_msg or "Unauthorized" in error_msg or "UNAUTHENTICATED" in error_msg:
-                _print_user_error("Authentication failed: Please check your API key")
-                _print_user_error("Ensure your GOOGLE_API_KEY or GEMINI_API_KEY is valid and active")
-                _print_user_error("Get your API key at: https://makersuite.google.com/app/apikey")
-            elif "404" in error_msg:
-                _print_user_error(f"Model not found: The model '{self.model_name}' may not exist or be available")
+            raise self._api_error(exc) from exc
 
-            raise ProviderAPIError(f"API call failed: {sanitized}") from exc
+    def _stream_text(
+        self,
+        prompt: str,
+        system_instruction: str,
+        *,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream text chunks with generate_content_stream."""
+        self._set_token_usage(None, None, None)
+        try:
+            config = self._get_generation_config(system_instruction, False, max_tokens)
+            produced = False
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=config,
+            ):
+                # Usage metadata is cumulative, so the last chunk carries the totals
+                self._record_usage(chunk)
+                text = getattr(chunk, "text", None)
+                if text:
+                    produced = True
+                    yield str(text)
+            if not produced:
+                raise RuntimeError("Gemini response did not include text content")
+        except Exception as exc:
+            raise self._api_error(exc) from exc
 
     def generate_questions(self, initial_prompt: str, system_instruction: str) -> Optional[Dict[str, Any]]:
         """Generate clarifying questions using Gemini."""
-        response_text = self._generate_text(
+        response_text = self.generate_text(
             initial_prompt,
             system_instruction,
             json_mode=True,
+            cache_kind="questions",
         )
 
         try:
-            result = json.loads(response_text)
+            result = json_loads(response_text)
         except json.JSONDecodeError as exc:
             logger.warning("Gemini returned invalid JSON: %s", sanitize_error_message(str(exc)))
             return None
@@ -564,9 +994,7 @@ class OpenAICompatibleProvider(LLMProvider):
         max_tokens: Optional[int] = None,
     ) -> str:
         # Reset token usage for this call
-        self.last_input_tokens = None  # type: ignore[attr-defined]
-        self.last_output_tokens = None  # type: ignore[attr-defined]
-        self.last_total_tokens = None  # type: ignore[attr-defined]
+        self._set_token_usage(None, None, None)
 
         messages = _build_chat_messages(
             system_instruction,
@@ -690,13 +1118,9 @@ class OpenAICompatibleProvider(LLMProvider):
                 total_tokens = getattr(usage, "total_tokens", None)
                 if total_tokens is None and isinstance(input_tokens, int) and isinstance(output_tokens, int):
                     total_tokens = input_tokens + output_tokens
-                self.last_input_tokens = input_tokens  # type: ignore[attr-defined]
-                self.last_output_tokens = output_tokens  # type: ignore[attr-defined]
-                self.last_total_tokens = total_tokens  # type: ignore[attr-defined]
+                self._set_token_usage(input_tokens, output_tokens, total_tokens)
         except Exception:
-            self.last_input_tokens = None  # type: ignore[attr-defined]
-            self.last_output_tokens = None  # type: ignore[attr-defined]
-            self.last_total_tokens = None  # type: ignore[attr-defined]
+            self._set_token_usage(None, None, None)
 
         if response_mode == "responses":
             text = getattr(response, "output_text", None)
@@ -719,11 +1143,12 @@ class OpenAICompatibleProvider(LLMProvider):
         return str(text)
 
     def generate_questions(self, initial_prompt: str, system_instruction: str) -> Optional[Dict[str, Any]]:
-        response_text = self._generate_text(
+        response_text = self.generate_text(
             initial_prompt,
             system_instruction,
             json_mode=True,
             max_tokens=DEFAULT_CLARIFICATION_MAX_TOKENS,
+            cache_kind="questions",
         )
         return _parse_question_payload(self._provider_label, response_text)
 
@@ -889,9 +1314,7 @@ class OpenRouterProvider(OpenAICompatibleProvider):
         url = f"{self._base_url}/chat/completions"
 
         # Reset token usage for this call
-        self.last_input_tokens = None  # type: ignore[attr-defined]
-        self.last_output_tokens = None  # type: ignore[attr-defined]
-        self.last_total_tokens = None  # type: ignore[attr-defined]
+        self._set_token_usage(None, None, None)
 
         def _post_with_model(model_name: str) -> httpx.Response:
             payload: Dict[str, Any] = {
@@ -950,13 +1373,9 @@ class OpenRouterProvider(OpenAICompatibleProvider):
                     total_tokens = usage.get("total_tokens")
                     if total_tokens is None and isinstance(input_tokens, int) and isinstance(output_tokens, int):
                         total_tokens = input_tokens + output_tokens
-                    self.last_input_tokens = input_tokens  # type: ignore[attr-defined]
-                    self.last_output_tokens = output_tokens  # type: ignore[attr-defined]
-                    self.last_total_tokens = total_tokens  # type: ignore[attr-defined]
+                    self._set_token_usage(input_tokens, output_tokens, total_tokens)
         except Exception:
-            self.last_input_tokens = None  # type: ignore[attr-defined]
-            self.last_output_tokens = None  # type: ignore[attr-defined]
-            self.last_total_tokens = None  # type: ignore[attr-defined]
+            self._set_token_usage(None, None, None)
 
         choices = data.get("choices") if isinstance(data, dict) else None
         if not choices:
@@ -1006,18 +1425,18 @@ def get_provider(provider_name: str, config: Config, model_name: Optional[str] =
         model_to_use = "openrouter/auto"
 
     if provider_name in ("google", "gemini"):
-        return GeminiProvider(
+        provider: LLMProvider = GeminiProvider(
             api_key=provider_config["api_key"],
             model_name=model_to_use,
         )
-    if provider_name == "anthropic":
-        return AnthropicProvider(
+    elif provider_name == "anthropic":
+        provider = AnthropicProvider(
             api_key=provider_config["api_key"],
             model_name=model_to_use,
             base_url=provider_config.get("base_url"),
         )
-    if provider_name == "openai":
-        return OpenAIProvider(
+    elif provider_name == "openai":
+        provider = OpenAIProvider(
             api_key=provider_config["api_key"],
             model_name=model_to_use,
             base_url=provider_config.get("base_url"),
@@ -1025,29 +1444,78 @@ def get_provider(provider_name: str, config: Config, model_name: Optional[str] =
             project=provider_config.get("project"),
             responses_only_patterns=responses_only_patterns,
         )
-    if provider_name == "groq":
-        return GroqProvider(
+    elif provider_name == "groq":
+        provider = GroqProvider(
             api_key=provider_config["api_key"],
             model_name=model_to_use,
         )
-    if provider_name == "qwen":
-        return QwenProvider(
+    elif provider_name == "qwen":
+        provider = QwenProvider(
             api_key=provider_config["api_key"],
             model_name=model_to_use,
         )
-    if provider_name == "glm":
-        return GLMProvider(
+    elif provider_name == "glm":
+        provider = GLMProvider(
             api_key=provider_config["api_key"],
             model_name=model_to_use,
             base_url=provider_config.get("base_url"),
         )
-    if provider_name == "openrouter":
-        return OpenRouterProvider(
+    elif provider_name == "openrouter":
+        provider = OpenRouterProvider(
             api_key=provider_config["api_key"],
             model_name=model_to_use,
             base_url=provider_config.get("base_url"),
         )
-    raise ValueError(f"Unknown provider: {provider_name}")
+    else:
+        raise ValueError(f"Unknown provider: {provider_name}")
+
+    if config.response_cache_enabled:
+        from promptheus.cache import get_response_cache
+
+        provider.response_cache = get_response_cache()
+    if config.semantic_cache_enabled:
+        from promptheus.cache import get_semantic_cache
+
+        provider.semantic_cache = get_semantic_cache()
+        provider.semantic_cache_threshold = config.semantic_cache_threshold
+    return provider
+
+
+# Provider instances reused across web requests, keyed by everything
+# get_provider builds them from, so each keeps its SDK client and connections
+SHARED_PROVIDERS_SIZE = 32
+_shared_providers: "OrderedDict[Tuple[Any, ...], LLMProvider]" = OrderedDict()
+_shared_providers_lock = threading.Lock()
+
+
+def get_shared_provider(provider_name: str, config: Config, model_name: Optional[str] = None) -> LLMProvider:
+    """
+    Return a provider like get_provider, reusing one built from identical settings.
+
+    The instance may serve concurrent requests, so its last_*_tokens attributes
+    are shared; read per-call usage through call_with_token_usage instead.
+    """
+    key = (
+        provider_name,
+        model_name or config.get_model(),
+        tuple(sorted(config.get_provider_config().items())),
+        config.response_cache_enabled,
+        config.semantic_cache_enabled and config.semantic_cache_threshold,
+    )
+    with _shared_providers_lock:
+        provider = _shared_providers.get(key)
+        if provider is not None:
+            _shared_providers.move_to_end(key)
+            return provider
+
+    # Built outside the lock; if two requests race, both use the first stored
+    provider = get_provider(provider_name, config, model_name)
+    with _shared_providers_lock:
+        provider = _shared_providers.setdefault(key, provider)
+        _shared_providers.move_to_end(key)
+        while len(_shared_providers) > SHARED_PROVIDERS_SIZE:
+            _shared_providers.popitem(last=False)
+    return provider
 
 
 def get_available_providers(config) -> Dict[str, Any]:
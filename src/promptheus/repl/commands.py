@@ -1,10 +1,17 @@
 """REPL command parsing and handling functionality."""
 
 import logging
+import platform
+import sys
+import webbrowser
 from argparse import Namespace
 from typing import Callable, Optional
 
+import questionary
 from prompt_toolkit.formatted_text import HTML
+from rich.console import Group
+from rich.highlighter import ReprHighlighter
+from rich.text import Text
 
 from promptheus.config import Config
 from promptheus.constants import VERSION, GITHUB_REPO, GITHUB_ISSUES
@@ -17,21 +24,26 @@ MessageSink = Callable[[str], None]
 
 
 def create_command_registry():
-    """Create a registry of command handlers for extensibility."""
+    """
+    Create a registry of command handlers for extensibility.
+
+    Every handler takes (args_list, app_config, args, console, notify,
+    last_result=None) and returns "handled", "exit", or
+    ("load_prompt", prompt_text) when the command supplies a prompt to process.
+    """
     from .history_view import display_history
     from promptheus.utils import copy_to_clipboard
     from promptheus.history import get_history
 
-    def handle_about(args_list, app_config, args, console, notify):
+    def handle_about(args_list, app_config, args, console, notify, last_result=None):
         show_about(console, app_config)
         return "handled"
 
-    def handle_bug(args_list, app_config, args, console, notify):
+    def handle_bug(args_list, app_config, args, console, notify, last_result=None):
         show_bug_report(console)
         return "handled"
 
-    def handle_clear_history(args_list, app_config, args, console, notify):
-        import questionary
+    def handle_clear_history(args_list, app_config, args, console, notify, last_result=None):
         try:
             confirm = questionary.confirm(
                 "Are you sure you want to clear all history?",
@@ -51,15 +63,19 @@ def create_command_registry():
             console.print("[yellow]No result to copy yet. Process a prompt first.[/yellow]")
         return "handled"
 
-    def handle_help(args_list, app_config, args, console, notify):
+    def handle_exit(args_list, app_config, args, console, notify, last_result=None):
+        console.print("[bold yellow]Goodbye![/bold yellow]")
+        return "exit"
+
+    def handle_help(args_list, app_config, args, console, notify, last_result=None):
         show_help(console)
         return "handled"
 
-    def handle_history(args_list, app_config, args, console, notify):
+    def handle_history(args_list, app_config, args, console, notify, last_result=None):
         display_history(console, notify)
         return "handled"
 
-    def handle_load(args_list, app_config, args, console, notify):
+    def handle_load(args_list, app_config, args, console, notify, last_result=None):
         if len(args_list) > 0:
             try:
                 index = int(args_list[0])
@@ -84,85 +100,93 @@ def create_command_registry():
         'bug': handle_bug,
         'clear-history': handle_clear_history,
         'copy': handle_copy,
+        'exit': handle_exit,
         'help': handle_help,
         'history': handle_history,
         'load': handle_load,
+        'quit': handle_exit,
     }
 
 
+_HELP_LINES = (
+    "",
+    "[bold cyan]Session Commands:[/bold cyan]",
+    "",
+    "  [bold]/set model <name>[/bold]     Change model (e.g., /set model gpt-4)",
+    "  [bold]/set provider <name>[/bold]  Change AI provider (e.g., /set provider claude)",
+    "  [bold]/status[/bold]               Show current session settings",
+    "  [bold]/toggle skip-questions[/bold] Toggle skip-questions mode on/off",
+    "  [bold]/toggle refine[/bold]        Toggle refine mode on/off",
+    "",
+    "[bold cyan]Other Commands:[/bold cyan]",
+    "",
+    "  [bold]/about[/bold]                Show version info",
+    "  [bold]/bug[/bold]                  Submit a bug report",
+    "  [bold]/clear-history[/bold]        Clear all history",
+    "  [bold]/copy[/bold]                 Copy the last result to clipboard",
+    "  [bold]/exit[/bold] or [bold]/quit[/bold]       Exit Promptheus",
+    "  [bold]/help[/bold]                 Show this help message",
+    "  [bold]/history[/bold]              View recent prompts",
+    "  [bold]/load <number>[/bold]        Load a prompt from history",
+    "",
+    "[bold cyan]Key Bindings:[/bold cyan]",
+    "",
+    "  [bold]Enter[/bold]                 Submit your prompt",
+    "  [bold]Shift+Enter[/bold]           Add a new line (multiline input)",
+    "  [bold]Option/Alt+Enter[/bold]      Alternate shortcut for new line",
+    "  [bold]Ctrl+C[/bold]                Cancel input (press twice to exit)",
+    "  [bold]Ctrl+D[/bold]                Exit Promptheus",
+    "",
+    "[dim]Tip: Type / then Tab to see all available commands[/dim]",
+    "",
+)
+
+# The help text never changes, so its markup is parsed (and highlighted the
+# way console.print would) once at import
+_highlight = ReprHighlighter()
+HELP_RENDERABLE = Group(*(_highlight(Text.from_markup(line)) for line in _HELP_LINES))
+
+
 def show_help(console) -> None:
     """Display help information about available commands."""
-    console.print()
-    console.print("[bold cyan]Session Commands:[/bold cyan]")
-    console.print()
-    console.print("  [bold]/set model <name>[/bold]     Change model (e.g., /set model gpt-4)")
-    console.print("  [bold]/set provider <name>[/bold]  Change AI provider (e.g., /set provider claude)")
-    console.print("  [bold]/status[/bold]               Show current session settings")
-    console.print("  [bold]/toggle skip-questions[/bold] Toggle skip-questions mode on/off")
-    console.print("  [bold]/toggle refine[/bold]        Toggle refine mode on/off")
-    console.print()
-    console.print("[bold cyan]Other Commands:[/bold cyan]")
-    console.print()
-    console.print("  [bold]/about[/bold]                Show version info")
-    console.print("  [bold]/bug[/bold]                  Submit a bug report")
-    console.print("  [bold]/clear-history[/bold]        Clear all history")
-    console.print("  [bold]/copy[/bold]                 Copy the last result to clipboard")
-    console.print("  [bold]/exit[/bold] or [bold]/quit[/bold]       Exit Promptheus")
-    console.print("  [bold]/help[/bold]                 Show this help message")
-    console.print("  [bold]/history[/bold]              View recent prompts")
-    console.print("  [bold]/load <number>[/bold]        Load a prompt from history")
-    console.print()
-    console.print("[bold cyan]Key Bindings:[/bold cyan]")
-    console.print()
-    console.print("  [bold]Enter[/bold]                 Submit your prompt")
-    console.print("  [bold]Shift+Enter[/bold]           Add a new line (multiline input)")
-    console.print("  [bold]Option/Alt+Enter[/bold]      Alternate shortcut for new line")
-    console.print("  [bold]Ctrl+C[/bold]                Cancel input (press twice to exit)")
-    console.print("  [bold]Ctrl+D[/bold]                Exit Promptheus")
-    console.print()
-    console.print("[dim]Tip: Type / then Tab to see all available commands[/dim]")
-    console.print()
+    console.print(HELP_RENDERABLE)
 
 
 def show_about(console, app_config: Config) -> None:
     """Display version and system information."""
-    import platform
-    import sys
-
-    console.print()
-    console.print("[bold cyan]Promptheus - AI-powered Prompt Engineering[/bold cyan]")
-    console.print()
-    console.print(f"  [bold]Version:[/bold]       {VERSION}")
-    console.print(f"  [bold]GitHub:[/bold]        {GITHUB_REPO}")
-    console.print()
-    console.print("[bold cyan]System Information:[/bold cyan]")
-    console.print()
-    console.print(f"  [bold]Python:[/bold]        {sys.version.split()[0]}")
-    console.print(f"  [bold]Platform:[/bold]      {platform.system()} {platform.release()}")
-    console.print()
-    console.print("[bold cyan]Current Configuration:[/bold cyan]")
-    console.print()
-    console.print(f"  [bold]Provider:[/bold]      {app_config.provider or 'auto-detect'}")
-    console.print(f"  [bold]Model:[/bold]         {app_config.get_model() or 'default'}")
+    lines = [
+        "",
+        "[bold cyan]Promptheus - AI-powered Prompt Engineering[/bold cyan]",
+        "",
+        f"  [bold]Version:[/bold]       {VERSION}",
+        f"  [bold]GitHub:[/bold]        {GITHUB_REPO}",
+        "",
+        "[bold cyan]System Information:[/bold cyan]",
+        "",
+        f"  [bold]Python:[/bold]        {sys.version.split()[0]}",
+        f"  [bold]Platform:[/bold]      {platform.system()} {platform.release()}",
+        "",
+        "[bold cyan]Current Configuration:[/bold cyan]",
+        "",
+        f"  [bold]Provider:[/bold]      {app_config.provider or 'auto-detect'}",
+        f"  [bold]Model:[/bold]         {app_config.get_model() or 'default'}",
+    ]
 
     configured = app_config.get_configured_providers()
     if configured:
-        console.print(f"  [bold]Available:[/bold]     {', '.join(configured)}")
-    console.print()
+        lines.append(f"  [bold]Available:[/bold]     {', '.join(configured)}")
+    lines.append("")
+    # One print keeps the whole panel to a single markup parse and write
+    console.print("\n".join(lines))
 
 
 def show_bug_report(console) -> None:
     """Display bug report information and optionally open GitHub issues."""
-    import webbrowser
-    import questionary
-
-    console.print()
-    console.print("[bold cyan]Bug Report[/bold cyan]")
-    console.print()
-    console.print("Found a bug? We'd love to hear about it!")
-    console.print()
-    console.print(f"  [bold]Report issues at:[/bold] {GITHUB_ISSUES}")
-    console.print()
+    console.print(
+        "\n[bold cyan]Bug Report[/bold cyan]\n\n"
+        "Found a bug? We'd love to hear about it!\n\n"
+        f"  [bold]Report issues at:[/bold] {GITHUB_ISSUES}\n"
+    )
 
     try:
         open_browser = questionary.confirm(
@@ -183,22 +207,96 @@ def show_bug_report(console) -> None:
 
 def show_status(console, app_config: Config, args: Namespace) -> None:
     """Display current session settings."""
-    console.print()
-    console.print("[bold cyan]Current Session Settings:[/bold cyan]")
-    console.print()
-    console.print(f"  [bold]Provider:[/bold]      {app_config.provider or 'auto-detect'}")
-    console.print(f"  [bold]Model:[/bold]         {app_config.get_model() or 'default'}")
-    console.print()
-    console.print("[bold cyan]Active Modes:[/bold cyan]")
-    console.print()
-    console.print(f"  [bold]Skip questions:[/bold] {'ON' if getattr(args, 'skip_questions', False) else 'OFF'}")
-    console.print(f"  [bold]Refine mode:[/bold]    {'ON' if args.refine else 'OFF'}")
-    console.print()
+    lines = [
+        "",
+        "[bold cyan]Current Session Settings:[/bold cyan]",
+        "",
+        f"  [bold]Provider:[/bold]      {app_config.provider or 'auto-detect'}",
+        f"  [bold]Model:[/bold]         {app_config.get_model() or 'default'}",
+        "",
+        "[bold cyan]Active Modes:[/bold cyan]",
+        "",
+        f"  [bold]Skip questions:[/bold] {'ON' if getattr(args, 'skip_questions', False) else 'OFF'}",
+        f"  [bold]Refine mode:[/bold]    {'ON' if args.refine else 'OFF'}",
+        "",
+    ]
 
     configured = app_config.get_configured_providers()
     if configured:
-        console.print(f"  [bold]Available providers:[/bold] {', '.join(configured)}")
-        console.print()
+        lines.append(f"  [bold]Available providers:[/bold] {', '.join(configured)}")
+        lines.append("")
+    console.print("\n".join(lines))
+
+
+def _handle_set(parts, app_config: Config, args: Namespace, console, notify: MessageSink) -> str:
+    if len(parts) < 3:
+        notify("[yellow]Usage: /set provider <name> or /set model <name>[/yellow]")
+        return "handled"
+
+    setting = parts[1].lower()
+    value = parts[2]
+
+    if setting == "provider":
+        configured = app_config.get_configured_providers()
+        if value not in configured:
+            notify(f"[red]✗[/red] Provider '{value}' is not configured or available")
+            notify(f"[dim]Available providers: {', '.join(configured)}[/dim]")
+            return "handled"
+
+        app_config.set_provider(value)
+        notify(f"[green]✓[/green] Provider set to '{value}'")
+        return "reload_provider"
+
+    elif setting == "model":
+        app_config.set_model(value)
+        notify(f"[green]✓[/green] Model set to '{value}'")
+        return "reload_provider"
+
+    else:
+        notify(f"[yellow]Unknown setting: {setting}. Use 'provider' or 'model'.[/yellow]")
+        return "handled"
+
+
+def _handle_toggle(parts, app_config: Config, args: Namespace, console, notify: MessageSink) -> str:
+    if len(parts) < 2:
+        notify("[yellow]Usage: /toggle refine or /toggle skip-questions[/yellow]")
+        return "handled"
+
+    mode = parts[1].lower()
+
+    if mode == "refine":
+        args.refine = not args.refine
+        if args.refine:
+            args.skip_questions = False  # Mutually exclusive
+        status = "ON" if args.refine else "OFF"
+        notify(f"[green]✓[/green] Refine mode is now {status}")
+        return "handled"
+
+    elif mode == "skip-questions":
+        args.skip_questions = not args.skip_questions
+        if args.skip_questions:
+            args.refine = False  # Mutually exclusive
+        status = "ON" if args.skip_questions else "OFF"
+        notify(f"[green]✓[/green] Skip-questions mode is now {status}")
+        return "handled"
+
+    else:
+        notify(f"[yellow]Unknown mode: {mode}. Use 'refine' or 'skip-questions'.[/yellow]")
+        return "handled"
+
+
+def _handle_status(parts, app_config: Config, args: Namespace, console, notify: MessageSink) -> str:
+    show_status(console, app_config, args)
+    return "handled"
+
+
+# Session commands change settings in place; each handler takes
+# (parts, app_config, args, console, notify) and returns the reload signal
+_SESSION_HANDLERS = {
+    "set": _handle_set,
+    "toggle": _handle_toggle,
+    "status": _handle_status,
+}
 
 
 def handle_session_command(
@@ -221,69 +319,11 @@ def handle_session_command(
         return None
 
     command = parts[0][1:].lower()  # Remove the '/' and normalize
-
-    if command == "set":
-        if len(parts) < 3:
-            notify("[yellow]Usage: /set provider <name> or /set model <name>[/yellow]")
-            return "handled"
-
-        setting = parts[1].lower()
-        value = parts[2]
-
-        if setting == "provider":
-            configured = app_config.get_configured_providers()
-            if value not in configured:
-                notify(f"[red]✗[/red] Provider '{value}' is not configured or available")
-                notify(f"[dim]Available providers: {', '.join(configured)}[/dim]")
-                return "handled"
-
-            app_config.set_provider(value)
-            notify(f"[green]✓[/green] Provider set to '{value}'")
-            return "reload_provider"
-
-        elif setting == "model":
-            app_config.set_model(value)
-            notify(f"[green]✓[/green] Model set to '{value}'")
-            return "reload_provider"
-
-        else:
-            notify(f"[yellow]Unknown setting: {setting}. Use 'provider' or 'model'.[/yellow]")
-            return "handled"
-
-    elif command == "toggle":
-        if len(parts) < 2:
-            notify("[yellow]Usage: /toggle refine or /toggle skip-questions[/yellow]")
-            return "handled"
-
-        mode = parts[1].lower()
-
-        if mode == "refine":
-            args.refine = not args.refine
-            if args.refine:
-                args.skip_questions = False  # Mutually exclusive
-            status = "ON" if args.refine else "OFF"
-            notify(f"[green]✓[/green] Refine mode is now {status}")
-            return "handled"
-
-        elif mode == "skip-questions":
-            args.skip_questions = not args.skip_questions
-            if args.skip_questions:
-                args.refine = False  # Mutually exclusive
-            status = "ON" if args.skip_questions else "OFF"
-            notify(f"[green]✓[/green] Skip-questions mode is now {status}")
-            return "handled"
-
-        else:
-            notify(f"[yellow]Unknown mode: {mode}. Use 'refine' or 'skip-questions'.[/yellow]")
-            return "handled"
-
-    elif command == "status":
-        show_status(console, app_config, args)
-        return "handled"
-
-    else:
-        # Not a session command, return None to let the existing handler deal with it
+    handler = _SESSION_HANDLERS.get(command)
+    if handler is None:
+        # Not a session command, let the command registry deal with it
         return None
+    return handler(parts, app_config, args, console, notify)
 
 
 def reload_provider_instance(
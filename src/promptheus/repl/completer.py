@@ -1,6 +1,9 @@
 """Command completion functionality for the REPL."""
 
-from typing import Dict
+import bisect
+import re
+import time
+from typing import Dict, List, Optional, Tuple
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
@@ -8,6 +11,9 @@ from prompt_toolkit.document import Document
 from promptheus.config import Config
 from promptheus.history import get_history
 
+# History indices are digits only; anything else can't match a /load entry
+_LOAD_INDEX_RE = re.compile(r"\d*")
+
 
 class CommandCompleter(Completer):
     """
@@ -16,7 +22,8 @@ class CommandCompleter(Completer):
     Shows completions when user types / with command descriptions.
     """
 
-    def __init__(self):
+    def __init__(self, app_config: Optional[Config] = None):
+        self._app_config = app_config
         self.commands = {
             'about': 'Show version info',
             'bug': 'Submit a bug report',
@@ -31,6 +38,69 @@ class CommandCompleter(Completer):
             'status': 'Show current session settings',
             'toggle': 'Toggle refine or skip-questions mode (e.g., /toggle refine)',
         }
+        # Sorted once so prefix lookups can bisect instead of scanning every command
+        self._sorted_keys: List[str] = sorted(self.commands)
+        # (index, preview) pairs for /load completions, refreshed at most
+        # every RECENT_HISTORY_TTL seconds instead of on every keystroke
+        self._load_previews: List[Tuple[str, str]] = []
+        self._load_previews_at: float = float("-inf")
+        # Configured providers for /set provider, cached the same way
+        self._providers: List[str] = []
+        self._providers_at: float = float("-inf")
+        # Completion objects per typed provider prefix, reused across keystrokes
+        self._provider_completions: Dict[str, List[Completion]] = {}
+        self._provider_completions_for: List[str] = []
+
+    RECENT_HISTORY_TTL = 2.0  # seconds
+    PROVIDERS_TTL = 2.0  # seconds
+
+    def _get_load_previews(self) -> List[Tuple[str, str]]:
+        """Return recent history previews, cached briefly across keystrokes."""
+        now = time.monotonic()
+        if now - self._load_previews_at >= self.RECENT_HISTORY_TTL:
+            self._load_previews = get_history().get_recent_previews(20)
+            self._load_previews_at = now
+        return self._load_previews
+
+    def _get_configured_providers(self) -> List[str]:
+        """Return configured provider names, cached briefly across keystrokes."""
+        now = time.monotonic()
+        if now - self._providers_at >= self.PROVIDERS_TTL:
+            config = self._app_config if self._app_config is not None else Config()
+            self._providers = config.get_configured_providers()
+            self._providers_at = now
+        return self._providers
+
+    def _get_provider_completions(self, search_term: str) -> List[Completion]:
+        """Return /set provider completions for search_term, built once per prefix."""
+        providers = self._get_configured_providers()
+        if providers != self._provider_completions_for:
+            self._provider_completions = {}
+            self._provider_completions_for = providers
+        completions = self._provider_completions.get(search_term)
+        if completions is None:
+            completions = [
+                Completion(
+                    provider,
+                    start_position=-len(search_term),
+                    display=provider,
+                    display_meta=f'Switch to {provider}',
+                )
+                for provider in providers
+                if provider.startswith(search_term)
+            ]
+            if completions:
+                # Only prefixes of real providers are kept, so the memo stays small
+                self._provider_completions[search_term] = completions
+        return completions
+
+    def invalidate_providers(self) -> None:
+        """Drop the cached provider list, e.g. after the session's provider changes."""
+        self._providers_at = float("-inf")
+
+    def invalidate_history(self) -> None:
+        """Drop the cached /load history, e.g. after a prompt is saved or history is cleared."""
+        self._load_previews_at = float("-inf")
 
     def get_completions(self, document: Document, complete_event):
         """Generate completions for the current document."""
@@ -65,29 +135,23 @@ class CommandCompleter(Completer):
         if len(parts) == 1 and not has_trailing_space:
             # Completing the command itself
             search_term = command
-            for cmd, description in self.commands.items():
-                if cmd.startswith(search_term):
-                    yield Completion(
-                        cmd,
-                        start_position=-len(search_term),
-                        display=cmd,
-                        display_meta=description,
-                    )
+            sorted_keys = self._sorted_keys
+            index = bisect.bisect_left(sorted_keys, search_term)
+            while index < len(sorted_keys) and sorted_keys[index].startswith(search_term):
+                cmd = sorted_keys[index]
+                yield Completion(
+                    cmd,
+                    start_position=-len(search_term),
+                    display=cmd,
+                    display_meta=self.commands[cmd],
+                )
+                index += 1
         elif (len(parts) == 2 and has_trailing_space and command == 'set' and parts[1] == 'provider') or \
              (len(parts) == 3 and command == 'set' and parts[1] == 'provider'):
             # Completing /set provider with available providers (must check before general case)
             try:
-                config = Config()
-                providers = config.get_configured_providers()
                 search_term = parts[2] if len(parts) == 3 else ''
-                for provider in providers:
-                    if provider.startswith(search_term):
-                        yield Completion(
-                            provider,
-                            start_position=-len(search_term),
-                            display=provider,
-                            display_meta=f'Switch to {provider}',
-                        )
+                yield from self._get_provider_completions(search_term)
             except Exception:
                 pass
 
@@ -97,15 +161,11 @@ class CommandCompleter(Completer):
 
             if command == 'load':
                 # Completing /load with history indices
+                if not _LOAD_INDEX_RE.fullmatch(search_term):
+                    return
                 try:
-                    history = get_history()
-                    recent = history.get_recent(20)
-                    for idx, entry in enumerate(recent, 1):
-                        idx_str = str(idx)
+                    for idx_str, preview in self._get_load_previews():
                         if idx_str.startswith(search_term):
-                            preview = entry.original_prompt[:50]
-                            if len(entry.original_prompt) > 50:
-                                preview += "..."
                             yield Completion(
                                 idx_str,
                                 start_position=-len(search_term),
@@ -1,14 +1,38 @@
 """History viewing functionality for the REPL."""
 
+import functools
 import logging
+from datetime import datetime
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
+from rich.text import Text
 
 from promptheus.history import get_history
 
 logger = logging.getLogger(__name__)
 
+PREVIEW_LENGTH = 60
+# Longer listings go through the terminal pager instead of flooding the scrollback
+PAGER_THRESHOLD = 20
+_FLATTEN_NEWLINES = str.maketrans({"\n": " ", "\r": " "})
+
+
+def _preview(text: str, limit: int = PREVIEW_LENGTH) -> str:
+    """Truncate text for a history row and flatten it onto one line."""
+    if len(text) > limit:
+        text = text[:limit] + "..."
+    return text.translate(_FLATTEN_NEWLINES)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: str) -> str:
+    """Format a stored ISO timestamp for a history row; entries never change, so cache it."""
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%m-%d %H:%M")
+    except ValueError:
+        return timestamp[5:16]
+
 
 def display_history(console: Console, notify, limit: int = 20) -> None:
     """Display recent history entries."""
@@ -27,26 +51,18 @@ def display_history(console: Console, notify, limit: int = 20) -> None:
     table.add_column("Original → Refined", style="white")
 
     for idx, entry in enumerate(entries, 1):
-        try:
-            from datetime import datetime
-
-            dt = datetime.fromisoformat(entry.timestamp)
-            timestamp_str = dt.strftime("%m-%d %H:%M")
-        except Exception:  # pragma: no cover - defensive
-            timestamp_str = entry.timestamp[5:16]
-
-        original = entry.original_prompt[:60] + "..." if len(entry.original_prompt) > 60 else entry.original_prompt
-        refined = entry.refined_prompt[:60] + "..." if len(entry.refined_prompt) > 60 else entry.refined_prompt
-
-        original = original.replace("\n", " ")
-        refined = refined.replace("\n", " ")
-
+        timestamp_str = _format_timestamp(entry.timestamp)
+        original = _preview(entry.original_prompt)
+        refined = _preview(entry.refined_prompt)
         task_type = entry.task_type or "unknown"
-        combined = f"[white]{original}[/white]\n[dim]→[/dim] [yellow]{refined}[/yellow]"
+        # Styled segments skip markup parsing (and treat brackets in prompts literally)
+        combined = Text.assemble((original, "white"), "\n", ("→", "dim"), " ", (refined, "yellow"))
 
         table.add_row(str(idx), timestamp_str, task_type, combined)
 
-    console.print()
-    console.print(table)
-    console.print()
+    if len(entries) > PAGER_THRESHOLD and console.is_terminal is True:
+        with console.pager(styles=True):
+            console.print(table)
+    else:
+        console.print(Group(Text(), table, Text()))
     notify("[dim]Use '/load <number>' to load a prompt from history[/dim]")
\ No newline at end of file
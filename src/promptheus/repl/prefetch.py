@@ -0,0 +1,81 @@
+"""Background prefetch of clarifying questions while the user is typing."""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from promptheus.prompts import CLARIFICATION_SYSTEM_INSTRUCTION
+from promptheus.providers import LLMProvider, prefetch_call
+from promptheus.utils import sanitize_error_message
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_DELAY = 0.3  # seconds of idle typing before a draft is prefetched
+PREFETCH_MIN_CHARS = 20  # shorter drafts are too likely to change
+
+
+class QuestionPrefetcher:
+    """
+    Generate clarifying questions for the current draft once typing pauses.
+
+    Each text change restarts a short debounce timer; when it fires, the
+    draft's questions are requested on a single worker thread through
+    prefetch_call, so submitting the same text reuses (or joins) that
+    response. Drafts that are edited further are simply superseded.
+    """
+
+    def __init__(
+        self,
+        get_provider: Callable[[], LLMProvider],
+        delay: float = PREFETCH_DELAY,
+        min_chars: int = PREFETCH_MIN_CHARS,
+    ) -> None:
+        self._get_provider = get_provider
+        self.delay = delay
+        self.min_chars = min_chars
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="promptheus-prefetch")
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._draft: Optional[str] = None
+        self._future: Optional[Future] = None
+
+    def on_text_changed(self, text: str) -> None:
+        """Restart the debounce timer for the latest buffer text."""
+        draft = text.strip()
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if draft.startswith("/") or len(draft) < self.min_chars:
+                return
+            self._timer = threading.Timer(self.delay, self._prefetch, args=(draft,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _prefetch(self, draft: str) -> None:
+        """Submit a question request for draft unless it is already underway."""
+        with self._lock:
+            if draft == self._draft:
+                return
+            if self._future is not None:
+                # Drop a superseded draft that has not started yet
+                self._future.cancel()
+            self._draft = draft
+            self._future = self._executor.submit(self._generate, self._get_provider(), draft)
+
+    @staticmethod
+    def _generate(provider: LLMProvider, draft: str) -> None:
+        try:
+            prefetch_call(provider.generate_questions, draft, CLARIFICATION_SYSTEM_INSTRUCTION)
+        except Exception as exc:
+            # The real request will retry and surface any error to the user
+            logger.debug("Question prefetch failed: %s", sanitize_error_message(str(exc)))
+
+    def close(self) -> None:
+        """Cancel pending work and stop the worker thread."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
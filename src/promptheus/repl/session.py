@@ -1,9 +1,11 @@
 """Main REPL session functionality."""
 
+import functools
 import logging
 import time
 from argparse import Namespace
-from typing import Callable, Optional, Tuple
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
 import questionary
 from prompt_toolkit import PromptSession
@@ -11,8 +13,7 @@ from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.history import FileHistory
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.styles import Style
-from rich.console import Console
-from rich.markdown import Markdown
+from rich.console import Console, Group
 from rich.text import Text
 
 from promptheus.config import Config
@@ -20,19 +21,21 @@ from promptheus.constants import VERSION
 from promptheus.history import get_history
 from promptheus.io_context import IOContext
 from promptheus.providers import LLMProvider
-from promptheus.utils import sanitize_error_message, copy_to_clipboard
+from promptheus.utils import sanitize_error_message
 from promptheus.exceptions import PromptCancelled
 
 from .commands import (
     show_help,
-    show_about,
-    show_bug_report,
     show_status,
     handle_session_command,
     reload_provider_instance,
+    create_command_registry,
 )
 from .completer import CommandCompleter
-from .history_view import display_history
+from .prefetch import QuestionPrefetcher
+
+if TYPE_CHECKING:  # pragma: no cover - typing support only
+    from rich.markdown import Markdown
 
 logger = logging.getLogger(__name__)
 
@@ -43,11 +46,59 @@ ProcessPromptFn = Callable[
 ]
 
 
-SHIFT_ENTER_SEQUENCES = {
-    "\x1b[27;2;13~",  # Xterm modifyOtherKeys format
-    "\x1b[13;2~",     # Some terminals (CSI 13;2~)
-    "\x1b[13;2u",     # Kitty/WezTerm CSI-u format
-}
+# Shift+Enter escape sequences all start with ESC [, so the Enter handler
+# matches on these distinguishing suffixes with a single endswith()
+SHIFT_ENTER_SUFFIXES = (
+    "27;2;13~",  # Xterm modifyOtherKeys format
+    "13;2~",     # Some terminals (CSI 13;2~)
+    "13;2u",     # Kitty/WezTerm CSI-u format
+)
+
+PROMPT_MESSAGE = HTML('<b>&gt; </b>')
+
+EXIT_WORDS = frozenset({"exit", "quit", "q"})
+# Longer input can't be an exit word, so it is never lowercased (prompts can be long)
+_EXIT_WORD_MAX_LEN = max(map(len, EXIT_WORDS))
+
+BLANK_LINE = Text()
+
+# Neutral, subtle styling - black text on gray background
+REPL_STYLE = Style.from_dict({
+    'bottom-toolbar': 'bg:#808080 #000000',
+    'completion-menu': 'bg:#404040 #ffffff',
+    'completion-menu.completion': 'bg:#404040 #ffffff',
+    'completion-menu.completion.current': 'bg:#606060 #ffffff bold',
+    'completion-menu.meta': 'bg:#404040 #888888',
+    'completion-menu.meta.current': 'bg:#606060 #ffffff',
+})
+
+
+@dataclass(slots=True)
+class ReplState:
+    """Mutable per-session state for the interactive loop."""
+
+    current_provider: LLMProvider  # May be reloaded by /set during the session
+    prompt_count: int = 1
+    last_result: Optional[str] = None  # Last refined prompt, for /copy
+    consecutive_ctrl_c: int = 0  # Consecutive Ctrl+C presses in plain mode
+    last_ctrl_c_time: float = 0.0  # Time of last Ctrl+C, for graceful exit
+    transient_toolbar_message: Optional[str] = None
+    show_transient: bool = False  # Show the transient message on the next prompt
+
+
+@functools.lru_cache(maxsize=64)
+def _render_markdown(text: str) -> "Markdown":
+    """
+    Parse text into a Rich Markdown renderable, reusing earlier parses.
+
+    Markdown parses its source once at construction and renders from the
+    parsed tokens, so one instance can be printed any number of times.
+    """
+    # rich.markdown pulls in markdown-it and Pygments, so it is imported on
+    # the first rendered result rather than on every CLI start
+    from rich.markdown import Markdown
+
+    return Markdown(text)
 
 
 def create_key_bindings() -> KeyBindings:
@@ -63,7 +114,7 @@ def create_key_bindings() -> KeyBindings:
     def _(event):
         """Submit on Enter, unless Shift-modified sequences are detected."""
         data = event.key_sequence[-1].data or ""
-        if data in SHIFT_ENTER_SEQUENCES:
+        if data.startswith("\x1b[") and data.endswith(SHIFT_ENTER_SUFFIXES):
             event.current_buffer.insert_text('\n')
         else:
             event.current_buffer.validate_and_handle()
@@ -81,18 +132,24 @@ def create_key_bindings() -> KeyBindings:
     return kb
 
 
+@functools.lru_cache(maxsize=8)
 def format_toolbar_text(provider: str, model: str) -> Text:
     """
     Return a plain-text version of the toolbar so we can print it into the scrollback.
+
+    Cached per provider/model; callers must not modify the returned Text.
     """
     text = Text(f"{provider} | {model} │ [Enter] submit │ [Shift+Enter] new line │ [/] commands")
     text.stylize("dim")
     return text
 
 
+@functools.lru_cache(maxsize=8)
 def create_bottom_toolbar(provider: str, model: str) -> HTML:
     """
     Create the bottom toolbar with provider/model info and key bindings.
+
+    Cached per provider/model so the markup is parsed once, not every prompt.
     """
     return HTML(
         f' {provider} | {model} │ '
@@ -100,6 +157,18 @@ def create_bottom_toolbar(provider: str, model: str) -> HTML:
     )
 
 
+@functools.lru_cache(maxsize=4)
+def transient_toolbar(message: str) -> Tuple[Text, HTML]:
+    """
+    Create the highlighted plain-text and bottom toolbars for a one-off message.
+
+    Cached because the messages are fixed strings such as the Ctrl+C hint.
+    """
+    text = Text(message)
+    text.stylize("bold yellow")
+    return text, HTML(f'<b><span style="color:yellow">{message}</span></b>')
+
+
 def display_clean_header(console, app_config: Config, args: Namespace) -> None:
     """Display a clean, minimal header similar to OpenAI Codex."""
     provider_name = app_config.provider or "auto"
@@ -125,27 +194,34 @@ def display_clean_header(console, app_config: Config, args: Namespace) -> None:
         line5.ljust(box_width),
     ]
 
-    # Print the top of the box
-    console.print("╭" + "─" * box_width + "╮")
+    # Box and getting-started text go out in one print
+    lines = [
+        "╭" + "─" * box_width + "╮",
+        *(f"│{line}│" for line in header_lines),
+        "╰" + "─" * box_width + "╯",
+        "",
+        "To get started, provide a prompt or try one of these commands:",
+        "/help - show available commands",
+        "/status - show current session",
+        "/set - change provider or model",
+        "/toggle - toggle refine or skip-questions mode",
+        "/copy - copy last result to clipboard",
+        "/history - view prompt history",
+        "/load <n> - load prompt by number",
+        "",
+    ]
+    console.print("\n".join(lines))
 
-    # Print each line inside the box
-    for line in header_lines:
-        console.print(f"│{line}│")
 
-    # Print the bottom of the box
-    console.print("╰" + "─" * box_width + "╯")
+@functools.lru_cache(maxsize=4)
+def _prompt_history(path: str) -> FileHistory:
+    """
+    Return the shared FileHistory for path.
 
-    # Print the getting started text
-    console.print()
-    console.print("To get started, provide a prompt or try one of these commands:")
-    console.print("/help - show available commands")
-    console.print("/status - show current session")
-    console.print("/set - change provider or model")
-    console.print("/toggle - toggle refine or skip-questions mode")
-    console.print("/copy - copy last result to clipboard")
-    console.print("/history - view prompt history")
-    console.print("/load <n> - load prompt by number")
-    console.print()
+    FileHistory keeps the lines it has read, so a REPL restarted in the same
+    process reuses them instead of reparsing the history file.
+    """
+    return FileHistory(path)
 
 
 def interactive_mode(
@@ -179,76 +255,52 @@ def interactive_mode(
     # Display clean header
     display_clean_header(console, app_config, args)
 
-    prompt_count = 1
-    last_ctrl_c_time = [0.0]  # Track time of last Ctrl+C for graceful exit
     use_prompt_toolkit = not plain_mode
-    last_result: Optional[str] = None  # Track last refined prompt for /copy
-
-    transient_toolbar_message: Optional[str] = None
-    show_transient_message_for_next_prompt: bool = False
-    consecutive_ctrl_c = 0  # Track consecutive Ctrl+C presses
-
-    # Track current provider (may be reloaded during session)
-    current_provider = provider
-
-    prompt_message = HTML('<b>&gt; </b>')
-
-    # Neutral, subtle styling - black text on gray background
-    style = Style.from_dict({
-        'bottom-toolbar': 'bg:#808080 #000000',
-        'completion-menu': 'bg:#404040 #ffffff',
-        'completion-menu.completion': 'bg:#404040 #ffffff',
-        'completion-menu.completion.current': 'bg:#606060 #ffffff bold',
-        'completion-menu.meta': 'bg:#404040 #888888',
-        'completion-menu.meta.current': 'bg:#606060 #ffffff',
-    })
+    state = ReplState(current_provider=provider)
 
     # Create custom key bindings and completer
     bindings = create_key_bindings()
-    completer = CommandCompleter()
+    completer = CommandCompleter(app_config)
+    command_handlers = create_command_registry()
 
     session: Optional[PromptSession] = None
     if use_prompt_toolkit:
         try:
-            # Only enable file-based history if history is enabled in config
+            # Only enable file-based history if history is enabled in config;
+            # otherwise prompt_toolkit keeps it in memory with no disk persistence
+            history = None
             if app_config.history_enabled:
-                history_file = get_history().get_prompt_history_file()
-                session = PromptSession(
-                    history=FileHistory(str(history_file)),
-                    multiline=True,
-                    prompt_continuation='… ',  # Continuation prompt for wrapped lines
-                    key_bindings=bindings,
-                    completer=completer,
-                    complete_while_typing=True,  # Show completions as you type
-                    enable_history_search=False,  # Disable Ctrl+R to avoid conflicts
-                )
-            else:
-                # History disabled: no FileHistory, no disk persistence
-                session = PromptSession(
-                    multiline=True,
-                    prompt_continuation='… ',  # Continuation prompt for wrapped lines
-                    key_bindings=bindings,
-                    completer=completer,
-                    complete_while_typing=True,  # Show completions as you type
-                    enable_history_search=False,  # Disable Ctrl+R to avoid conflicts
-                )
+                history = _prompt_history(str(get_history().get_prompt_history_file()))
+            session = PromptSession(
+                history=history,
+                multiline=True,
+                prompt_continuation='… ',  # Continuation prompt for wrapped lines
+                key_bindings=bindings,
+                completer=completer,
+                complete_while_typing=True,  # Show completions as you type
+                enable_history_search=False,  # Disable Ctrl+R to avoid conflicts
+            )
         except Exception as exc:
             logger.warning("Failed to initialize history: %s", sanitize_error_message(str(exc)))
             use_prompt_toolkit = False
             plain_mode = True
 
+    # Optionally request clarifying questions while the user pauses typing
+    prefetcher: Optional[QuestionPrefetcher] = None
+    if session and app_config.question_prefetch_enabled and not getattr(args, "skip_questions", False):
+        prefetcher = QuestionPrefetcher(lambda: state.current_provider)
+        session.default_buffer.on_text_changed += lambda buffer: prefetcher.on_text_changed(buffer.text)
+
+    # Toolbar provider/model info only changes through /set, which reloads the provider
+    provider_name = app_config.provider or "unknown"
+    model_name = app_config.get_model() or "default"
+
     while True:
         try:
-            # Update toolbar with current provider/model info
-            provider_name = app_config.provider or "unknown"
-            model_name = app_config.get_model() or "default"
-
-            if show_transient_message_for_next_prompt and transient_toolbar_message:
-                current_toolbar_text = Text(transient_toolbar_message)
-                current_toolbar_text.stylize("bold yellow")
-                current_bottom_toolbar = HTML(f'<b><span style="color:yellow">{transient_toolbar_message}</span></b>')
-                show_transient_message_for_next_prompt = False # Reset for next prompt
-                transient_toolbar_message = None # Clear message
+            if state.show_transient and state.transient_toolbar_message:
+                current_toolbar_text, current_bottom_toolbar = transient_toolbar(state.transient_toolbar_message)
+                state.show_transient = False # Reset for next prompt
+                state.transient_toolbar_message = None # Clear message
             else:
                 current_toolbar_text = format_toolbar_text(provider_name, model_name)
                 current_bottom_toolbar = create_bottom_toolbar(provider_name, model_name)
@@ -256,19 +308,19 @@ def interactive_mode(
             if use_prompt_toolkit and session:
                 try:
                     user_input = session.prompt(
-                        prompt_message,
+                        PROMPT_MESSAGE,
                         bottom_toolbar=current_bottom_toolbar,
-                        style=style,
+                        style=REPL_STYLE,
                     ).strip()
                 except KeyboardInterrupt:
                     now = time.time()
-                    if now - last_ctrl_c_time[0] < 1.5:
+                    if now - state.last_ctrl_c_time < 1.5:
                         console.print("\n[yellow]Exiting.[/yellow]")
                         break
                     else:
-                        transient_toolbar_message = "Press Ctrl+C again to exit."
-                        show_transient_message_for_next_prompt = True
-                        last_ctrl_c_time[0] = now
+                        state.transient_toolbar_message = "Press Ctrl+C again to exit."
+                        state.show_transient = True
+                        state.last_ctrl_c_time = now
                         continue
                 except EOFError:
                     # Ctrl+D should exit completely
@@ -287,13 +339,13 @@ def interactive_mode(
             else:
                 try:
                     console.print(current_toolbar_text)
-                    user_input = input(f"promptheus [{prompt_count}]> ").strip()
+                    user_input = input(f"promptheus [{state.prompt_count}]> ").strip()
                     # Reset consecutive Ctrl+C counter on successful input
-                    consecutive_ctrl_c = 0
+                    state.consecutive_ctrl_c = 0
                 except KeyboardInterrupt:
                     # Ctrl+C: increment counter
-                    consecutive_ctrl_c += 1
-                    if consecutive_ctrl_c >= 2:
+                    state.consecutive_ctrl_c += 1
+                    if state.consecutive_ctrl_c >= 2:
                         # Two consecutive Ctrl+C presses -> exit
                         console.print("\n[bold yellow]Goodbye![/bold yellow]")
                         break
@@ -306,14 +358,14 @@ def interactive_mode(
                     break
 
             # Handle exit commands
-            if user_input.lower() in {"exit", "quit", "q"}:
+            if len(user_input) <= _EXIT_WORD_MAX_LEN and user_input.lower() in EXIT_WORDS:
                 console.print("[bold yellow]Goodbye![/bold yellow]")
                 break
 
             # Handle slash commands
             if user_input.startswith("/"):
                 # Reset Ctrl+C counter when handling commands
-                consecutive_ctrl_c = 0
+                state.consecutive_ctrl_c = 0
 
                 # First check if it's a session command (/set, /toggle, /status)
                 reload_signal = handle_session_command(user_input, app_config, args, console, notify)
@@ -321,12 +373,12 @@ def interactive_mode(
                 if reload_signal == "reload_provider":
                     # Provider or model changed, reload the provider instance
                     new_provider = reload_provider_instance(app_config, console, notify)
+                    completer.invalidate_providers()
+                    # Update toolbar with new provider/model info
+                    provider_name = app_config.provider or "unknown"
+                    model_name = app_config.get_model() or "default"
                     if new_provider:
-                        current_provider = new_provider
-                        # Update toolbar with new provider/model info
-                        provider_name = app_config.provider or "unknown"
-                        model_name = app_config.get_model() or "default"
-
+                        state.current_provider = new_provider
                     else:
                         notify("[yellow]Continuing with previous provider[/yellow]")
                     continue
@@ -342,101 +394,53 @@ def interactive_mode(
                     continue
 
                 command = command_parts[0].lower()
-
-                if command == "about":
-                    show_about(console, app_config)
-                    continue
-                elif command == "bug":
-                    show_bug_report(console)
-                    continue
-                elif command == "clear-history":
-                    try:
-                        confirm = questionary.confirm(
-                            "Are you sure you want to clear all history?",
-                            default=False,
-                        ).ask()
-                        if confirm:
-                            get_history().clear()
-                            console.print("[green]✓[/green] History cleared")
-                    except KeyboardInterrupt:
-                        console.print("[yellow]Cancelled[/yellow]")
-                    continue
-                elif command == "copy":
-                    if last_result:
-                        copy_to_clipboard(last_result, console, notify)
-                    else:
-                        console.print("[yellow]No result to copy yet. Process a prompt first.[/yellow]")
+                handler = command_handlers.get(command)
+                if handler is None:
+                    console.print(f"[yellow]Unknown command: /{command}[/yellow]")
+                    console.print("[dim]Type /help to see available commands[/dim]")
                     continue
-                elif command in ("exit", "quit"):
-                    console.print("[bold yellow]Goodbye![/bold yellow]")
+
+                args_list = command_parts[1].split() if len(command_parts) > 1 else []
+                outcome = handler(args_list, app_config, args, console, notify, last_result=state.last_result)
+                if command == "clear-history":
+                    completer.invalidate_history()
+                if outcome == "exit":
                     break
-                elif command == "help":
-                    show_help(console)
+                if not isinstance(outcome, tuple):
                     continue
-                elif command == "history":
-                    display_history(console, notify)
-                    continue
-                elif command == "load":
-                    if len(command_parts) > 1:
-                        # Has an argument - try to load that specific entry
-                        try:
-                            index = int(command_parts[1])
-                            entry = get_history().get_by_index(index)
-                            if entry:
-                                console.print(f"[green]✓[/green] Loaded prompt #{index} from history:\n")
-                                console.print(f"[cyan]{entry.original_prompt}[/cyan]\n")
-
-                                # Ask for confirmation
-                                try:
-                                    confirm = questionary.confirm(
-                                        "Proceed with this prompt?",
-                                        default=True,
-                                    ).ask()
-                                    if confirm:
-                                        user_input = entry.original_prompt
-                                    else:
-                                        console.print("[yellow]Cancelled[/yellow]")
-                                        continue
-                                except KeyboardInterrupt:
-                                    console.print("[yellow]Cancelled[/yellow]")
-                                    continue
-                            else:
-                                console.print(f"[yellow]No history entry found at index {index}[/yellow]")
-                                continue
-                        except ValueError:
-                            console.print("[yellow]Invalid history index. Use '/load <number>'[/yellow]")
-                            continue
-                    else:
-                        # No argument - show history to help them choose
-                        console.print("[yellow]Specify which prompt to load. Showing history:[/yellow]\n")
-                        display_history(console, notify)
-                        continue
-                else:
-                    console.print(f"[yellow]Unknown command: /{command}[/yellow]")
-                    console.print("[dim]Type /help to see available commands[/dim]")
+
+                # ("load_prompt", text): confirm before processing the loaded prompt
+                try:
+                    confirm = questionary.confirm(
+                        "Proceed with this prompt?",
+                        default=True,
+                    ).ask()
+                except KeyboardInterrupt:
+                    confirm = False
+                if not confirm:
+                    console.print("[yellow]Cancelled[/yellow]")
                     continue
+                user_input = outcome[1]
 
             # Don't process empty prompts
             if not user_input:
                 continue
 
             # Reset Ctrl+C counter when starting to process a prompt
-            consecutive_ctrl_c = 0
+            state.consecutive_ctrl_c = 0
 
             # Process the prompt (no echo, no wrapper spinner)
             console.print()
             try:
                 result = process_prompt(
-                    current_provider, user_input, args, debug_enabled, plain_mode, io, app_config
+                    state.current_provider, user_input, args, debug_enabled, plain_mode, io, app_config
                 )
             except PromptCancelled as cancel_exc:
-                console.print(f"\n[yellow]{cancel_exc}[/yellow]")
-                console.print()
+                console.print(f"\n[yellow]{cancel_exc}[/yellow]\n")
                 continue
             except KeyboardInterrupt:
                 # Ctrl+C during processing - just cancel and continue
-                console.print("\n[yellow]Cancelled[/yellow]")
-                console.print()
+                console.print("\n[yellow]Cancelled[/yellow]\n")
                 continue
             except Exception as exc:
                 sanitized = sanitize_error_message(str(exc))
@@ -456,13 +460,14 @@ def interactive_mode(
             final_prompt, task_type = result
 
             # Store result for /copy command
-            last_result = final_prompt
+            state.last_result = final_prompt
 
-            # Render response as Markdown
-            console.print(Markdown(final_prompt))
-            console.print()
+            # Render response as Markdown, followed by a blank line
+            console.print(Group(_render_markdown(final_prompt), BLANK_LINE))
 
-            prompt_count += 1
+            state.prompt_count += 1
+            # process_prompt saved the new entry to history
+            completer.invalidate_history()
 
         except KeyboardInterrupt:
             console.print("\n[bold yellow]Goodbye![/bold yellow]")
@@ -482,4 +487,7 @@ def interactive_mode(
             else:
                 # Already in plain mode, can't recover
                 console.print("\n[bold yellow]Goodbye![/bold yellow]")
-                break
\ No newline at end of file
+                break
+
+    if prefetcher is not None:
+        prefetcher.close()
\ No newline at end of file
@@ -8,17 +8,21 @@ the PROMPTHEUS_TELEMETRY_ENABLED environment variable.
 
 from __future__ import annotations
 
-import json
+import atexit
+import functools
 import logging
 import os
+import queue
 import random
-from dataclasses import asdict, dataclass
+import threading
+import time
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from promptheus.history import get_default_history_dir
-from promptheus.utils import sanitize_error_message
+from promptheus.utils import json_dumps_bytes, sanitize_error_message
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,17 @@ logger = logging.getLogger(__name__)
 TELEMETRY_ENABLED_ENV = "PROMPTHEUS_TELEMETRY_ENABLED"
 TELEMETRY_FILE_ENV = "PROMPTHEUS_TELEMETRY_FILE"
 TELEMETRY_SAMPLE_RATE_ENV = "PROMPTHEUS_TELEMETRY_SAMPLE_RATE"
+TELEMETRY_MAX_BYTES_ENV = "PROMPTHEUS_TELEMETRY_MAX_BYTES"
+
+# Events are appended in batches: a batch is written once this many are
+# pending, once its first event is older than the interval, and at exit.
+TELEMETRY_BATCH_SIZE = 32
+TELEMETRY_FLUSH_INTERVAL = 1.0  # seconds
+
+# Once the active file passes this size it is renamed to telemetry.jsonl.1
+# (older rotations shift up to .N) and a fresh file is started.
+TELEMETRY_MAX_BYTES = 16 * 1024 * 1024
+TELEMETRY_BACKUP_COUNT = 3
 
 
 @dataclass
@@ -70,55 +85,75 @@ class TelemetryEvent:
 
     def to_dict(self) -> dict:
         """Convert to plain dictionary for JSON serialization."""
-        return asdict(self)
+        # Every field is a scalar, so a flat copy replaces asdict()'s recursive walk
+        return {name: getattr(self, name) for name in _EVENT_FIELDS}
 
 
-_cached_enabled: Optional[bool] = None
-_cached_sample_rate: Optional[float] = None
+_EVENT_FIELDS = tuple(field.name for field in fields(TelemetryEvent))
 
 
+@functools.lru_cache(maxsize=1)
 def _telemetry_enabled() -> bool:
     """
     Determine whether telemetry is enabled.
 
     Telemetry is enabled by default and can be disabled by setting
-    PROMPTHEUS_TELEMETRY_ENABLED to 0, false, or off.
+    PROMPTHEUS_TELEMETRY_ENABLED to 0, false, or off. The decision is
+    cached; call reset_telemetry_cache() after changing the environment.
     """
-    global _cached_enabled
-    if _cached_enabled is not None:
-        return _cached_enabled
-
     raw = os.getenv(TELEMETRY_ENABLED_ENV)
     if raw is None:
-        _cached_enabled = True
-    else:
-        lowered = raw.strip().lower()
-        _cached_enabled = lowered not in ("0", "false", "no", "off")
-    return _cached_enabled
+        return True
+    return raw.strip().lower() not in ("0", "false", "no", "off")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_sample_rate() -> float:
     """Get the telemetry sample rate from environment variable."""
-    global _cached_sample_rate
-    if _cached_sample_rate is not None:
-        return _cached_sample_rate
-
     raw = os.getenv(TELEMETRY_SAMPLE_RATE_ENV)
     if not raw:
-        _cached_sample_rate = 1.0
-        return _cached_sample_rate
+        return 1.0
 
     try:
         value = float(raw)
     except ValueError:
-        _cached_sample_rate = 1.0
-        return _cached_sample_rate
+        return 1.0
 
     if not (0.0 <= value <= 1.0):
-        _cached_sample_rate = 1.0
-    else:
-        _cached_sample_rate = value
-    return _cached_sample_rate
+        return 1.0
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _get_max_bytes() -> int:
+    """Get the rotation size from environment variable; 0 disables rotation."""
+    raw = os.getenv(TELEMETRY_MAX_BYTES_ENV)
+    if not raw:
+        return TELEMETRY_MAX_BYTES
+
+    try:
+        value = int(raw)
+    except ValueError:
+        return TELEMETRY_MAX_BYTES
+    return max(value, 0)
+
+
+def is_enabled() -> bool:
+    """
+    Return whether telemetry events will be recorded.
+
+    Callers can check this before computing expensive event fields; the
+    record_* functions also return early when telemetry is off.
+    """
+    return _telemetry_enabled()
+
+
+def reset_telemetry_cache() -> None:
+    """Re-read the telemetry environment variables on next use."""
+    _telemetry_enabled.cache_clear()
+    _get_sample_rate.cache_clear()
+    _get_max_bytes.cache_clear()
+    _get_telemetry_path.cache_clear()
 
 
 def _should_sample() -> bool:
@@ -131,12 +166,14 @@ def _should_sample() -> bool:
     return random.random() <= rate
 
 
+@functools.lru_cache(maxsize=1)
 def _get_telemetry_path() -> Path:
     """
     Resolve the telemetry file path.
 
     Uses PROMPTHEUS_TELEMETRY_FILE when set; otherwise defaults to the same
     directory used for history (~/.promptheus) with filename telemetry.jsonl.
+    Resolved once; reset_telemetry_cache() picks up a changed environment.
     """
     override = os.getenv(TELEMETRY_FILE_ENV)
     if override:
@@ -144,30 +181,189 @@ def _get_telemetry_path() -> Path:
     return get_default_history_dir() / "telemetry.jsonl"
 
 
+# Serialized events travel to a background writer thread, so recording an
+# event costs the caller an enqueue rather than disk I/O
+TELEMETRY_QUEUE_SIZE = 1024
+_queue: queue.Queue[object] = queue.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+_STOP = object()
+
+
+# Only the writer thread touches the open descriptor, so it needs no lock
+_open_file: Optional[Tuple[Path, int]] = None
+
+
+def _needs_rotation(size: int) -> bool:
+    """Whether a telemetry file of this size should be rotated before appending."""
+    max_bytes = _get_max_bytes()
+    return max_bytes > 0 and size >= max_bytes
+
+
+def _rotate(path: Path) -> None:
+    """Shift path to path.1, path.1 to path.2, ..., dropping the oldest."""
+    for index in range(TELEMETRY_BACKUP_COUNT - 1, 0, -1):
+        older = path.with_name(f"{path.name}.{index}")
+        if older.exists():
+            os.replace(older, path.with_name(f"{path.name}.{index + 1}"))
+    os.replace(path, path.with_name(f"{path.name}.1"))
+
+
+def _telemetry_fd(path: Path) -> int:
+    """
+    Return an O_APPEND descriptor for path.
+
+    The descriptor is reused across batches; it is reopened when the file
+    was removed or has grown past the rotation size.
+    """
+    global _open_file
+    if _open_file is not None and _open_file[0] == path:
+        stat = os.fstat(_open_file[1])
+        if stat.st_nlink > 0 and not _needs_rotation(stat.st_size):
+            return _open_file[1]
+    _close_telemetry_fd()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Another process may already have rotated the file we had open
+        if _needs_rotation(path.stat().st_size):
+            _rotate(path)
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    _open_file = (path, fd)
+    return fd
+
+
+def _close_telemetry_fd() -> None:
+    """Close the cached telemetry descriptor, if any."""
+    global _open_file
+    if _open_file is None:
+        return
+    _, fd = _open_file
+    _open_file = None
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def _append_lines(batch: List[Tuple[Path, bytes]]) -> None:
+    """Append serialized events with a single write per file."""
+    lines_by_path: Dict[Path, List[bytes]] = {}
+    for path, line in batch:
+        lines_by_path.setdefault(path, []).append(line)
+
+    for path, lines in lines_by_path.items():
+        payload = memoryview(b"\n".join(lines) + b"\n")
+        try:
+            fd = _telemetry_fd(path)
+            while payload:
+                payload = payload[os.write(fd, payload):]
+        except OSError as exc:
+            _close_telemetry_fd()
+            # Telemetry must never break primary workflows; log at debug level only.
+            logger.debug(
+                "Failed to write telemetry events: %s",
+                sanitize_error_message(str(exc)),
+            )
+
+
+def _writer_loop() -> None:
+    """
+    Collect queued events and append them in batches.
+
+    A batch is written once TELEMETRY_BATCH_SIZE events are pending or
+    TELEMETRY_FLUSH_INTERVAL seconds after its first event; flush markers
+    and the stop sentinel write whatever is pending immediately.
+    """
+    batch: List[Tuple[Path, bytes]] = []
+    deadline = 0.0
+    while True:
+        timeout = max(0.0, deadline - time.monotonic()) if batch else None
+        try:
+            item = _queue.get(timeout=timeout)
+        except queue.Empty:
+            _append_lines(batch)
+            batch = []
+            continue
+
+        if item is _STOP:
+            _append_lines(batch)
+            _close_telemetry_fd()
+            return
+        if isinstance(item, threading.Event):
+            _append_lines(batch)
+            batch = []
+            item.set()
+            continue
+
+        if not batch:
+            deadline = time.monotonic() + TELEMETRY_FLUSH_INTERVAL
+        batch.append(item)
+        if len(batch) >= TELEMETRY_BATCH_SIZE:
+            _append_lines(batch)
+            batch = []
+
+
+def _ensure_writer() -> None:
+    """Start the writer thread on first use."""
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name="promptheus-telemetry", daemon=True)
+            _writer.start()
+
+
+def flush_telemetry(timeout: float = 2.0) -> None:
+    """
+    Wait until every event recorded so far has been appended to its file.
+
+    Events are written by the background writer; this blocks for at most
+    timeout seconds so a stuck filesystem cannot hang the caller.
+    """
+    if _writer is None:
+        return
+    written = threading.Event()
+    try:
+        _queue.put(written, timeout=timeout)
+    except queue.Full:
+        return
+    written.wait(timeout)
+
+
+def _stop_writer() -> None:
+    """Write pending events and stop the writer at interpreter exit."""
+    if _writer is None or not _writer.is_alive():
+        return
+    try:
+        _queue.put(_STOP, timeout=1.0)
+    except queue.Full:
+        return
+    _writer.join(timeout=2.0)
+
+
+atexit.register(_stop_writer)
+
+
 def _write_event(event: TelemetryEvent) -> None:
     """
-    Write a telemetry event to the JSONL file.
-    
+    Queue a telemetry event for the JSONL file.
+
     This is the central low-level writer that all public functions should use.
-    Handles sampling and error handling.
+    Handles sampling; events are dropped rather than blocking when the
+    writer falls behind.
     """
-    if not _telemetry_enabled():
-        return
     if not _should_sample():
         return
 
+    _ensure_writer()
     try:
-        path = _get_telemetry_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "a", encoding="utf-8") as f:
-            json.dump(event.to_dict(), f)
-            f.write("\n")
-    except OSError as exc:
-        # Telemetry must never break primary workflows; log at debug level only.
-        logger.debug(
-            "Failed to write telemetry event: %s",
-            sanitize_error_message(str(exc)),
-        )
+        _queue.put_nowait((_get_telemetry_path(), json_dumps_bytes(event.to_dict())))
+    except queue.Full:
+        logger.debug("Telemetry queue full; dropping %s event", event.event_type)
 
 
 def record_prompt_run_event(
@@ -202,6 +398,9 @@ def record_prompt_run_event(
     This is the main event type that captures high-level metrics about a
     prompt refinement session without storing any actual prompt content.
     """
+    if not _telemetry_enabled():
+        return
+
     event = TelemetryEvent(
         timestamp=datetime.now().isoformat(),
         event_type="prompt_run",
@@ -246,7 +445,7 @@ def record_clarifying_questions_summary(
     Only the count is recorded, never the actual question text.
     """
     # Privacy guard: do not log question-level summaries if history is disabled.
-    if history_enabled is False:
+    if history_enabled is False or not _telemetry_enabled():
         return
 
     event = TelemetryEvent(
@@ -282,6 +481,9 @@ def record_provider_error(
     Captures high-level error information without storing sensitive details.
     The error message is sanitized before recording.
     """
+    if not _telemetry_enabled():
+        return
+
     event = TelemetryEvent(
         timestamp=datetime.now().isoformat(),
         event_type="provider_error",
@@ -4,9 +4,10 @@ Utility helpers shared across Promptheus modules.
 
 from __future__ import annotations
 
+import json
 import logging
 import re
-from typing import Callable, Iterable, Optional, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
 
 from promptheus.logging_config import setup_logging
 
@@ -18,8 +19,16 @@ try:
 except ImportError:
     pyperclip = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_\-]{12,}")
+# Matched against the lowercased User-Agent by get_device_category
+_TABLET_UA_PATTERN = re.compile(r"ipad|tablet")
+_MOBILE_UA_PATTERN = re.compile(r"mobile|iphone|ipod|windows phone|android")
 
 
 def sanitize_error_message(message: str, max_length: int = 160) -> str:
@@ -37,6 +46,20 @@ def sanitize_error_message(message: str, max_length: int = 160) -> str:
     return sanitized
 
 
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def configure_logging(default_level: int = logging.INFO) -> None:
     """Backward-compatible wrapper around logging_config.setup_logging."""
     setup_logging(default_level)
@@ -86,17 +109,10 @@ def get_user_email(request: "Request") -> str:
 
     Returns the authenticated user's email, or "unknown" if not authenticated.
     """
-    # Option 1: Try specific email header first (correct case)
+    # Option 1: Specific email header (Starlette header lookups ignore case)
     user_email = request.headers.get("CF-Access-Authenticated-User-Email")
 
-    if not user_email:
-        # Option 2: Try case-insensitive search for safety
-        for header_name in request.headers:
-            if header_name.lower() == "cf-access-authenticated-user-email":
-                user_email = request.headers.get(header_name)
-                break
-
-    # Option 3: Fallback to subject if no email (contains provider:identifier format)
+    # Option 2: Fallback to subject if no email (contains provider:identifier format)
     if not user_email:
         subject = request.headers.get("CF-Access-Subject")
         if subject and "@" in subject:  # If subject looks like an email
@@ -124,15 +140,8 @@ def get_device_category(request: "Request") -> str:
     # Privacy-safe: Only detect basic device category
     # Avoid detailed fingerprinting, browser versions, or specific models
 
-    # Mobile indicators (check first for specificity)
-    mobile_indicators = ["mobile", "iphone", "ipod", "windows phone", "android"]
-
-    # Tablet indicators (checked after confirming not mobile)
-    tablet_indicators = ["ipad", "tablet", "kindle", "silk", "tab", "nexus", "sm-t", "gt-"]
-
-    # Check for tablet-specific patterns first
     # iPads and explicit tablet indicators
-    if "ipad" in user_agent or "tablet" in user_agent:
+    if _TABLET_UA_PATTERN.search(user_agent):
         return "tablet"
 
     # Android tablets (Android without "mobile")
@@ -140,7 +149,7 @@ def get_device_category(request: "Request") -> str:
         return "tablet"
 
     # Check for mobile indicators
-    if any(indicator in user_agent for indicator in mobile_indicators):
+    if _MOBILE_UA_PATTERN.search(user_agent):
         return "mobile"
 
     # Fallback to desktop for any other User-Agent
@@ -36,17 +36,20 @@ async def get_history_entries(limit: int = 50, offset: int = 0):
         # Get paginated entries and total count
         paginated_entries, total_entries = history.get_paginated(offset=offset, limit=limit)
         
-        history_entries = []
-        for entry in paginated_entries:
-            history_entries.append(HistoryEntry(
-                timestamp=entry.timestamp,
-                task_type=entry.task_type or "",
-                original_prompt=entry.original_prompt,
-                refined_prompt=entry.refined_prompt,
-                provider=entry.provider or "",
-                model=entry.model or ""
-            ))
-        
+        # Plain rows let pydantic validate the whole list in one pass
+        # instead of constructing each HistoryEntry model separately
+        history_entries = [
+            {
+                "timestamp": entry.timestamp,
+                "task_type": entry.task_type or "",
+                "original_prompt": entry.original_prompt,
+                "refined_prompt": entry.refined_prompt,
+                "provider": entry.provider or "",
+                "model": entry.model or "",
+            }
+            for entry in paginated_entries
+        ]
+
         return HistoryResponse(
             entries=history_entries,
             total=total_entries
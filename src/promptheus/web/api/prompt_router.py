@@ -1,6 +1,5 @@
 """Prompt API router for Promptheus Web UI."""
 import asyncio
-import json
 import time
 import uuid
 import sys
@@ -11,7 +10,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from promptheus.config import Config
-from promptheus.providers import get_provider, LLMProvider
+from promptheus.providers import LLMProvider, call_with_token_usage, get_shared_provider
 from promptheus.io_context import IOContext
 from promptheus.history import get_history
 from promptheus.question_prompter import create_prompter
@@ -21,7 +20,7 @@ from promptheus.prompts import (
     GENERATION_SYSTEM_INSTRUCTION,
     TWEAK_SYSTEM_INSTRUCTION,
 )
-from promptheus.utils import sanitize_error_message, get_user_email, get_device_category
+from promptheus.utils import sanitize_error_message, get_user_email, get_device_category, json_dumps_bytes
 from promptheus.telemetry import (
     record_prompt_run_event,
     record_clarifying_questions_summary,
@@ -30,6 +29,10 @@ from promptheus.telemetry import (
 
 LOAD_ALL_MODELS_SENTINEL = "__load_all__"
 
+# The refined prompt is already complete when streaming starts, so it is sent
+# in slices rather than one SSE frame per character
+STREAM_CHUNK_CHARS = 64
+
 
 STYLE_INSTRUCTIONS = {
     "default": "",
@@ -46,6 +49,14 @@ router = APIRouter()
 SESSION_ID = str(uuid.uuid4())
 
 
+def _sse_event(event_type: str, content: str) -> bytes:
+    """Encode one Server-Sent Events data frame."""
+    return b"data: " + json_dumps_bytes({"type": event_type, "content": content}) + b"\n\n"
+
+
+_SSE_DONE_FRAME = _sse_event("done", "")
+
+
 async def process_prompt_web(
     provider: LLMProvider,
     initial_prompt: str,
@@ -87,7 +98,9 @@ async def process_prompt_web(
         # Generate questions first to determine task type
         try:
             llm_start_time = time.time()
-            result = provider.generate_questions(initial_prompt, CLARIFICATION_SYSTEM_INSTRUCTION)
+            result = await asyncio.to_thread(
+                provider.generate_questions, initial_prompt, CLARIFICATION_SYSTEM_INSTRUCTION
+            )
             llm_end_time = time.time()
             questions_llm_latency_sec = llm_end_time - llm_start_time
             
@@ -100,7 +113,9 @@ async def process_prompt_web(
                 if answers and mapping:
                     # Refine using the answers
                     llm_start_time = time.time()
-                    final_prompt = provider.refine_from_answers(
+                    final_prompt, (input_tokens, output_tokens, total_tokens) = await asyncio.to_thread(
+                        call_with_token_usage,
+                        provider.refine_from_answers,
                         initial_prompt, answers, mapping, _apply_style(GENERATION_SYSTEM_INSTRUCTION)
                     )
                     llm_end_time = time.time()
@@ -110,10 +125,6 @@ async def process_prompt_web(
                     total_run_latency_sec = end_time - start_time
                     refine_llm_latency_sec = llm_end_time - llm_start_time
                     llm_latency_sec = questions_llm_latency_sec + refine_llm_latency_sec
-
-                    input_tokens = getattr(provider, "last_input_tokens", None)
-                    output_tokens = getattr(provider, "last_output_tokens", None)
-                    total_tokens = getattr(provider, "last_total_tokens", None)
                     
                     # Record successful telemetry
                     record_prompt_run_event(
@@ -154,7 +165,9 @@ async def process_prompt_web(
                 elif not questions_json:
                     # No questions needed, apply light refinement
                     llm_start_time = time.time()
-                    final_prompt = provider.light_refine(
+                    final_prompt, (input_tokens, output_tokens, total_tokens) = await asyncio.to_thread(
+                        call_with_token_usage,
+                        provider.light_refine,
                         initial_prompt, _apply_style(ANALYSIS_REFINEMENT_SYSTEM_INSTRUCTION)
                     )
                     llm_end_time = time.time()
@@ -163,10 +176,6 @@ async def process_prompt_web(
                     end_time = time.time()
                     total_run_latency_sec = end_time - start_time
                     llm_latency_sec = llm_end_time - llm_start_time
-
-                    input_tokens = getattr(provider, "last_input_tokens", None)
-                    output_tokens = getattr(provider, "last_output_tokens", None)
-                    total_tokens = getattr(provider, "last_total_tokens", None)
                     
                     # Record successful telemetry
                     record_prompt_run_event(
@@ -199,7 +208,9 @@ async def process_prompt_web(
                 elif task_type == "analysis":
                     # Analysis task, apply light refinement
                     llm_start_time = time.time()
-                    final_prompt = provider.light_refine(
+                    final_prompt, (input_tokens, output_tokens, total_tokens) = await asyncio.to_thread(
+                        call_with_token_usage,
+                        provider.light_refine,
                         initial_prompt, _apply_style(ANALYSIS_REFINEMENT_SYSTEM_INSTRUCTION)
                     )
                     llm_end_time = time.time()
@@ -208,10 +219,6 @@ async def process_prompt_web(
                     end_time = time.time()
                     total_run_latency_sec = end_time - start_time
                     llm_latency_sec = llm_end_time - llm_start_time
-
-                    input_tokens = getattr(provider, "last_input_tokens", None)
-                    output_tokens = getattr(provider, "last_output_tokens", None)
-                    total_tokens = getattr(provider, "last_total_tokens", None)
                     
                     # Record successful telemetry
                     record_prompt_run_event(
@@ -247,7 +254,9 @@ async def process_prompt_web(
             else:
                 # Fallback to light refinement if no result from API
                 llm_start_time = time.time()
-                final_prompt = provider.light_refine(
+                final_prompt, (input_tokens, output_tokens, total_tokens) = await asyncio.to_thread(
+                    call_with_token_usage,
+                    provider.light_refine,
                     initial_prompt, _apply_style(ANALYSIS_REFINEMENT_SYSTEM_INSTRUCTION)
                 )
                 llm_end_time = time.time()
@@ -256,10 +265,6 @@ async def process_prompt_web(
                 end_time = time.time()
                 total_run_latency_sec = end_time - start_time
                 llm_latency_sec = llm_end_time - llm_start_time
-
-                input_tokens = getattr(provider, "last_input_tokens", None)
-                output_tokens = getattr(provider, "last_output_tokens", None)
-                total_tokens = getattr(provider, "last_total_tokens", None)
                 
                 # Record successful telemetry
                 record_prompt_run_event(
@@ -307,7 +312,9 @@ async def process_prompt_web(
     else:
         # Skip questions mode - apply light refinement
         llm_start_time = time.time()
-        final_prompt = provider.light_refine(
+        final_prompt, (input_tokens, output_tokens, total_tokens) = await asyncio.to_thread(
+            call_with_token_usage,
+            provider.light_refine,
             initial_prompt, _apply_style(ANALYSIS_REFINEMENT_SYSTEM_INSTRUCTION)
         )
         llm_end_time = time.time()
@@ -316,10 +323,6 @@ async def process_prompt_web(
         end_time = time.time()
         total_run_latency_sec = end_time - start_time
         llm_latency_sec = llm_end_time - llm_start_time
-
-        input_tokens = getattr(provider, "last_input_tokens", None)
-        output_tokens = getattr(provider, "last_output_tokens", None)
-        total_tokens = getattr(provider, "last_total_tokens", None)
         
         # Record successful telemetry
         record_prompt_run_event(
@@ -408,7 +411,7 @@ async def submit_prompt(prompt_request: PromptRequest, request: Request):
             raise HTTPException(status_code=500, detail="No provider configured")
 
         logger.info(f"[submit_prompt] Using provider: {provider_name}, model: {app_config.get_model()}")
-        provider = get_provider(provider_name, app_config, app_config.get_model())
+        provider = get_shared_provider(provider_name, app_config, app_config.get_model())
         
         # Create an argument-like object to pass to the processing function
         class Args:
@@ -450,7 +453,8 @@ async def submit_prompt(prompt_request: PromptRequest, request: Request):
 
         # Save to history
         history = get_history(app_config)
-        history.save_entry(
+        await asyncio.to_thread(
+            history.save_entry,
             original_prompt=prompt_request.prompt,
             refined_prompt=final_prompt,
             task_type=task_type,
@@ -541,10 +545,11 @@ async def tweak_prompt(tweak_request: TweakRequest, request: Request):
             raise HTTPException(status_code=500, detail="No provider configured")
 
         logger.info(f"[tweak_prompt] Using provider: {provider_name}")
-        provider = get_provider(provider_name, app_config, app_config.get_model())
+        provider = get_shared_provider(provider_name, app_config, app_config.get_model())
 
         # Tweak the prompt
-        tweaked_prompt = provider.tweak_prompt(
+        tweaked_prompt = await asyncio.to_thread(
+            provider.tweak_prompt,
             tweak_request.current_prompt,
             tweak_request.tweak_instruction,
             TWEAK_SYSTEM_INSTRUCTION
@@ -656,15 +661,11 @@ async def stream_prompt(
             provider_name = app_config.provider
             if not provider_name:
                 logger.error("[stream_prompt] No provider detected!")
-                error_data = {
-                    "type": "error",
-                    "content": "No provider configured"
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
+                yield _sse_event("error", "No provider configured")
                 return
 
             logger.info(f"[stream_prompt] Using provider: {provider_name}")
-            provider_instance = get_provider(provider_name, app_config, app_config.get_model())
+            provider_instance = get_shared_provider(provider_name, app_config, app_config.get_model())
 
             # Process the prompt (skip questions in streaming mode)
             final_prompt, task_type = await process_prompt_web(
@@ -680,7 +681,8 @@ async def stream_prompt(
 
             # Save to history
             history = get_history(app_config)
-            history.save_entry(
+            await asyncio.to_thread(
+                history.save_entry,
                 original_prompt=prompt,
                 refined_prompt=final_prompt,
                 task_type=task_type,
@@ -688,32 +690,19 @@ async def stream_prompt(
                 model=app_config.get_model()
             )
 
-            # Stream the response character by character for effect
-            for char in final_prompt:
-                event_data = {
-                    "type": "token",
-                    "content": char
-                }
-                yield f"data: {json.dumps(event_data)}\n\n"
-                await asyncio.sleep(0.01)  # Small delay for visual effect
+            # Stream the response in fixed-size slices
+            for start in range(0, len(final_prompt), STREAM_CHUNK_CHARS):
+                yield _sse_event("token", final_prompt[start:start + STREAM_CHUNK_CHARS])
 
             # Send completion event
-            completion_data = {
-                "type": "done",
-                "content": ""
-            }
-            yield f"data: {json.dumps(completion_data)}\n\n"
+            yield _SSE_DONE_FRAME
 
         except Exception as e:
             sanitized = sanitize_error_message(str(e))
             msg = sanitized
             if "rate limit" in sanitized.lower() or "429" in sanitized.lower() or "too many requests" in sanitized.lower():
                 msg = f"Rate limit detected. Retry after a pause or switch provider. Details: {sanitized}"
-            error_data = {
-                "type": "error",
-                "content": msg
-            }
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield _sse_event("error", msg)
 
     return StreamingResponse(
         event_generator(),
@@ -1,4 +1,5 @@
 """Questions API router for Promptheus Web UI."""
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 
@@ -6,7 +7,7 @@ from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
 from promptheus.config import Config
-from promptheus.providers import get_provider
+from promptheus.providers import get_shared_provider
 from promptheus.utils import get_user_email, get_device_category, sanitize_error_message
 
 router = APIRouter()
@@ -52,13 +53,15 @@ async def generate_questions(questions_request: QuestionsRequest, request: Reque
             raise HTTPException(status_code=500, detail="No provider configured")
 
         logger.info(f"[generate_questions] Using provider: {provider_name}, model: {app_config.get_model()}")
-        provider = get_provider(provider_name, app_config, app_config.get_model())
+        provider = get_shared_provider(provider_name, app_config, app_config.get_model())
 
         # Import the system instruction from main module
         from promptheus.prompts import CLARIFICATION_SYSTEM_INSTRUCTION
 
         # Generate questions using the provider
-        result = provider.generate_questions(questions_request.prompt, CLARIFICATION_SYSTEM_INSTRUCTION)
+        result = await asyncio.to_thread(
+            provider.generate_questions, questions_request.prompt, CLARIFICATION_SYSTEM_INSTRUCTION
+        )
 
         if result is None:
             # Log failed user action
@@ -2,6 +2,7 @@
 import asyncio
 import logging
 import webbrowser
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,7 @@ from promptheus.config import Config
 from promptheus.providers import get_provider
 from promptheus.history import get_history
 from promptheus.constants import VERSION, GITHUB_REPO
+from promptheus.models_dev_service import close_service
 
 # Import API routers
 from promptheus.web.api.prompt_router import router as prompt_router
@@ -23,6 +25,13 @@ from promptheus.web.api.providers_router import router as providers_router
 from promptheus.web.api.settings_router import router as settings_router
 from promptheus.web.api.questions_router import router as questions_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release long-lived clients when the server shuts down."""
+    yield
+    await close_service()
+
+
 # Create FastAPI app with docs disabled (local tool, no need to expose schema)
 app = FastAPI(
     title="Promptheus Web API",
@@ -30,6 +39,7 @@ app = FastAPI(
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware restricted to loopback origins on any port
@@ -0,0 +1,119 @@
+"""Tests for the provider response cache."""
+
+from promptheus import cache as cache_module
+from promptheus.cache import ResponseCache, SemanticCache, make_cache_key
+
+
+def _bag_of_words(text):
+    """Tiny deterministic embedder: word counts over a fixed vocabulary."""
+    vocab = ["make", "this", "concise", "shorten", "short", "poem", "about", "cats"]
+    words = text.lower().split()
+    return [float(words.count(term)) for term in vocab]
+
+
+def test_make_cache_key_is_deterministic():
+    key = make_cache_key("GeminiProvider", "gemini-pro", "sys", "prompt", False, 100)
+    assert key == make_cache_key("GeminiProvider", "gemini-pro", "sys", "prompt", False, 100)
+    assert len(key) == 64
+    assert key != make_cache_key("GeminiProvider", "gemini-pro", "sys", "prompt", True, 100)
+    assert key != make_cache_key("AnthropicProvider", "gemini-pro", "sys", "prompt", False, 100)
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    try:
+        assert cache.get("missing") is None
+        cache.put("key", "refined prompt ✓")
+        assert cache.get("key") == "refined prompt ✓"
+
+        cache.put("key", "replaced")
+        assert cache.get("key") == "replaced"
+
+        cache.clear()
+        assert cache.get("key") is None
+    finally:
+        cache.close()
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    first = ResponseCache(path)
+    first.put("key", "value")
+    first.close()
+
+    second = ResponseCache(path)
+    try:
+        assert second.get("key") == "value"
+    finally:
+        second.close()
+
+
+def test_expired_entries_are_dropped(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl=60)
+    try:
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+        cache.put("key", "value")
+
+        now[0] += 30
+        assert cache.get("key") == "value"
+
+        now[0] += 31
+        assert cache.get("key") is None
+    finally:
+        cache.close()
+
+
+def test_semantic_cache_matches_similar_prompts(tmp_path):
+    cache = SemanticCache(_bag_of_words, tmp_path / "semantic.sqlite3", threshold=0.8)
+    try:
+        cache.insert("ns", "make this concise", "short version")
+
+        assert cache.lookup("ns", "make this concise") == "short version"
+        assert cache.lookup("ns", "please make this concise") == "short version"
+        assert cache.lookup("ns", "poem about cats") is None
+        # Namespaces never share entries
+        assert cache.lookup("other", "make this concise") is None
+    finally:
+        cache.close()
+
+
+def test_semantic_cache_prefers_closest_match(tmp_path):
+    cache = SemanticCache(_bag_of_words, tmp_path / "semantic.sqlite3", threshold=0.5)
+    try:
+        cache.insert("ns", "make this concise", "concise")
+        cache.insert("ns", "make this short", "short")
+
+        assert cache.lookup("ns", "make this short") == "short"
+    finally:
+        cache.close()
+
+
+def test_semantic_cache_threshold_can_be_set_per_lookup(tmp_path):
+    cache = SemanticCache(_bag_of_words, tmp_path / "semantic.sqlite3", threshold=0.8)
+    try:
+        cache.insert("ns", "make this concise", "concise")
+
+        assert cache.lookup("ns", "make this short") is None
+        assert cache.lookup("ns", "make this short", threshold=0.5) == "concise"
+        # The override applies to that lookup only
+        assert cache.threshold == 0.8
+        assert cache.lookup("ns", "make this short") is None
+    finally:
+        cache.close()
+
+
+def test_response_cache_open_failure_is_not_retried(monkeypatch):
+    attempts = []
+
+    def failing_cache():
+        attempts.append(True)
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(cache_module, "_response_cache", None)
+    monkeypatch.setattr(cache_module, "_response_cache_unavailable", False)
+    monkeypatch.setattr(cache_module, "ResponseCache", failing_cache)
+
+    assert cache_module.get_response_cache() is None
+    assert cache_module.get_response_cache() is None
+    assert len(attempts) == 1
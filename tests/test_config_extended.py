@@ -379,3 +379,33 @@ def test_is_project_root_with_setup_marker(tmp_path):
 def test_is_project_root_not_project(tmp_path):
     """Test _is_project_root with no markers."""
     assert not _is_project_root(tmp_path)
+
+
+def test_response_cache_disabled_by_default(monkeypatch, config):
+    """Response cache is opt-in."""
+    monkeypatch.delenv("PROMPTHEUS_RESPONSE_CACHE", raising=False)
+    assert config.response_cache_enabled is False
+
+
+def test_response_cache_env_and_flag(monkeypatch, config):
+    """The CLI flag overrides PROMPTHEUS_RESPONSE_CACHE."""
+    monkeypatch.setenv("PROMPTHEUS_RESPONSE_CACHE", "1")
+    assert config.response_cache_enabled is True
+
+    config.set_response_cache(False)
+    assert config.response_cache_enabled is False
+
+    config.reset()
+    assert config.response_cache_enabled is True
+
+
+def test_question_prefetch_is_opt_in(monkeypatch, config):
+    """Question prefetch stays off unless PROMPTHEUS_PREFETCH_QUESTIONS is truthy."""
+    monkeypatch.delenv("PROMPTHEUS_PREFETCH_QUESTIONS", raising=False)
+    assert config.question_prefetch_enabled is False
+
+    monkeypatch.setenv("PROMPTHEUS_PREFETCH_QUESTIONS", "on")
+    assert config.question_prefetch_enabled is True
+
+    monkeypatch.setenv("PROMPTHEUS_PREFETCH_QUESTIONS", "0")
+    assert config.question_prefetch_enabled is False
@@ -368,6 +368,130 @@ def test_determine_question_plan_declined_questions_use_light_refinement(monkeyp
     assert plan.questions == []
 
 
+class SpeculativeProvider(LLMProvider):
+    """Provider stub that reports an analysis task and counts light refinements."""
+
+    name = "stub-speculative"
+
+    def __init__(self):
+        self.light_refine_calls = 0
+
+    def generate_questions(self, initial_prompt, system_instruction):
+        return {"task_type": "analysis", "questions": []}
+
+    def get_available_models(self):
+        return []
+
+    def _generate_text(self, prompt, system_instruction, json_mode=False, max_tokens=None):
+        self.light_refine_calls += 1
+        return f"Light: {prompt}"
+
+
+def test_non_interactive_plan_prefetches_light_refinement(monkeypatch):
+    """Without a TTY, light refinement runs alongside question analysis and is reused."""
+
+    io_ctx, _ = _build_io_context(quiet_output=True, stdin_is_tty=False, stdout_is_tty=False)
+    provider = SpeculativeProvider()
+    args = Namespace(skip_questions=False, quick=False, copy=False, edit=False, refine=False)
+    config = DummyConfig()
+
+    monkeypatch.setattr("promptheus.main.get_history", lambda cfg: Mock())
+    monkeypatch.setattr("promptheus.main.display_output", lambda prompt, io, is_refined=True: None)
+
+    result = process_single_prompt(provider, "Review this plan", args, False, False, io_ctx, config)
+
+    assert result == ("Light: Review this plan", "analysis")
+    assert provider.light_refine_calls == 1
+
+
+def test_non_interactive_generation_without_questions_uses_prefetched_refinement(monkeypatch):
+    """A generation task with no questions still uses the speculative refinement."""
+
+    class NoQuestionsProvider(SpeculativeProvider):
+        def generate_questions(self, initial_prompt, system_instruction):
+            return {"task_type": "generation", "questions": []}
+
+    io_ctx, _ = _build_io_context(quiet_output=True, stdin_is_tty=False, stdout_is_tty=False)
+    provider = NoQuestionsProvider()
+    args = Namespace(skip_questions=False, quick=False, copy=False, edit=False, refine=False)
+
+    monkeypatch.setattr("promptheus.main.get_history", lambda cfg: Mock())
+    monkeypatch.setattr("promptheus.main.display_output", lambda prompt, io, is_refined=True: None)
+
+    result = process_single_prompt(provider, "Write a haiku", args, False, False, io_ctx, DummyConfig())
+
+    assert result == ("Light: Write a haiku", "generation")
+    assert provider.light_refine_calls == 1
+
+
+def test_prefetched_refinement_reports_its_own_usage_and_latency(monkeypatch):
+    """Speculative refinement telemetry is not overwritten by the concurrent question call."""
+    import threading
+
+    refined = threading.Event()
+
+    class UsageProvider(SpeculativeProvider):
+        def generate_questions(self, initial_prompt, system_instruction):
+            # Finish after the refinement so the shared attributes hold our counts
+            refined.wait(timeout=5)
+            self._set_token_usage(100, 100, 200)
+            return super().generate_questions(initial_prompt, system_instruction)
+
+        def _generate_text(self, prompt, system_instruction, json_mode=False, max_tokens=None):
+            self._set_token_usage(1, 2, 3)
+            refined.set()
+            return super()._generate_text(prompt, system_instruction, json_mode, max_tokens)
+
+    io_ctx, _ = _build_io_context(quiet_output=True, stdin_is_tty=False, stdout_is_tty=False)
+    provider = UsageProvider()
+    args = Namespace(skip_questions=False, quick=False, copy=False, edit=False, refine=False)
+    events = []
+
+    monkeypatch.setattr("promptheus.main.get_history", lambda cfg: Mock())
+    monkeypatch.setattr("promptheus.main.display_output", lambda prompt, io, is_refined=True: None)
+    monkeypatch.setattr("promptheus.main.telemetry_enabled", lambda: True)
+    monkeypatch.setattr("promptheus.main.record_prompt_run_event", lambda **kwargs: events.append(kwargs))
+
+    process_single_prompt(provider, "Review this plan", args, False, False, io_ctx, DummyConfig())
+
+    assert provider.last_total_tokens == 200
+    (event,) = events
+    assert (event["input_tokens"], event["output_tokens"], event["total_tokens"]) == (1, 2, 3)
+    assert event["llm_latency_sec"] is not None
+
+
+def test_process_single_prompt_skips_telemetry_when_disabled(monkeypatch):
+    """Disabled telemetry skips building the run event altogether."""
+
+    io_ctx, _ = _build_io_context(quiet_output=True, stdin_is_tty=False, stdout_is_tty=False)
+    args = Namespace(skip_questions=True, quick=False, copy=False, edit=False, refine=False)
+    record = Mock()
+
+    monkeypatch.setattr("promptheus.main.get_history", lambda cfg: Mock())
+    monkeypatch.setattr("promptheus.main.display_output", lambda prompt, io, is_refined=True: None)
+    monkeypatch.setattr("promptheus.main.telemetry_enabled", lambda: False)
+    monkeypatch.setattr("promptheus.main.record_prompt_run_event", record)
+    monkeypatch.setattr("promptheus.main.record_clarifying_questions_summary", record)
+
+    result = process_single_prompt(FullFlowProvider(), "Review this plan", args, False, False, io_ctx, DummyConfig())
+
+    assert result is not None
+    record.assert_not_called()
+
+
+def test_interactive_plan_does_not_speculate():
+    """With a TTY the user may answer questions, so no speculative refinement runs."""
+
+    io_ctx, _ = _build_io_context(quiet_output=True, stdin_is_tty=True, stdout_is_tty=False)
+    provider = SpeculativeProvider()
+    args = Namespace(skip_questions=False, refine=False)
+
+    plan = determine_question_plan(provider, "Review this plan", args, False, io_ctx, DummyConfig())
+
+    assert plan.prefetched_refinement is None
+    assert provider.light_refine_calls == 0
+
+
 def test_process_single_prompt_history_failure_does_not_abort(monkeypatch):
     """Regression: history persistence errors should not prevent returning prompts."""
 
@@ -519,3 +643,33 @@ def test_iterative_refinement_rejects_unexpected_shrink(mock_display_output, mon
 
     assert "long prompt" in final_prompt  # reverted to original
     mock_display_output.assert_not_called()
+
+
+def test_generate_final_prompt_streams_on_terminal():
+    """Streaming providers render the refinement live when stderr is a terminal."""
+
+    class StreamingProvider(MockProvider):
+        supports_streaming = True
+
+        def _stream_text(self, prompt, system_instruction, *, max_tokens=None):
+            yield "Refined"
+            yield " prompt"
+
+    stderr_buffer = StringIO()
+    io_ctx = IOContext(
+        stdin_is_tty=True,
+        stdout_is_tty=True,
+        console_out=Console(file=StringIO(), force_terminal=False, color_system=None),
+        console_err=Console(file=stderr_buffer, force_terminal=True, color_system=None),
+        notify=Mock(),
+        quiet_output=False,
+        plain_mode=False,
+    )
+    provider = StreamingProvider()
+
+    with patch.object(provider, "refine_from_answers") as mock_refine:
+        final_prompt, is_refined = generate_final_prompt(provider, "task", {"q": "a"}, {}, io_ctx)
+
+    assert (final_prompt, is_refined) == ("Refined prompt", True)
+    mock_refine.assert_not_called()
+    assert "Refined prompt" in stderr_buffer.getvalue()
@@ -118,6 +118,66 @@ def test_get_recent_with_limit():
         assert entries[2].original_prompt == "Prompt 2"
 
 
+def test_get_recent_previews():
+    """Recent previews pair 1-based indices with truncated original prompts."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        history = PromptHistory(history_dir=Path(tmpdir))
+        history.save_entry("short", "Refined", "generation")
+        history.save_entry("x" * 51, "Refined", "generation")
+
+        assert history.get_recent_previews(limit=2) == [("1", "x" * 50 + "..."), ("2", "short")]
+
+
+def test_load_history_parses_only_appended_lines():
+    """Repeated loads parse new lines only, and re-read the file after a rewrite."""
+    from unittest.mock import patch
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        history = PromptHistory(history_dir=Path(tmpdir))
+        for i in range(3):
+            history.save_entry(f"Prompt {i}", f"Refined {i}", "generation")
+        assert len(history.get_recent(10)) == 3
+
+        history.save_entry("Prompt 3", "Refined 3", "generation")
+        with patch.object(HistoryEntry, "from_dict", wraps=HistoryEntry.from_dict) as from_dict:
+            recent = history.get_recent(10)
+        assert [e.original_prompt for e in recent] == ["Prompt 3", "Prompt 2", "Prompt 1", "Prompt 0"]
+        assert from_dict.call_count == 1
+
+        # Another writer replaces the file with different content
+        other = PromptHistory(history_dir=Path(tmpdir))
+        other.clear()
+        other.save_entry("Fresh", "Refined", "generation")
+        assert [e.original_prompt for e in history.get_recent(10)] == ["Fresh"]
+
+        # A final line without a newline is still returned
+        with open(history.history_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(HistoryEntry("2024-01-01T00:00:00", "Partial", "R").to_dict()))
+        assert history.get_recent(1)[0].original_prompt == "Partial"
+        assert len(history.get_recent(10)) == 2
+
+
+def test_get_history_reuses_instance_for_same_directory(tmp_path, monkeypatch):
+    """A fresh config per call keeps the shared instance (and its parsed entries)."""
+    from unittest.mock import Mock
+
+    import promptheus.history as history_module
+
+    monkeypatch.setattr(history_module, "_history_instance", None)
+    monkeypatch.setenv("PROMPTHEUS_HISTORY_DIR", str(tmp_path / "a"))
+    first_config, second_config = Mock(history_enabled=True), Mock(history_enabled=False)
+
+    history = history_module.get_history(first_config)
+    assert history_module.get_history(second_config) is history
+    assert history.enabled is False
+    assert history_module.get_history() is history
+
+    monkeypatch.setenv("PROMPTHEUS_HISTORY_DIR", str(tmp_path / "b"))
+    moved = history_module.get_history(first_config)
+    assert moved is not history
+    assert moved.history_dir == tmp_path / "b"
+
+
 def test_get_by_index():
     """Test getting entry by index (1-based, most recent first)."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -140,6 +140,41 @@ def test_refine_prompt_returns_clarification_needed_when_questions_present():
     }
 
 
+def test_refine_prompt_reuses_mapping_from_clarification_round():
+    """A follow-up call with answers should recover the questions issued for that prompt."""
+    mcp_server._clarification_cache.clear()
+    analysis_result = {
+        "task_type": "generation",
+        "questions": [{"question": "Who is the audience?", "type": "text"}],
+    }
+    _stub_provider(analysis_result=analysis_result)
+    first = mcp_server.refine_prompt(prompt="Draft release notes")
+    assert first["type"] == "clarification_needed"
+
+    fake = _stub_provider(analysis_result=None)
+    result = mcp_server.refine_prompt(
+        prompt="Draft release notes", answers={"q0": "End users"}
+    )
+
+    assert result["type"] == "refined"
+    _, _, _, mapping, _ = fake.calls[0]
+    assert mapping == {"q0": "Who is the audience?"}
+
+
+def test_recall_question_mapping_expires_entries(monkeypatch):
+    """Cached question mappings older than the TTL should be discarded."""
+    mcp_server._clarification_cache.clear()
+    mcp_server._remember_question_mapping("Old prompt", {"q0": "Stale?"})
+
+    assert mcp_server._recall_question_mapping("Old prompt") == {"q0": "Stale?"}
+
+    later = mcp_server.time.monotonic() + mcp_server.CLARIFICATION_CACHE_TTL + 1
+    monkeypatch.setattr(mcp_server.time, "monotonic", lambda: later)
+
+    assert mcp_server._recall_question_mapping("Old prompt") is None
+    assert not mcp_server._clarification_cache
+
+
 def test_refine_prompt_uses_answer_mapping_when_provided():
     """When answer_mapping is provided, refine_prompt should pass it through to the provider."""
     fake = _stub_provider(analysis_result=None)
@@ -181,6 +216,39 @@ def test_refine_prompt_light_refine_when_no_questions():
     assert any(call[0] == "light_refine" for call in fake.calls)
 
 
+def test_refine_prompt_reuses_cached_light_refinement():
+    """Repeating a prompt that needed no questions should skip the provider calls."""
+    mcp_server._refinement_cache.clear()
+    analysis_result = {"task_type": "analysis", "questions": []}
+    _stub_provider(analysis_result=analysis_result)
+    first = mcp_server.refine_prompt(prompt="Summarize the design doc")
+
+    fake = _stub_provider(analysis_result=analysis_result)
+    second = mcp_server.refine_prompt(prompt="Summarize the design doc")
+
+    assert second == first
+    assert fake.calls == []
+
+
+def test_refine_prompt_cached_light_refinement_is_keyed_by_served_model():
+    """Cached refinements are not shared between providers serving different models."""
+    mcp_server._refinement_cache.clear()
+    analysis_result = {"task_type": "analysis", "questions": []}
+    first_fake = _stub_provider(analysis_result=analysis_result)
+    first_fake.model_name = "model-a"
+    mcp_server.refine_prompt(prompt="Summarize the design doc")
+
+    fake = _stub_provider(analysis_result=analysis_result)
+    fake.model_name = "model-b"
+    mcp_server.refine_prompt(prompt="Summarize the design doc")
+
+    assert any(call[0] == "light_refine" for call in fake.calls)
+    assert {key[:2] for key in mcp_server._refinement_cache} == {
+        ("FakeProvider", "model-a"),
+        ("FakeProvider", "model-b"),
+    }
+
+
 def test_refine_prompt_light_refine_on_analysis_failure():
     """If generate_questions fails (returns None), refine_prompt should perform light refinement."""
     fake = _stub_provider(analysis_result=None)
@@ -579,6 +647,16 @@ def test_build_question_mapping():
     }
 
 
+def test_synthetic_mapping_labels_keys_on_access():
+    """_SyntheticMapping should expose generic labels only for known keys."""
+    mapping = mcp_server._SyntheticMapping(["q0", "q1"])
+
+    assert list(mapping) == ["q0", "q1"]
+    assert len(mapping) == 2
+    assert mapping["q1"] == "Question: q1"
+    assert mapping.get("q2") is None
+
+
 def test_ask_user_question_injection():
     """set_ask_user_question should inject custom function."""
     original_fn = mcp_server._ask_user_question_fn
@@ -648,6 +726,56 @@ def test_refine_prompt_uses_interactive_answers_when_available():
         mcp_server.set_ask_user_question(original_fn)
 
 
+def test_try_interactive_questions_concurrent_mode(monkeypatch):
+    """Concurrent mode should ask every question and keep answers keyed by id."""
+    questions = [
+        {"question": "Who is the audience?", "type": "text"},
+        {"question": "Which formats?", "type": "checkbox", "options": ["PDF", "HTML"]},
+    ]
+    asked: List[str] = []
+
+    def ask_user_fn(batch):
+        question = batch[0]
+        asked.append(question["id"])
+        if question["multiSelect"]:
+            return {question["id"]: ["PDF", "HTML"]}
+        return {question["id"]: "Developers"}
+
+    monkeypatch.setattr(mcp_server, "ASK_USER_CONCURRENT", True)
+    monkeypatch.setattr(mcp_server, "_ask_user_question_fn", ask_user_fn)
+
+    answers = mcp_server._try_interactive_questions(questions)
+
+    assert sorted(asked) == ["q0", "q1"]
+    assert answers == {"q0": "Developers", "q1": "PDF, HTML"}
+
+
+def test_try_interactive_questions_concurrent_falls_back_to_sequential(monkeypatch):
+    """Only questions whose concurrent call failed should be asked again."""
+    questions = [
+        {"question": "Who is the audience?", "type": "text"},
+        {"question": "Preferred tone?", "type": "text"},
+    ]
+    state = {"calls": 0}
+    asked: List[str] = []
+
+    def ask_user_fn(batch):
+        state["calls"] += 1
+        asked.append(batch[0]["id"])
+        if state["calls"] == 1:
+            raise RuntimeError("client busy")
+        return {batch[0]["id"]: "ok"}
+
+    monkeypatch.setattr(mcp_server, "ASK_USER_CONCURRENT", True)
+    monkeypatch.setattr(mcp_server, "ASK_USER_MAX_WORKERS", 1)
+    monkeypatch.setattr(mcp_server, "_ask_user_question_fn", ask_user_fn)
+
+    answers = mcp_server._try_interactive_questions(questions)
+
+    assert answers == {"q0": "ok", "q1": "ok"}
+    assert asked == ["q0", "q1", "q0"]
+
+
 def test_refine_prompt_falls_back_when_required_answer_missing():
     """If AskUserQuestion omits a required answer, refine_prompt should fall back to clarification_needed."""
     analysis_result = {
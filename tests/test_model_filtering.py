@@ -2,6 +2,8 @@
 
 import asyncio
 
+import pytest
+
 from promptheus.models_dev_service import ModelsDevService
 
 
@@ -74,6 +76,40 @@ class TestIsSuitableForRefinement:
         assert self.svc._is_suitable_for_refinement(info) is False
 
 
+# ---------------------------------------------------------------------------
+# _is_text_generation_model -- pattern exclusions
+# ---------------------------------------------------------------------------
+
+class TestIsTextGenerationModel:
+
+    def setup_method(self):
+        self.svc = _make_service()
+
+    def test_plain_chat_model_passes(self):
+        info = {"id": "gpt-4o", "modalities": {"input": ["text"], "output": ["text"]}}
+        assert self.svc._is_text_generation_model(info) is True
+
+    def test_embedding_model_rejected(self):
+        info = {"id": "text-embedding-3-small", "modalities": {"input": ["text"], "output": ["text"]}}
+        assert self.svc._is_text_generation_model(info) is False
+
+    def test_excluded_family_rejected(self):
+        info = {"id": "m1", "family": "Voice", "modalities": {"input": ["text"], "output": ["text"]}}
+        assert self.svc._is_text_generation_model(info) is False
+
+    def test_vision_model_with_text_input_passes(self):
+        info = {"id": "llama-vision", "modalities": {"input": ["text", "image"], "output": ["text"]}}
+        assert self.svc._is_text_generation_model(info) is True
+
+    def test_vision_model_without_text_input_rejected(self):
+        info = {"id": "image-captioner", "modalities": {"input": ["image"], "output": ["text"]}}
+        assert self.svc._is_text_generation_model(info) is False
+
+    def test_vision_model_with_excluded_pattern_rejected(self):
+        info = {"id": "vision-video-gen", "modalities": {"input": ["text"], "output": ["text"]}}
+        assert self.svc._is_text_generation_model(info) is False
+
+
 # ---------------------------------------------------------------------------
 # get_models_for_provider_split -- 3-tuple partitioning
 # ---------------------------------------------------------------------------
@@ -143,6 +179,33 @@ def test_unfiltered_returns_all_models():
     assert set(models) == set(MOCK_MODELS.keys())
 
 
+def test_split_memoized_until_cache_changes(monkeypatch):
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}})
+    calls = []
+    original = ModelsDevService._split_models
+
+    def counting_split(self, provider_id):
+        calls.append(provider_id)
+        return original(self, provider_id)
+
+    monkeypatch.setattr(ModelsDevService, "_split_models", counting_split)
+
+    first = asyncio.run(svc.get_models_for_provider_split("openai"))
+    first[0].append("mutated")
+    second = asyncio.run(svc.get_models_for_provider_split("openai"))
+
+    assert calls == ["openai"]
+    assert "mutated" not in second[0]
+
+    svc.clear_cache()
+    svc._cache = {"openai": {"models": SORT_MOCK_MODELS}}
+    svc._cache_timestamp = 9999999999
+    third = asyncio.run(svc.get_models_for_provider_split("openai"))
+
+    assert calls == ["openai", "openai"]
+    assert set(third[0]) == set(SORT_MOCK_MODELS)
+
+
 # ---------------------------------------------------------------------------
 # _model_sort_key -- metadata-driven ranking
 # ---------------------------------------------------------------------------
@@ -220,3 +283,300 @@ def test_sort_key_unit():
 
     empty = {}
     assert svc._model_sort_key(empty) > svc._model_sort_key(high)
+
+
+# ---------------------------------------------------------------------------
+# HTTP session lifecycle
+# ---------------------------------------------------------------------------
+
+def test_session_reused_until_closed():
+    svc = _make_service()
+
+    async def _exercise():
+        first = await svc._get_session()
+        second = await svc._get_session()
+        assert first is second
+        await svc.aclose()
+        assert first.closed
+        assert svc._session is None
+        # Closing again is a no-op
+        await svc.aclose()
+
+    asyncio.run(_exercise())
+
+
+def test_session_replaced_cleanly_across_event_loops():
+    import gc
+    import warnings
+
+    svc = _make_service()
+    first = asyncio.run(svc._get_session())
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        second = asyncio.run(svc._get_session())
+        assert first.closed
+        assert second is not first
+        del first
+        gc.collect()
+
+    assert not [w for w in caught if "Unclosed" in str(w.message)]
+    asyncio.run(svc.aclose())
+
+
+def test_session_that_fails_to_close_is_dropped(caplog):
+    import logging
+
+    svc = _make_service()
+    first = asyncio.run(svc._get_session())
+
+    async def refuse_to_close():
+        raise RuntimeError("Event loop is closed")
+
+    first.close = refuse_to_close
+    with caplog.at_level(logging.DEBUG, logger="promptheus.models_dev_service"):
+        second = asyncio.run(svc._get_session())
+
+    assert second is not first
+    assert "failed to close" in caplog.text
+    asyncio.run(svc.aclose())
+    first.detach()
+
+
+# ---------------------------------------------------------------------------
+# Disk cache persistence
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("use_msgpack", [True, False])
+def test_save_and_load_cache_round_trip(tmp_path, monkeypatch, use_msgpack):
+    from promptheus import models_dev_service
+
+    if use_msgpack and models_dev_service.msgpack is None:
+        pytest.skip("msgpack not installed")
+    if not use_msgpack:
+        monkeypatch.setattr(models_dev_service, "msgpack", None)
+
+    cache_file = tmp_path / "models_cache.json"
+    monkeypatch.setattr(models_dev_service, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(models_dev_service, "CACHE_FILE", cache_file)
+
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}}, timestamp=1234.0)
+    asyncio.run(svc._save_cache_to_disk())
+
+    written = tmp_path / ("models_cache.mp" if use_msgpack else "models_cache.json")
+    assert written.exists()
+    assert list(tmp_path.glob("*.tmp")) == []
+
+    fresh = ModelsDevService()
+    asyncio.run(fresh._load_cache_from_disk())
+    assert fresh._cache == {"openai": {"models": MOCK_MODELS}}
+    assert fresh._cache_timestamp == 1234.0
+
+
+def test_load_cache_falls_back_to_legacy_json(tmp_path, monkeypatch):
+    from promptheus import models_dev_service
+    from promptheus.utils import json_dumps_bytes
+
+    cache_file = tmp_path / "models_cache.json"
+    monkeypatch.setattr(models_dev_service, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(models_dev_service, "CACHE_FILE", cache_file)
+    cache_file.write_bytes(json_dumps_bytes({"cache": {"openai": {}}, "timestamp": 99.0}))
+    # An unreadable msgpack file must not shadow the JSON cache
+    (tmp_path / "models_cache.mp").write_bytes(b"\xc1garbage")
+
+    svc = ModelsDevService()
+    asyncio.run(svc._load_cache_from_disk())
+
+    assert svc._cache == {"openai": {}}
+    assert svc._cache_timestamp == 99.0
+
+
+def test_get_all_models_covers_every_provider():
+    from promptheus.models_dev_service import MODELS_DEV_IDS, PROVIDER_ID_MAPPING
+
+    cache = {PROVIDER_ID_MAPPING[pid]: {"models": {}} for pid in MODELS_DEV_IDS}
+    cache["openai"] = {"models": MOCK_MODELS}
+    svc = _make_service(cache=cache)
+
+    result = asyncio.run(svc.get_all_models())
+
+    assert set(result) == MODELS_DEV_IDS
+    assert "good-chat-model" in result["openai"]
+    assert result["google"] == []
+
+
+def test_ensure_cache_loaded_fast_path_skips_expiry_check(monkeypatch):
+    import time
+
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}}, timestamp=time.time())
+    asyncio.run(svc._ensure_cache_loaded())
+    assert svc._cache_valid_until > time.monotonic()
+
+    def _fail(self):
+        raise AssertionError("expiry check should be skipped on the fast path")
+
+    monkeypatch.setattr(ModelsDevService, "_is_cache_expired", _fail)
+    asyncio.run(svc._ensure_cache_loaded())
+
+    svc.clear_cache()
+    assert svc._cache_valid_until == 0.0
+
+
+def test_unchanged_payload_keeps_parsed_cache_and_splits():
+    import json as stdlib_json
+
+    svc = ModelsDevService()
+    raw = stdlib_json.dumps({"openai": {"models": MOCK_MODELS}}).encode()
+
+    svc._apply_payload(raw)
+    first_cache = svc._cache
+    asyncio.run(svc.get_models_for_provider_split("openai"))
+    first_split = next(iter(svc._split_cache.values()))
+
+    svc._apply_payload(raw)
+    assert svc._cache is first_cache
+    assert svc._split_cache == {("openai", svc._cache_timestamp): first_split}
+
+    changed = stdlib_json.dumps({"openai": {"models": SORT_MOCK_MODELS}}).encode()
+    svc._apply_payload(changed)
+    assert svc._cache is not first_cache
+    assert svc._split_cache == {}
+
+
+def test_sync_helper_inside_running_loop_uses_bridge(monkeypatch):
+    from promptheus import models_dev_service
+
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}})
+    monkeypatch.setattr(models_dev_service, "_bridge_service", svc)
+
+    async def _call_from_loop():
+        first = models_dev_service.get_sync_models_for_provider("openai")
+        loop = models_dev_service._bridge_loop
+        second = models_dev_service.get_sync_models_for_provider("openai")
+        assert models_dev_service._bridge_loop is loop
+        return first, second
+
+    first, second = asyncio.run(_call_from_loop())
+    assert "good-chat-model" in first
+    assert first == second
+
+
+def test_bridge_keeps_session_and_does_not_wait_for_refresh(monkeypatch):
+    import time
+    from promptheus import models_dev_service
+
+    stale_ts = time.time() - models_dev_service.CACHE_DURATION - 60
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}}, timestamp=stale_ts)
+    monkeypatch.setattr(models_dev_service, "_bridge_service", svc)
+    refresh_started = []
+
+    async def slow_fetch(self):
+        await self._get_session()
+        refresh_started.append(True)
+        await asyncio.sleep(30)
+
+    monkeypatch.setattr(ModelsDevService, "_fetch_cache", slow_fetch)
+
+    async def _call_from_loop():
+        return models_dev_service.get_sync_models_for_provider("openai")
+
+    started = time.monotonic()
+    models = asyncio.run(_call_from_loop())
+    assert time.monotonic() - started < 5
+    assert "good-chat-model" in models
+
+    loop = models_dev_service._bridge_loop
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(timeout=5)
+    assert refresh_started == [True]
+    assert svc._session is not None and not svc._session.closed
+
+    loop.call_soon_threadsafe(svc._refresh_task.cancel)
+    asyncio.run_coroutine_threadsafe(svc._session.close(), loop).result(timeout=5)
+
+
+def test_get_model_metadata_uses_provider_index():
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}})
+
+    assert asyncio.run(svc.get_model_metadata("openai", "good-chat-model")) == MOCK_MODELS["good-chat-model"]
+    assert asyncio.run(svc.get_model_metadata("openai", "missing")) is None
+    # Providers absent from the payload resolve to an empty model set
+    assert asyncio.run(svc.get_model_metadata("google", "good-chat-model")) is None
+    assert asyncio.run(svc.get_model_metadata("unknown", "good-chat-model")) is None
+
+
+def test_release_number_parsing():
+    from promptheus.models_dev_service import _release_number
+
+    assert _release_number("2025-06-15") == 20250615
+    assert _release_number("2025-06") == 202506
+    assert _release_number("") == 0
+    assert _release_number("2025-xx-01") == 0
+
+
+def test_stale_cache_served_while_refreshing_in_background(monkeypatch):
+    import time
+    from promptheus import models_dev_service
+
+    stale_ts = time.time() - models_dev_service.CACHE_DURATION - 60
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}}, timestamp=stale_ts)
+    refreshed = []
+
+    async def fake_fetch(self):
+        await asyncio.sleep(0)
+        refreshed.append(True)
+        svc._cache_timestamp = time.time()
+
+    monkeypatch.setattr(ModelsDevService, "_fetch_cache", fake_fetch)
+
+    async def _exercise():
+        models = await svc.get_models_for_provider("openai")
+        # Answered from the stale cache before the refresh ran
+        assert refreshed == []
+        task = svc._refresh_task
+        # A second call while the refresh is in flight does not start another
+        await svc.get_models_for_provider("openai")
+        assert svc._refresh_task is task
+        await svc.aclose()
+        return models
+
+    models = asyncio.run(_exercise())
+    assert "good-chat-model" in models
+    assert refreshed == [True]
+
+
+def test_very_old_cache_blocks_on_refresh(monkeypatch):
+    import time
+    from promptheus import models_dev_service
+
+    old_ts = time.time() - models_dev_service.CACHE_STALE_OK_DURATION - 60
+    svc = _make_service(cache={"openai": {"models": MOCK_MODELS}}, timestamp=old_ts)
+    refreshed = []
+
+    async def fake_fetch(self):
+        refreshed.append(True)
+        svc._cache_timestamp = time.time()
+
+    monkeypatch.setattr(ModelsDevService, "_fetch_cache", fake_fetch)
+
+    asyncio.run(svc.get_models_for_provider("openai"))
+    assert refreshed == [True]
+    assert svc._refresh_task.done()
+
+
+def test_concurrent_refreshes_share_one_fetch(monkeypatch):
+    svc = _make_service()
+    fetches = []
+
+    async def fake_fetch(self):
+        fetches.append(True)
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(ModelsDevService, "_fetch_cache", fake_fetch)
+
+    async def _exercise():
+        await asyncio.gather(*(svc.refresh_cache() for _ in range(5)))
+        await svc.refresh_cache()
+
+    asyncio.run(_exercise())
+    # Five overlapping calls coalesce; the later call starts a new fetch
+    assert fetches == [True, True]
@@ -59,6 +59,31 @@ def test_parse_question_payload_invalid_json():
     assert result is None
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_generate_questions_json_parsing(monkeypatch, use_orjson):
+    """Question payloads parse, and reject bad JSON, with or without orjson."""
+    from promptheus import utils
+
+    if use_orjson and utils.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    payload = '{"task_type": "analysis", "questions": [{"question": "Scope?"}]}'
+    gemini = GeminiProvider(api_key="AIza-test-key")
+    anthropic = AnthropicProvider(api_key="sk-ant-test")
+
+    with patch.object(GeminiProvider, "_generate_text", return_value=payload):
+        assert gemini.generate_questions("prompt", "system")["task_type"] == "analysis"
+    with patch.object(AnthropicProvider, "_generate_text", return_value=f"```json\n{payload}\n```"):
+        assert anthropic.generate_questions("prompt", "system")["questions"] == [{"question": "Scope?"}]
+
+    with patch.object(GeminiProvider, "_generate_text", return_value="{not json"):
+        assert gemini.generate_questions("prompt", "system") is None
+    with patch.object(AnthropicProvider, "_generate_text", return_value="{not json"):
+        assert anthropic.generate_questions("prompt", "system") is None
+
+
 def test_parse_question_payload_missing_task_type():
     """Test parsing of JSON without task_type."""
     json_without_task_type = '{"questions": [{"question": "Test?"}]}'
@@ -186,6 +211,37 @@ def test_provider_factory_openai(monkeypatch):
     assert provider.model_name == "gpt-4o-mini"
 
 
+def test_get_shared_provider_reuses_instances_per_settings(monkeypatch):
+    """Identical settings share one provider; a new model or API key builds another."""
+    from promptheus import providers as providers_module
+
+    monkeypatch.setattr(providers_module, "_shared_providers", providers_module.OrderedDict())
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    sample_models = {
+        "providers": {
+            "google": {
+                "default_model": "gemini-pro",
+                "models": ["gemini-pro", "gemini-1.5-pro"],
+                "api_key_env": "GEMINI_API_KEY",
+            }
+        },
+        "provider_aliases": {"gemini": "google"},
+    }
+    monkeypatch.setattr("promptheus.config.Config.load_provider_config", lambda self: sample_models)
+
+    def fresh_config():
+        config = Config()
+        config.set_provider("google")
+        return config
+
+    provider = providers_module.get_shared_provider("google", fresh_config(), "gemini-pro")
+    assert providers_module.get_shared_provider("google", fresh_config(), "gemini-pro") is provider
+    assert providers_module.get_shared_provider("google", fresh_config(), "gemini-1.5-pro") is not provider
+
+    monkeypatch.setenv("GEMINI_API_KEY", "rotated-key")
+    assert providers_module.get_shared_provider("google", fresh_config(), "gemini-pro") is not provider
+
+
 def test_provider_factory_unknown():
     """Test provider factory function with unknown provider."""
     config = Mock()
@@ -194,6 +250,20 @@ def test_provider_factory_unknown():
         get_provider("unknown", config)
 
 
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"task_type": "analysis"}', '{"task_type": "analysis"}'),
+        ('Here you go:\n```json\n{"a": 1}\n```\nThanks', '{"a": 1}'),
+        ('```\n{"a": 2}\n```', '{"a": 2}'),
+        ('```json\n{"a": 3}', '{"a": 3}'),
+    ],
+)
+def test_extract_json_block(text, expected):
+    """Fenced JSON is unwrapped; bare JSON passes through untouched."""
+    assert AnthropicProvider._extract_json_block(text) == expected
+
+
 def test_format_refinement_payload():
     """Test formatting of refinement payload."""
     # Since _format_refinement_payload is a concrete method that doesn't use abstract methods,
@@ -212,6 +282,28 @@ def test_format_refinement_payload():
     assert "Please generate a refined, optimized prompt" in payload
 
 
+def test_format_refinement_payload_exact_layout():
+    """Payload layout stays stable, including list and empty answers."""
+    provider = MockProvider()
+
+    payload = provider._format_refinement_payload(
+        "Draft",
+        {"formats": ["md", "pdf"], "extras": [], "notes": ""},
+        {"formats": "Which formats?"},
+    )
+
+    assert payload == (
+        "Initial Prompt: Draft\n"
+        "\n"
+        "User's Answers to Clarifying Questions:\n"
+        "- Which formats?: md, pdf\n"
+        "- extras: None selected\n"
+        "- notes: None provided\n"
+        "\n"
+        "Please generate a refined, optimized prompt based on this information."
+    )
+
+
 def test_format_tweak_payload():
     """Test formatting of tweak payload."""
     # Use the mock provider to test the concrete method
@@ -295,6 +387,293 @@ def test_light_refine():
         mock_gen.assert_called_once()
 
 
+def test_gemini_reuses_generation_config():
+    """Identical generation settings share one GenerateContentConfig."""
+    pytest.importorskip("google.genai")
+    provider = GeminiProvider(api_key="AIza-test-key", model_name="gemini-pro")
+
+    first = provider._get_generation_config("system", False, 100)
+    assert provider._get_generation_config("system", False, 100) is first
+    assert first.max_output_tokens == 100
+
+    json_config = provider._get_generation_config("system", True, 100)
+    assert json_config is not first
+    assert json_config.response_mime_type == "application/json"
+
+
+def test_sdk_clients_are_created_lazily(monkeypatch):
+    """Gemini and Anthropic defer SDK client construction until first use."""
+    import sys
+
+    created = []
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+    fake_anthropic = Mock(Anthropic=FakeClient)
+    monkeypatch.setitem(sys.modules, "anthropic", fake_anthropic)
+
+    provider = AnthropicProvider(api_key="sk-ant-test", model_name="claude-test")
+    assert created == []
+
+    client = provider.client
+    assert isinstance(client, FakeClient)
+    assert provider.client is client
+    from promptheus.constants import DEFAULT_PROVIDER_TIMEOUT
+
+    assert created == [{"api_key": "sk-ant-test", "timeout": DEFAULT_PROVIDER_TIMEOUT}]
+
+    gemini = GeminiProvider(api_key="AIza-test-key")
+    assert gemini._client is None
+    replacement = object()
+    gemini.client = replacement
+    assert gemini.client is replacement
+
+
+def test_anthropic_streams_text_deltas():
+    """Anthropic streaming yields text deltas and records final usage."""
+    from types import SimpleNamespace
+
+    stream = MagicMock()
+    stream.__enter__.return_value = stream
+    stream.text_stream = iter(["Hello", "", " world"])
+    stream.get_final_message.return_value = SimpleNamespace(
+        usage=SimpleNamespace(input_tokens=3, output_tokens=2)
+    )
+
+    provider = AnthropicProvider(api_key="sk-ant-test", model_name="claude-test")
+    provider.client = Mock()
+    provider.client.messages.stream.return_value = stream
+
+    assert list(provider.stream_light_refine("prompt", "system")) == ["Hello", " world"]
+    assert provider.client.messages.stream.call_args.kwargs["system"] == "system"
+    assert provider.last_total_tokens == 5
+
+
+def test_gemini_streams_text_chunks():
+    """Gemini streaming yields chunk text via generate_content_stream."""
+    from types import SimpleNamespace
+    from promptheus.exceptions import ProviderAPIError
+
+    pytest.importorskip("google.genai")
+    provider = GeminiProvider(api_key="AIza-test-key", model_name="gemini-pro")
+    provider.client = Mock()
+    provider.client.models.generate_content_stream.return_value = iter([
+        SimpleNamespace(text="Refined", usage_metadata=None),
+        SimpleNamespace(text=" prompt", usage_metadata={"prompt_token_count": 4, "candidates_token_count": 2}),
+    ])
+
+    chunks = list(provider.stream_refine_from_answers("task", {"q": "a"}, {}, "system"))
+    assert chunks == ["Refined", " prompt"]
+    assert provider.last_total_tokens == 6
+
+    provider.client.models.generate_content_stream.return_value = iter([])
+    with pytest.raises(ProviderAPIError):
+        list(provider.stream_light_refine("prompt", "system"))
+
+
+def test_stream_text_falls_back_to_one_chunk():
+    """Providers without streaming, or with a response cache, yield the whole response."""
+    provider = MockProvider()
+    assert provider.supports_streaming is False
+    assert list(provider.stream_light_refine("prompt", "system")) == ["Mocked response from provider"]
+
+    provider.response_cache = Mock(get=Mock(return_value="cached"))
+    provider.model_name = "test-model"
+    with patch.object(provider, "_stream_text") as mock_stream:
+        assert list(provider.stream_light_refine("prompt", "system")) == ["cached"]
+        mock_stream.assert_not_called()
+
+
+def test_async_api_runs_sync_calls_concurrently():
+    """Async wrappers delegate to the sync methods and can be gathered."""
+    import asyncio
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BlockingProvider(MockProvider):
+        def _generate_text(self, prompt, system_instruction, json_mode=False, max_tokens=None):
+            # Both calls must be in flight at once for the barrier to release
+            barrier.wait()
+            return f"out:{prompt}"
+
+    provider = BlockingProvider()
+
+    async def _run():
+        return await asyncio.gather(
+            provider.alight_refine("one", "system"),
+            provider.agenerate_text("two", "system", max_tokens=10),
+        )
+
+    assert asyncio.run(_run()) == ["out:one", "out:two"]
+
+
+def test_generate_text_single_flights_identical_requests(monkeypatch):
+    """Concurrent identical calls share one provider call and keep the owner's usage."""
+    import threading
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from promptheus import providers
+
+    owner_started = threading.Event()
+    joiner_waiting = threading.Event()
+    release = threading.Event()
+
+    class SignallingFuture(Future):
+        def result(self, timeout=None):
+            joiner_waiting.set()
+            return super().result(timeout)
+
+    monkeypatch.setattr(providers, "Future", SignallingFuture)
+
+    class SlowProvider(MockProvider):
+        calls = 0
+
+        def _generate_text(self, prompt, system_instruction, json_mode=False, max_tokens=None):
+            SlowProvider.calls += 1
+            self.last_input_tokens = 3
+            self.last_output_tokens = 2
+            self.last_total_tokens = 5
+            owner_started.set()
+            release.wait(timeout=5)
+            return f"out:{prompt}"
+
+    provider = SlowProvider()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        owner = pool.submit(provider.generate_text, "same", "system")
+        assert owner_started.wait(timeout=5)
+        joiner = pool.submit(provider.generate_text, "same", "system")
+        assert joiner_waiting.wait(timeout=5)
+        release.set()
+        assert owner.result(timeout=5) == joiner.result(timeout=5) == "out:same"
+
+    assert SlowProvider.calls == 1
+    assert provider.last_total_tokens == 5
+    assert providers._inflight == {}
+
+
+def test_generate_text_single_flight_propagates_errors():
+    """A failed call raises for its caller and is not left registered."""
+    from promptheus import providers
+
+    class FailingProvider(MockProvider):
+        def _generate_text(self, prompt, system_instruction, json_mode=False, max_tokens=None):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        FailingProvider().light_refine("prompt", "system")
+    assert providers._inflight == {}
+
+
+def test_prefetched_response_is_reused_once():
+    """A prefetch_call result serves the next identical request, with its usage, then is consumed."""
+    from promptheus import providers
+
+    class CountingProvider(MockProvider):
+        calls = 0
+
+        def _generate_text(self, prompt, system_instruction, json_mode=False, max_tokens=None):
+            CountingProvider.calls += 1
+            self.last_input_tokens = 4
+            self.last_output_tokens = 6
+            self.last_total_tokens = 10
+            return f"out:{prompt}"
+
+    provider = CountingProvider()
+    assert providers.prefetch_call(provider.light_refine, "draft", "system") == "out:draft"
+
+    provider.last_input_tokens = provider.last_output_tokens = provider.last_total_tokens = None
+    assert provider.light_refine("draft", "system") == "out:draft"
+    assert CountingProvider.calls == 1
+    assert provider.last_total_tokens == 10
+    assert providers._prefetched == {}
+
+    provider.light_refine("draft", "system")
+    assert CountingProvider.calls == 2
+
+
+def test_generate_text_uses_response_cache(tmp_path):
+    """Identical requests are served from the response cache after the first call."""
+    from promptheus.cache import ResponseCache
+
+    provider = MockProvider()
+    provider.model_name = "test-model"
+    provider.response_cache = ResponseCache(tmp_path / "cache.sqlite3")
+    try:
+        with patch.object(provider, '_generate_text', return_value="refined") as mock_gen:
+            assert provider.light_refine("prompt", "system") == "refined"
+            assert provider.light_refine("prompt", "system") == "refined"
+            mock_gen.assert_called_once()
+
+            # A different request is a cache miss
+            provider.tweak_prompt("prompt", "shorter", "system")
+            assert mock_gen.call_count == 2
+    finally:
+        provider.response_cache.close()
+
+
+def test_semantic_cache_only_applies_to_question_generation(tmp_path):
+    """Paraphrased question requests hit the semantic cache; refinements never do."""
+    from promptheus.cache import SemanticCache
+
+    provider = MockProvider()
+    provider.model_name = "test-model"
+    # Embed by prompt length so any two payloads of equal length match
+    provider.semantic_cache = SemanticCache(
+        lambda text: [1.0, float(len(text))], tmp_path / "semantic.sqlite3", threshold=0.999999
+    )
+    try:
+        with patch.object(provider, '_generate_text', return_value="generated") as mock_gen:
+            provider.generate_text("abc", "system", json_mode=True, cache_kind="questions")
+            provider.generate_text("abd", "system", json_mode=True, cache_kind="questions")
+            mock_gen.assert_called_once()
+
+            # Refinements that differ only in the answers must not share output
+            provider.refine_from_answers("task", {"q": "yes"}, {}, "system")
+            provider.refine_from_answers("task", {"q": "no!"}, {}, "system")
+            assert mock_gen.call_count == 3
+
+            provider.light_refine("abc", "system")
+            provider.light_refine("abc", "system")
+            assert mock_gen.call_count == 5
+    finally:
+        provider.semantic_cache.close()
+
+
+def test_get_provider_attaches_response_cache(monkeypatch):
+    """get_provider only wires the response cache in when it is enabled."""
+    sentinel = object()
+    monkeypatch.setattr("promptheus.cache.get_response_cache", lambda: sentinel)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    config = Config()
+    config.set_provider("openai")
+    config.set_response_cache(False)
+    assert get_provider("openai", config, "gpt-4o-mini").response_cache is None
+
+    config.set_response_cache(True)
+    assert get_provider("openai", config, "gpt-4o-mini").response_cache is sentinel
+
+
+def test_get_provider_keeps_semantic_threshold_per_provider(monkeypatch):
+    """Providers share one semantic cache but each keeps its own threshold."""
+    sentinel = object()
+    monkeypatch.setattr("promptheus.cache.get_semantic_cache", lambda: sentinel)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("PROMPTHEUS_SEMANTIC_CACHE", "1")
+
+    config = Config()
+    config.set_provider("openai")
+    monkeypatch.setenv("PROMPTHEUS_SEMANTIC_CACHE_THRESHOLD", "0.9")
+    strict = get_provider("openai", config, "gpt-4o-mini")
+    monkeypatch.setenv("PROMPTHEUS_SEMANTIC_CACHE_THRESHOLD", "0.5")
+    loose = get_provider("openai", config, "gpt-4o-mini")
+
+    assert strict.semantic_cache is loose.semantic_cache is sentinel
+    assert (strict.semantic_cache_threshold, loose.semantic_cache_threshold) == (0.9, 0.5)
+
+
 # ========================
 # OpenAI-Compatible Provider Utility Tests
 # ========================
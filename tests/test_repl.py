@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 import pytest
 from argparse import Namespace
+from rich.table import Table
 
 from promptheus.io_context import IOContext
 from promptheus.repl import (
@@ -123,13 +124,37 @@ def test_display_history_with_entries(mock_get_history, mock_console, mock_notif
 
     display_history(mock_console, mock_notify, limit=20)
 
-    # Should call console.print for table and spacing
-    assert mock_console.print.call_count >= 3
+    # The table and its surrounding blank lines go out in one print
+    mock_console.print.assert_called_once()
+    (group,), _ = mock_console.print.call_args
+    assert isinstance(group.renderables[1], Table)
 
     # Should call notify with usage hint
     mock_notify.assert_any_call("[dim]Use '/load <number>' to load a prompt from history[/dim]")
 
 
+@patch('promptheus.repl.history_view.get_history')
+def test_display_history_pages_long_listings(mock_get_history, mock_notify, sample_history_entries):
+    """Listings longer than PAGER_THRESHOLD go through the pager on a terminal."""
+    from promptheus.repl.history_view import PAGER_THRESHOLD
+
+    mock_history = Mock()
+    mock_history.get_recent.return_value = (sample_history_entries * PAGER_THRESHOLD)[:PAGER_THRESHOLD + 1]
+    mock_get_history.return_value = mock_history
+    console = MagicMock()
+    console.is_terminal = True
+
+    display_history(console, mock_notify, limit=50)
+
+    console.pager.assert_called_once_with(styles=True)
+    console.print.assert_called_once()
+
+    console = MagicMock()
+    console.is_terminal = False
+    display_history(console, mock_notify, limit=50)
+    console.pager.assert_not_called()
+
+
 @patch('promptheus.repl.history_view.get_history')
 @patch('builtins.input')
 def test_interactive_mode_plain_mode_exit(mock_input, mock_get_history,
@@ -189,7 +214,7 @@ def test_interactive_mode_history_command(mock_input, mock_get_history,
 
     args = Namespace()
 
-    with patch('promptheus.repl.session.display_history') as mock_display:
+    with patch('promptheus.repl.history_view.display_history') as mock_display:
         interactive_mode(mock_provider, mock_config, args, False, True, create_mock_io(mock_notify, mock_console), Mock()  # process_prompt function
         )
 
@@ -301,7 +326,7 @@ def test_interactive_mode_process_prompt_cancelled(mock_input, mock_get_history,
 
     interactive_mode(mock_provider, mock_config, args, False, True, create_mock_io(mock_notify, mock_console), mock_process_prompt)
 
-    mock_console.print.assert_any_call("\n[yellow]Analysis cancelled[/yellow]")
+    mock_console.print.assert_any_call("\n[yellow]Analysis cancelled[/yellow]\n")
     mock_process_prompt.assert_called_once()
 
 
@@ -322,7 +347,7 @@ def test_interactive_mode_keyboard_interrupt_during_processing(mock_input, mock_
     interactive_mode(mock_provider, mock_config, args, False, True, create_mock_io(mock_notify, mock_console), mock_process_prompt)
 
     # Should show cancelled message and continue to next prompt
-    mock_console.print.assert_any_call("\n[yellow]Cancelled[/yellow]")
+    mock_console.print.assert_any_call("\n[yellow]Cancelled[/yellow]\n")
     # Should exit gracefully
     mock_console.print.assert_any_call("[bold yellow]Goodbye![/bold yellow]")
 
@@ -348,6 +373,37 @@ def test_interactive_mode_empty_input(mock_input, mock_get_history,
     mock_console.print.assert_any_call("[bold yellow]Goodbye![/bold yellow]")
 
 
+@patch('builtins.input')
+def test_interactive_mode_exit_words_are_case_insensitive(mock_input, mock_provider, mock_config,
+                                                          mock_notify, mock_console):
+    """Exit words match in any case; longer input is treated as a prompt."""
+    mock_input.side_effect = ["exit now please", "QUIT"]
+    process_prompt = Mock(return_value=None)
+
+    interactive_mode(mock_provider, mock_config, Namespace(), False, True,
+                     create_mock_io(mock_notify, mock_console), process_prompt)
+
+    assert [c.args[1] for c in process_prompt.call_args_list] == ["exit now please"]
+    mock_console.print.assert_any_call("[bold yellow]Goodbye![/bold yellow]")
+
+
+@patch('promptheus.repl.session.reload_provider_instance')
+@patch('builtins.input')
+def test_interactive_mode_reads_model_only_on_provider_reload(mock_input, mock_reload,
+                                                              mock_provider, mock_config, mock_notify, mock_console):
+    """The toolbar's model lookup happens once up front and again only after /set."""
+    mock_input.side_effect = ["", "", "/set model other", "", "exit"]
+    mock_reload.return_value = None
+    mock_config.get_configured_providers.return_value = []
+
+    interactive_mode(mock_provider, mock_config, Namespace(), False, True,
+                     create_mock_io(mock_notify, mock_console), Mock())
+
+    mock_config.set_model.assert_called_once_with("other")
+    # Header, loop setup, and the /set reload
+    assert mock_config.get_model.call_count == 3
+
+
 @patch('promptheus.repl.history_view.get_history')
 @patch('builtins.input')
 def test_interactive_mode_keyboard_interrupt(mock_input, mock_get_history,
@@ -413,6 +469,21 @@ def test_handle_repl_command_status(mock_config, mock_console, mock_notify):
     assert mock_console.print.call_count > 0
 
 
+def test_show_status_writes_once(mock_config, mock_console):
+    """The status panel is assembled first and written with a single print."""
+    args = Namespace(skip_questions=True, refine=False)
+    mock_config.provider = "openai"
+    mock_config.get_model.return_value = "gpt-4o"
+    mock_config.get_configured_providers.return_value = ["openai", "google"]
+
+    show_status(mock_console, mock_config, args)
+
+    mock_console.print.assert_called_once()
+    output = mock_console.print.call_args[0][0]
+    assert "[bold]Skip questions:[/bold] ON" in output
+    assert output.endswith("openai, google\n")
+
+
 def test_handle_repl_command_toggle_refine(mock_config, mock_console, mock_notify):
     """Test /toggle refine command."""
     args = Namespace(quick=False, refine=False, static=False)
@@ -589,8 +660,9 @@ def test_interactive_mode_status_command(mock_input, mock_get_history,
     interactive_mode(mock_provider, mock_config, args, False, True, create_mock_io(mock_notify, mock_console), Mock()  # process_prompt function
     )
 
-    # Should display status (multiple console.print calls)
-    assert mock_console.print.call_count > 5
+    # Should display the status panel
+    printed = [str(call.args[0]) for call in mock_console.print.call_args_list if call.args]
+    assert any("Current Session Settings:" in text and "google, anthropic" in text for text in printed)
 
 
 @patch('promptheus.repl.history_view.get_history')
@@ -629,3 +701,271 @@ def test_interactive_mode_ctrl_c_then_invalid_command(mock_input, mock_get_histo
 
     assert cancelled_count == 2, f"Expected 2 cancelled messages, got {cancelled_count}"
     assert goodbye_count == 1, f"Expected 1 goodbye message, got {goodbye_count}"
+
+
+def _completion_texts(completer, text):
+    from prompt_toolkit.document import Document
+
+    return [c.text for c in completer.get_completions(Document(text), None)]
+
+
+def test_command_completer_prefix_matches():
+    """Slash command completion returns every command sharing the prefix, in order."""
+    from promptheus.repl.completer import CommandCompleter
+
+    completer = CommandCompleter()
+
+    assert _completion_texts(completer, "/c") == ["clear-history", "copy"]
+    assert _completion_texts(completer, "/h") == ["help", "history"]
+    assert _completion_texts(completer, "/zzz") == []
+    assert len(_completion_texts(completer, "/")) == len(completer.commands)
+
+
+def test_command_completer_caches_recent_history(monkeypatch, sample_history_entries):
+    """/load completions reuse recent history between keystrokes until the TTL lapses."""
+    from promptheus.repl import completer as completer_module
+
+    mock_history = Mock()
+    mock_history.get_recent_previews.return_value = [
+        (str(i), entry.original_prompt) for i, entry in enumerate(sample_history_entries, 1)
+    ]
+    monkeypatch.setattr(completer_module, "get_history", lambda: mock_history)
+    now = [100.0]
+    monkeypatch.setattr(completer_module.time, "monotonic", lambda: now[0])
+
+    completer = completer_module.CommandCompleter()
+    first = _completion_texts(completer, "/load ")
+    _completion_texts(completer, "/load 1")
+
+    assert first == [str(i) for i in range(1, len(sample_history_entries) + 1)]
+    assert mock_history.get_recent_previews.call_count == 1
+
+    now[0] += completer_module.CommandCompleter.RECENT_HISTORY_TTL
+    _completion_texts(completer, "/load ")
+    assert mock_history.get_recent_previews.call_count == 2
+
+    # Saving or clearing history drops the cache before the TTL lapses
+    completer.invalidate_history()
+    _completion_texts(completer, "/load ")
+    assert mock_history.get_recent_previews.call_count == 3
+
+
+def test_command_completer_skips_history_for_non_numeric_load(monkeypatch):
+    """Non-digit /load input yields nothing without touching history."""
+    from promptheus.repl import completer as completer_module
+
+    mock_history = Mock()
+    monkeypatch.setattr(completer_module, "get_history", lambda: mock_history)
+
+    completer = completer_module.CommandCompleter()
+    assert _completion_texts(completer, "/load abc") == []
+    assert _completion_texts(completer, "/load 1x") == []
+    mock_history.get_recent_previews.assert_not_called()
+
+
+def test_command_completer_caches_configured_providers():
+    """/set provider completions read the session config once per TTL window."""
+    from promptheus.repl.completer import CommandCompleter
+
+    app_config = Mock()
+    app_config.get_configured_providers.return_value = ["google", "groq", "openai"]
+    completer = CommandCompleter(app_config)
+
+    assert _completion_texts(completer, "/set provider ") == ["google", "groq", "openai"]
+    assert _completion_texts(completer, "/set provider g") == ["google", "groq"]
+    app_config.get_configured_providers.assert_called_once()
+
+    completer.invalidate_providers()
+    _completion_texts(completer, "/set provider ")
+    assert app_config.get_configured_providers.call_count == 2
+
+
+def test_command_completer_reuses_provider_completion_objects():
+    """Repeated /set provider prefixes yield the same Completion objects until providers change."""
+    from prompt_toolkit.document import Document
+    from promptheus.repl.completer import CommandCompleter
+
+    app_config = Mock()
+    app_config.get_configured_providers.return_value = ["google", "groq"]
+    completer = CommandCompleter(app_config)
+
+    def completions(text):
+        return list(completer.get_completions(Document(text), None))
+
+    first = completions("/set provider g")
+    assert [c.start_position for c in first] == [-1, -1]
+    assert all(a is b for a, b in zip(first, completions("/set provider g")))
+
+    app_config.get_configured_providers.return_value = ["google"]
+    completer.invalidate_providers()
+    assert [c.text for c in completions("/set provider g")] == ["google"]
+
+
+def test_toolbars_are_built_once_per_provider_and_model():
+    """Toolbar renderables are reused until the provider or model changes."""
+    from promptheus.repl.session import create_bottom_toolbar
+
+    assert create_bottom_toolbar("openai", "gpt-4o") is create_bottom_toolbar("openai", "gpt-4o")
+    assert create_bottom_toolbar("openai", "gpt-4o-mini") is not create_bottom_toolbar("openai", "gpt-4o")
+    assert format_toolbar_text("openai", "gpt-4o") is format_toolbar_text("openai", "gpt-4o")
+    assert format_toolbar_text("openai", "gpt-4o").plain.startswith("openai | gpt-4o")
+
+
+def test_transient_toolbar_is_built_once_per_message():
+    """The Ctrl+C hint toolbars are styled once and reused."""
+    from promptheus.repl.session import transient_toolbar
+
+    text, html = transient_toolbar("Press Ctrl+C again to exit.")
+    assert transient_toolbar("Press Ctrl+C again to exit.")[1] is html
+    assert text.plain == "Press Ctrl+C again to exit."
+    assert str(text.spans[0].style) == "bold yellow"
+
+
+@pytest.mark.parametrize(
+    "data, newline",
+    [
+        ("\r", False),
+        ("\x1b[27;2;13~", True),
+        ("\x1b[13;2~", True),
+        ("\x1b[13;2u", True),
+        ("13;2u", False),
+    ],
+)
+def test_enter_binding_detects_shift_enter(data, newline):
+    """Enter submits unless the key data is a Shift+Enter escape sequence."""
+    from promptheus.repl.session import create_key_bindings
+
+    bindings = create_key_bindings()
+    handler = next(b.handler for b in bindings.bindings if [k.value for k in b.keys] == ["c-m"])
+    event = Mock()
+    event.key_sequence = [Mock(data=data)]
+
+    handler(event)
+
+    assert event.current_buffer.insert_text.called is newline
+    assert event.current_buffer.validate_and_handle.called is not newline
+
+
+def test_repl_import_defers_rich_markdown():
+    """Importing the REPL does not load rich.markdown until a result is rendered."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, promptheus.repl.session as s; "
+        "print('rich.markdown' in sys.modules); s._render_markdown('# x'); "
+        "print('rich.markdown' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=60)
+    assert result.stdout.split() == ["False", "True"], result.stderr
+
+
+def test_render_markdown_reuses_parsed_renderable():
+    """Re-displaying the same prompt reuses the parsed Markdown and renders identically."""
+    from io import StringIO
+    from rich.console import Console
+    from promptheus.repl.session import _render_markdown
+
+    text = "# Title\n\n- one\n- two"
+    renderable = _render_markdown(text)
+    assert _render_markdown(text) is renderable
+
+    outputs = []
+    for _ in range(2):
+        buffer = StringIO()
+        Console(file=buffer, width=60, color_system=None).print(renderable)
+        outputs.append(buffer.getvalue())
+    assert outputs[0] == outputs[1]
+    assert "Title" in outputs[0]
+
+
+def test_command_registry_dispatches_exit_and_copy(mock_config, mock_notify, mock_console):
+    """Registry handlers share one signature and report their outcome."""
+    from promptheus.repl import create_command_registry
+
+    registry = create_command_registry()
+    args = Namespace()
+
+    assert registry["quit"] is registry["exit"]
+    assert registry["exit"]([], mock_config, args, mock_console, mock_notify) == "exit"
+    mock_console.print.assert_any_call("[bold yellow]Goodbye![/bold yellow]")
+
+    assert registry["copy"]([], mock_config, args, mock_console, mock_notify) == "handled"
+    mock_console.print.assert_any_call("[yellow]No result to copy yet. Process a prompt first.[/yellow]")
+    assert "unknown" not in registry
+
+
+def test_history_preview_truncates_and_flattens():
+    """History rows show one line of at most 60 characters plus an ellipsis."""
+    from promptheus.repl.history_view import _preview
+
+    assert _preview("line one\nline two\r\n") == "line one line two  "
+    long_text = "x" * 59 + "\n" + "y" * 40
+    assert _preview(long_text) == "x" * 59 + " ..."
+    assert _preview("a" * 60) == "a" * 60
+
+
+def test_history_timestamps_are_formatted_once():
+    """Row timestamps are parsed once per distinct value, with a raw-slice fallback."""
+    from promptheus.repl.history_view import _format_timestamp
+
+    _format_timestamp.cache_clear()
+    assert _format_timestamp("2024-03-05T14:07:09.123456") == "03-05 14:07"
+    assert _format_timestamp("2024-03-05T14:07:09.123456") == "03-05 14:07"
+    assert _format_timestamp.cache_info().hits == 1
+    assert _format_timestamp("2024-03-05 not a date") == "03-05 not a"
+
+
+def test_show_help_prints_prebuilt_renderable_once():
+    """Help output is built once at import and written with a single print."""
+    from io import StringIO
+    from rich.console import Console
+    from promptheus.repl.commands import HELP_RENDERABLE, show_help
+
+    console = Mock()
+    show_help(console)
+    console.print.assert_called_once_with(HELP_RENDERABLE)
+
+    buffer = StringIO()
+    show_help(Console(file=buffer, width=100))
+    output = buffer.getvalue()
+    assert "/load <number>" in output
+    assert output.startswith("\n") and output.endswith("\n\n")
+
+
+def test_question_prefetcher_debounces_drafts():
+    """Only the draft left after a typing pause is prefetched, once."""
+    import threading
+    from promptheus.repl.prefetch import QuestionPrefetcher
+
+    requested = []
+    done = threading.Event()
+
+    def generate_questions(prompt, system_instruction):
+        requested.append(prompt)
+        done.set()
+        return None
+
+    provider = Mock()
+    provider.generate_questions.side_effect = generate_questions
+    prefetcher = QuestionPrefetcher(lambda: provider, delay=0.05, min_chars=5)
+    try:
+        prefetcher.on_text_changed("/hist")
+        prefetcher.on_text_changed("Write a")
+        prefetcher.on_text_changed("Write a poem  ")
+        assert done.wait(timeout=5)
+        prefetcher._prefetch("Write a poem")
+    finally:
+        prefetcher.close()
+
+    assert requested == ["Write a poem"]
+
+
+def test_prompt_history_is_shared_per_path(tmp_path):
+    """A restarted REPL reuses the FileHistory (and its loaded lines) for the same file."""
+    from promptheus.repl.session import _prompt_history
+
+    path = str(tmp_path / "prompt_history")
+    assert _prompt_history(path) is _prompt_history(path)
+    assert _prompt_history(path) is not _prompt_history(str(tmp_path / "other"))
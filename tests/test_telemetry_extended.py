@@ -16,6 +16,7 @@ from promptheus.telemetry import (
     record_clarifying_questions_summary,
     record_provider_error,
     record_prompt_event,  # backward compatibility
+    flush_telemetry,
     _get_sample_rate,
     _should_sample,
     TELEMETRY_SAMPLE_RATE_ENV,
@@ -32,8 +33,7 @@ class TestTelemetryExtended:
         
         # Reset telemetry module caches
         import promptheus.telemetry as telemetry_module
-        telemetry_module._cached_enabled = None
-        telemetry_module._cached_sample_rate = None
+        telemetry_module.reset_telemetry_cache()
         
         # Mock environment variables
         self.env_patcher = patch.dict(os.environ, {
@@ -47,14 +47,15 @@ class TestTelemetryExtended:
         self.env_patcher.stop()
         # Reset telemetry module caches
         import promptheus.telemetry as telemetry_module
-        telemetry_module._cached_enabled = None
-        telemetry_module._cached_sample_rate = None
+        telemetry_module.flush_telemetry()
+        telemetry_module.reset_telemetry_cache()
         # Clean up temp directory
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def read_telemetry_events(self):
         """Helper to read and parse telemetry events from file."""
+        flush_telemetry()
         if not self.telemetry_file.exists():
             return []
         
@@ -235,45 +236,45 @@ class TestTelemetryExtended:
         with patch.dict(os.environ, {}, clear=True):
             # Force reset of cached sample rate
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
+            telemetry_module.reset_telemetry_cache()
             assert _get_sample_rate() == 1.0
 
         # Test valid values
         with patch.dict(os.environ, {TELEMETRY_SAMPLE_RATE_ENV: "0.5"}):
             # Force reset of cached sample rate
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
+            telemetry_module.reset_telemetry_cache()
             assert _get_sample_rate() == 0.5
 
         with patch.dict(os.environ, {TELEMETRY_SAMPLE_RATE_ENV: "1.0"}):
             # Force reset of cached sample rate
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
+            telemetry_module.reset_telemetry_cache()
             assert _get_sample_rate() == 1.0
 
         # Test invalid values
         with patch.dict(os.environ, {TELEMETRY_SAMPLE_RATE_ENV: "invalid"}):
             # Force reset of cached sample rate
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
+            telemetry_module.reset_telemetry_cache()
             assert _get_sample_rate() == 1.0
 
         with patch.dict(os.environ, {TELEMETRY_SAMPLE_RATE_ENV: "2.0"}):  # > 1.0
             # Force reset of cached sample rate
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
+            telemetry_module.reset_telemetry_cache()
             assert _get_sample_rate() == 1.0
 
         with patch.dict(os.environ, {TELEMETRY_SAMPLE_RATE_ENV: "0"}):  # == 0 (valid - no sampling)
             # Force reset of cached sample rate
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
+            telemetry_module.reset_telemetry_cache()
             assert _get_sample_rate() == 0.0  # 0.0 is now valid (no sampling)
 
         with patch.dict(os.environ, {TELEMETRY_SAMPLE_RATE_ENV: "-0.1"}):  # < 0 (invalid)
             # Force reset of cached sample rate
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
+            telemetry_module.reset_telemetry_cache()
             assert _get_sample_rate() == 1.0  # Invalid negative value
 
     def test_sampling_behavior(self):
@@ -287,13 +288,11 @@ class TestTelemetryExtended:
         try:
             # Force reset of cached sample rate and telemetry enabled
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
-            telemetry_module._cached_enabled = None
+            telemetry_module.reset_telemetry_cache()
             
             # Debug: check the actual sample rate and environment
             from promptheus.telemetry import _get_sample_rate, TELEMETRY_SAMPLE_RATE_ENV
             print(f"Environment variable {TELEMETRY_SAMPLE_RATE_ENV}: {os.environ.get(TELEMETRY_SAMPLE_RATE_ENV)}")
-            print(f"Cached sample rate before reset: {telemetry_module._cached_sample_rate}")
             sample_rate = _get_sample_rate()
             print(f"Sample rate after reset: {sample_rate}")
             assert sample_rate == 0.0, f"Expected 0.0, got {sample_rate}"
@@ -326,8 +325,7 @@ class TestTelemetryExtended:
         with patch.dict(os.environ, {TELEMETRY_SAMPLE_RATE_ENV: "1.0"}):
             # Force reset of cached sample rate and telemetry enabled
             import promptheus.telemetry as telemetry_module
-            telemetry_module._cached_sample_rate = None
-            telemetry_module._cached_enabled = None
+            telemetry_module.reset_telemetry_cache()
             
             with patch('random.random', return_value=0.5):
                 record_prompt_run_event(
@@ -347,15 +345,50 @@ class TestTelemetryExtended:
             events = self.read_telemetry_events()
             assert len(events) == 1  # Should be recorded
 
+    def test_telemetry_path_resolved_once_and_directory_created_once(self):
+        """The telemetry path is cached and its directory is only created once."""
+        import promptheus.telemetry as telemetry_module
+
+        nested = Path(self.temp_dir) / "nested" / "telemetry.jsonl"
+        alternate = Path(self.temp_dir) / "alternate.jsonl"
+        with patch.dict(os.environ, {"PROMPTHEUS_TELEMETRY_FILE": str(nested)}):
+            assert telemetry_module._get_telemetry_path() == nested
+            with patch.dict(os.environ, {"PROMPTHEUS_TELEMETRY_FILE": str(alternate)}):
+                assert telemetry_module._get_telemetry_path() == nested
+
+            with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mkdir:
+                telemetry_module._append_lines([(nested, b"{}")])
+                telemetry_module._append_lines([(nested, b"{}")])
+            assert mkdir.call_count == 1
+            assert nested.read_text().splitlines() == ["{}", "{}"]
+
+    def test_reset_telemetry_cache_rereads_environment(self):
+        """Cached telemetry settings refresh only after reset_telemetry_cache."""
+        import promptheus.telemetry as telemetry_module
+
+        assert telemetry_module._telemetry_enabled() is True
+        with patch.dict(os.environ, {"PROMPTHEUS_TELEMETRY_ENABLED": "0", TELEMETRY_SAMPLE_RATE_ENV: "0.25"}):
+            assert telemetry_module._telemetry_enabled() is True
+            telemetry_module.reset_telemetry_cache()
+            assert telemetry_module._telemetry_enabled() is False
+            assert _get_sample_rate() == 0.25
+
+        alternate = self.telemetry_file.with_name("alternate.jsonl")
+        assert telemetry_module._get_telemetry_path() == self.telemetry_file
+        with patch.dict(os.environ, {"PROMPTHEUS_TELEMETRY_FILE": str(alternate)}):
+            assert telemetry_module._get_telemetry_path() == self.telemetry_file
+            telemetry_module.reset_telemetry_cache()
+            assert telemetry_module._get_telemetry_path() == alternate
+
     def test_telemetry_disabled(self):
         """Test that telemetry is not recorded when disabled."""
         # Force reset of cached telemetry enabled
         import promptheus.telemetry as telemetry_module
-        telemetry_module._cached_enabled = None
+        telemetry_module.reset_telemetry_cache()
         
         with patch.dict(os.environ, {"PROMPTHEUS_TELEMETRY_ENABLED": "0"}):
             # Force reset again inside the context
-            telemetry_module._cached_enabled = None
+            telemetry_module.reset_telemetry_cache()
             
             record_prompt_run_event(
                 source="test",
@@ -490,3 +523,101 @@ class TestTelemetryExtended:
                 assert event["sanitized_error"] == "Connection timeout"
             else:
                 assert event["run_id"] in ["run-1", "run-2"]
+
+    def test_event_to_dict_matches_asdict(self):
+        """to_dict keeps every field, in declaration order."""
+        from dataclasses import asdict
+
+        event = TelemetryEvent(
+            timestamp="2024-01-01T00:00:00",
+            event_type="prompt_run",
+            source="cli",
+            provider="openai",
+            model="gpt-4",
+            task_type="code",
+            processing_latency_sec=1.0,
+            clarifying_questions_count=2,
+            skip_questions=False,
+            refine_mode=True,
+            success=True,
+            input_tokens=10,
+        )
+        assert list(event.to_dict().items()) == list(asdict(event).items())
+
+    def test_events_are_written_in_batches_off_the_caller_thread(self):
+        """The writer thread appends a full batch with one call; callers only enqueue."""
+        import threading
+        import promptheus.telemetry as telemetry_module
+
+        writes = []
+        original_append = telemetry_module._append_lines
+
+        def recording_append(batch):
+            if batch:
+                writes.append((threading.current_thread().name, [line for _, line in batch]))
+            original_append(batch)
+
+        with patch.object(telemetry_module, "TELEMETRY_BATCH_SIZE", 2), \
+                patch.object(telemetry_module, "_append_lines", recording_append):
+            for run_id in ("r1", "r2"):
+                record_provider_error(
+                    provider="openai", model=None, session_id="s", run_id=run_id, error_message="boom",
+                )
+            flush_telemetry()
+
+        assert len(writes) == 1
+        thread_name, lines = writes[0]
+        assert thread_name == "promptheus-telemetry"
+        assert [json.loads(line)["run_id"] for line in lines] == ["r1", "r2"]
+        assert [event["run_id"] for event in self.read_telemetry_events()] == ["r1", "r2"]
+
+    def test_events_are_appended_as_utf8_json_lines(self):
+        """Binary appends keep one UTF-8 JSON object per line."""
+        record_provider_error(
+            provider="openai", model=None, session_id="s", run_id="r1", error_message="délai dépassé",
+        )
+        record_provider_error(
+            provider="openai", model=None, session_id="s", run_id="r2", error_message="timeout",
+        )
+
+        events = self.read_telemetry_events()
+        assert [event["sanitized_error"] for event in events] == ["délai dépassé", "timeout"]
+        assert self.telemetry_file.read_bytes().endswith(b"}\n")
+
+    def test_writer_keeps_descriptor_open_and_reopens_removed_file(self):
+        """Batches reuse one append descriptor until the file is removed."""
+        import promptheus.telemetry as telemetry_module
+
+        with patch("promptheus.telemetry.os.open", wraps=os.open) as os_open:
+            record_provider_error(provider="openai", model=None, session_id="s", run_id="r1", error_message="a")
+            flush_telemetry()
+            record_provider_error(provider="openai", model=None, session_id="s", run_id="r2", error_message="b")
+            flush_telemetry()
+            assert os_open.call_count == 1
+
+            self.telemetry_file.unlink()
+            record_provider_error(provider="openai", model=None, session_id="s", run_id="r3", error_message="c")
+            flush_telemetry()
+            assert os_open.call_count == 2
+
+        assert [event["run_id"] for event in self.read_telemetry_events()] == ["r3"]
+        assert telemetry_module._open_file[0] == self.telemetry_file
+
+    def test_telemetry_file_rotates_past_size_limit(self):
+        """A full telemetry file is shifted to .1, keeping TELEMETRY_BACKUP_COUNT rotations."""
+        import promptheus.telemetry as telemetry_module
+
+        with patch.dict(os.environ, {telemetry_module.TELEMETRY_MAX_BYTES_ENV: "1"}), \
+                patch.object(telemetry_module, "TELEMETRY_BACKUP_COUNT", 2):
+            telemetry_module.reset_telemetry_cache()
+            for run_id in ("r1", "r2", "r3", "r4"):
+                record_provider_error(provider="openai", model=None, session_id="s", run_id=run_id, error_message="x")
+                flush_telemetry()
+
+        def run_ids(path):
+            return [json.loads(line)["run_id"] for line in path.read_text().splitlines()]
+
+        assert run_ids(self.telemetry_file) == ["r4"]
+        assert run_ids(self.telemetry_file.with_name("telemetry.jsonl.1")) == ["r3"]
+        assert run_ids(self.telemetry_file.with_name("telemetry.jsonl.2")) == ["r2"]
+        assert not self.telemetry_file.with_name("telemetry.jsonl.3").exists()
@@ -1,7 +1,16 @@
 """Essential tests for utility functions."""
 
+from unittest.mock import Mock
+
 import pytest
-from promptheus.utils import sanitize_error_message, collapse_whitespace
+from promptheus import utils
+from promptheus.utils import (
+    sanitize_error_message,
+    collapse_whitespace,
+    json_dumps_bytes,
+    json_loads,
+    get_user_email,
+)
 
 
 def test_sanitize_error_message_basic():
@@ -142,4 +151,34 @@ def test_collapse_whitespace_with_newlines():
     result = collapse_whitespace(lines)
     # The function joins lines with \n, so the embedded \n becomes part of the content
     assert "\nsubline" in result
-    assert "line2" in result
\ No newline at end of file
+    assert "line2" in result
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_round_trip(monkeypatch, use_orjson):
+    """JSON helpers should round-trip with or without orjson installed."""
+    if use_orjson and utils.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    payload = {"cache": {"openai": {"models": ["gpt-4o"]}}, "timestamp": 1.5, "name": "café"}
+    encoded = json_dumps_bytes(payload)
+
+    assert isinstance(encoded, bytes)
+    assert b"\n" not in encoded
+    assert json_loads(encoded) == payload
+
+
+def test_get_user_email_header_lookup_ignores_case():
+    """Starlette headers match the Cloudflare email header regardless of case."""
+    from starlette.datastructures import Headers
+
+    request = Mock()
+    request.headers = Headers({"cf-access-authenticated-user-email": "user@example.com"})
+    assert get_user_email(request) == "user@example.com"
+
+    request.headers = Headers({"CF-ACCESS-SUBJECT": "subject@example.com"})
+    assert get_user_email(request) == "subject@example.com"
+
+    request.headers = Headers({"cf-access-subject": "github:1234"})
+    assert get_user_email(request) == "unknown"